@@ -3,6 +3,8 @@ import os
 
 import dash
 import dash_bootstrap_components as dbc
+import pandas as pd
+import plotly.io as pio
 
 from app_elements import AppMain
 from app_utils.simple_logger import get_logger
@@ -13,6 +15,14 @@ warnings.filterwarnings(
     "ignore", category=FutureWarning, message=".*Downcasting object dtype arrays.*"
 )
 
+# Serialize figures with orjson, which encodes large numeric arrays much faster
+pio.json.config.default_engine = "orjson"
+
+# Table helpers hand out shallow copies and rely on Copy-on-Write to keep them
+# isolated; it is always on from pandas 3.0 and opt-in on 2.x
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 # Initialize logger for app startup
 logger = get_logger("startup")
 
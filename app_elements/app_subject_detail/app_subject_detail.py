@@ -83,7 +83,10 @@ class AppSubjectDetail:
                                                     ],
                                                     className="heatmap-header-row d-flex justify-content-between align-items-center mb-2",
                                                 ),
+                                                # Seed with the empty heatmap so the
+                                                # highlight patch callback has a graph target
                                                 html.Div(
+                                                    self.percentile_heatmap.build(),
                                                     id="percentile-heatmap-container",
                                                     className="heatmap-container",
                                                 ),
@@ -5,26 +5,135 @@ This module creates interactive heatmap visualizations showing percentile data
 across sessions with strata transitions and outlier highlighting.
 """
 
+import hashlib
+import logging
+import math
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
 import plotly.graph_objects as go
-from dash import dcc
+from dash import Patch, dcc
 
+from app_utils.app_analysis.statistical_utils import StatisticalUtils
+from app_utils.percentile_utils import calculate_heatmap_colorscale
 from app_utils.simple_logger import get_logger
 from app_utils.strata_utils import get_strata_abbreviation
 
 logger = get_logger("subject_percentile_heatmap")
 
+# Maximum number of rendered heatmap figures kept in memory
+FIGURE_CACHE_SIZE = 128
+
+# Optional directory for a figure cache shared across server worker processes
+PLOT_CACHE_DIR = os.getenv("PLOT_CACHE_DIR")
+
+# Session count above which adjacent outlier columns are merged into runs
+MAX_DENSE_SESSIONS = 400
+
+# Index of the session highlight rectangle in the figure's layout shapes
+HIGHLIGHT_SHAPE_SLOT = 0
+
+# Maximum number of session tick labels drawn along the x axis
+MAX_SESSION_TICKS = 60
+
+
+# Rendered base figure dicts keyed by content hash, most recently used last.
+# Shared by every heatmap instance in the process.
+_FIGURE_CACHE = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_figure_store():
+    """
+    Get the on-disk figure store shared across worker processes, if configured
+
+    Enabled by setting PLOT_CACHE_DIR; requires the optional diskcache package.
+
+    Returns:
+        diskcache.Cache or None: Shared store, or None when disabled/unavailable
+    """
+    if not PLOT_CACHE_DIR:
+        return None
+
+    try:
+        import diskcache
+
+        return diskcache.Cache(PLOT_CACHE_DIR)
+    except ImportError:
+        logger.warning("diskcache not available; using in-process figure cache only")
+    except Exception as e:
+        logger.error("Failed to open shared figure cache: %s", e)
+
+    return None
+
+
+def _create_heatmap_graph(figure):
+    """Wrap a figure (or figure dict) in the heatmap Graph component"""
+    return dcc.Graph(
+        id="percentile-heatmap",
+        figure=figure,
+        config={"displayModeBar": False, "staticPlot": False, "responsive": True},
+        style={"height": "300px", "width": "100%"},
+    )
+
+
+@lru_cache(maxsize=8)
+def _create_empty_heatmap_graph(message):
+    """
+    Create empty heatmap Graph with message
+
+    Only a handful of distinct messages exist, so the Graph is built once per
+    message and reused; callers must not mutate the returned component.
+    """
+    fig = go.Figure()
+    fig.add_annotation(
+        text=message,
+        xref="paper",
+        yref="paper",
+        x=0.5,
+        y=0.5,
+        showarrow=False,
+        font=dict(size=14, color="#666666"),
+    )
+    fig.update_layout(
+        margin=dict(l=10, r=10, t=10, b=10),
+        height=300,
+        plot_bgcolor="white",
+        xaxis=dict(showgrid=False, showticklabels=False),
+        yaxis=dict(showgrid=False, showticklabels=False),
+    )
+
+    return _create_heatmap_graph(fig)
+
 
 class AppSubjectPercentileHeatmap:
-    def __init__(self):
-
-        # Features configuration
-        self.features_config = {
-            "finished_trials": False,  # Higher is better
-            "ignore_rate": True,  # Lower is better
-            "total_trials": False,  # Higher is better
-            "foraging_performance": False,  # Higher is better
-            "abs(bias_naive)": True,  # Lower is better
-        }
+    # Features configuration as immutable (feature, lower_is_better) pairs
+    FEATURES_CONFIG = (
+        ("finished_trials", False),  # Higher is better
+        ("ignore_rate", True),  # Lower is better
+        ("total_trials", False),  # Higher is better
+        ("foraging_performance", False),  # Higher is better
+        ("abs(bias_naive)", True),  # Lower is better
+    )
+
+    # Time series keys that feed heatmap rows (used for figure cache keys)
+    PERCENTILE_KEYS = tuple(
+        f"{feature}_percentiles" for feature, _ in FEATURES_CONFIG
+    ) + ("overall_percentiles",)
+
+    __slots__ = ("use_webgl",)
+
+    def __init__(self, use_webgl=True):
+        """
+        Initialize the heatmap component
+
+        Parameters:
+            use_webgl (bool): Render overlay traces with WebGL (Scattergl); disable
+                for static snapshot exports that need pure SVG output
+        """
+        self.use_webgl = use_webgl
 
     def build(
         self,
@@ -49,7 +158,7 @@ class AppSubjectPercentileHeatmap:
             dcc.Graph: Heatmap showing percentile progression over time
         """
         if highlighted_session:
-            logger.info(f"Highlighting session: {highlighted_session}")
+            logger.info("Highlighting session: %s", highlighted_session)
 
         if not subject_id or not app_utils:
             return self._create_empty_heatmap("No subject selected")
@@ -60,80 +169,159 @@ class AppSubjectPercentileHeatmap:
         if not time_series_data or not time_series_data.get("sessions"):
             return self._create_empty_heatmap("No session data available")
 
+        base_figure = self._get_base_figure(
+            subject_id, time_series_data, colorscale_mode
+        )
+        if base_figure is None:
+            return self._create_empty_heatmap("No valid feature data")
+
+        return _create_heatmap_graph(
+            self._apply_highlight(
+                base_figure, time_series_data["sessions"], highlighted_session
+            )
+        )
+
+    def build_highlight_patch(
+        self,
+        subject_id=None,
+        app_utils=None,
+        highlighted_session=None,
+        colorscale_mode="binned",
+    ):
+        """
+        Build a partial figure update that only moves the session highlight
+
+        The base figure reserves HIGHLIGHT_SHAPE_SLOT for the highlight rectangle,
+        so a highlight change only needs to send that shape's position.
+
+        Parameters:
+            subject_id (str): Subject ID currently displayed in the heatmap
+            app_utils (AppUtils): App utilities instance for accessing cached data
+            highlighted_session (int): Session number to highlight, or None to clear
+            colorscale_mode (str): Either "binned" or "continuous" for colorscale type
+
+        Returns:
+            Patch or None: Figure patch, or None if no subject heatmap is displayed
+        """
+        if not subject_id or not app_utils:
+            return None
+
+        time_series_data = app_utils.get_time_series_data(subject_id, use_cache=True)
+        if not time_series_data or not time_series_data.get("sessions"):
+            return None
+
+        if self._get_base_figure(subject_id, time_series_data, colorscale_mode) is None:
+            return None
+
+        session_idx = self._get_highlight_index(
+            time_series_data["sessions"], highlighted_session
+        )
+
+        patch = Patch()
+        highlight_shape = patch["layout"]["shapes"][HIGHLIGHT_SHAPE_SLOT]
+        if session_idx is None:
+            highlight_shape["visible"] = False
+        else:
+            for key, value in self._highlight_position(session_idx).items():
+                highlight_shape[key] = value
+
+        return patch
+
+    def _get_base_figure(self, subject_id, time_series_data, colorscale_mode):
+        """
+        Get the un-highlighted heatmap figure dict for a subject, building it on a cache miss
+
+        Parameters:
+            subject_id (str): Subject ID to build heatmap for
+            time_series_data (dict): Time series data for the subject
+            colorscale_mode (str): Either "binned" or "continuous" for colorscale type
+
+        Returns:
+            dict or None: Figure dict, or None if there is no valid feature data
+        """
+        # Reuse a previously rendered figure when the inputs are unchanged
+        cache_key = self._figure_cache_key(
+            subject_id, time_series_data, colorscale_mode
+        )
+        found, figure_dict = self._lookup_figure(cache_key)
+        if found:
+            return figure_dict
+
         # Extract session data
         sessions = time_series_data["sessions"]
 
-        # Process data using business logic functions
-        from app_utils.app_analysis.statistical_utils import StatisticalUtils
-        from app_utils.percentile_utils import calculate_heatmap_colorscale
-
         # Extract and validate heatmap matrix data
         heatmap_data, feature_names = StatisticalUtils.process_heatmap_matrix_data(
-            time_series_data, self.features_config
+            time_series_data, self.FEATURES_CONFIG
         )
 
-        # Create session labels
-        session_labels = [f"S{s}" for s in sessions]
-        logger.info(f"Displaying all {len(sessions)} sessions in heatmap")
+        # Create session labels in a single vectorized string operation
+        session_labels = np.char.add("S", np.asarray(sessions).astype(str))
+        logger.info("Displaying all %d sessions in heatmap", len(sessions))
 
-        if not heatmap_data or not feature_names:
-            return self._create_empty_heatmap("No valid feature data")
+        if heatmap_data.size == 0 or not feature_names:
+            self._store_figure(cache_key, None)
+            return None
 
         # Get colorscale using business logic
         colorscale = calculate_heatmap_colorscale(colorscale_mode)
 
+        # Heatmap cells sit on integer positions so overlay traces can share the
+        # same coordinate space; labels are supplied via ticks and customdata
+        num_feature_rows = len(feature_names)
+        session_positions = np.arange(len(sessions))
+        hover_labels = np.empty((num_feature_rows, len(sessions), 2), dtype=object)
+        hover_labels[:, :, 0] = np.asarray(feature_names, dtype=object)[:, np.newaxis]
+        hover_labels[:, :, 1] = session_labels
+        tick_step = max(1, math.ceil(len(sessions) / MAX_SESSION_TICKS))
+
         # Create the heatmap visualization
-        fig = go.Figure(
-            data=go.Heatmap(
-                z=heatmap_data,
-                x=session_labels,
-                y=feature_names,
-                colorscale=colorscale,
-                zmin=0,
-                zmax=100,
-                hoverongaps=False,
-                hovertemplate="<b>%{y}</b><br>Session: %{x}<br>Percentile: %{z:.1f}%<extra></extra>",
-                showscale=True,
-                colorbar=dict(
-                    title=dict(text="Percentile", side="right"),
-                    thickness=15,
-                    len=0.7,
-                    x=1.02,
-                ),
-            )
+        heatmap_trace = go.Heatmap(
+            z=heatmap_data,
+            x=session_positions,
+            y=list(range(num_feature_rows)),
+            customdata=hover_labels,
+            colorscale=colorscale,
+            zmin=0,
+            zmax=100,
+            hoverongaps=False,
+            hovertemplate="<b>%{customdata[0]}</b><br>Session: %{customdata[1]}<br>Percentile: %{z:.1f}%<extra></extra>",
+            showscale=True,
+            colorbar=dict(
+                title=dict(text="Percentile", side="right"),
+                thickness=15,
+                len=0.7,
+                x=1.02,
+            ),
         )
 
-        # Add highlighting for selected session
-        if highlighted_session is not None and highlighted_session in sessions:
-            session_idx = StatisticalUtils.calculate_session_highlighting_coordinates(
-                sessions, highlighted_session
-            )
-
-            if session_idx is not None:
-                fig.add_shape(
-                    type="rect",
-                    x0=session_idx - 0.4,
-                    x1=session_idx + 0.4,
-                    y0=-0.5,
-                    y1=len(feature_names) - 0.5,
-                    line=dict(
-                        color="#4A90E2",
-                        width=3,
-                    ),
-                    fillcolor="rgba(74, 144, 226, 0.1)",
-                    layer="above",
-                )
-
-        # Add strata boundaries
-        self._add_strata_boundaries(
-            fig, sessions, time_series_data.get("strata", []), len(feature_names)
+        # Reserve the highlight rectangle slot; it stays hidden until a session
+        # is highlighted so highlight changes can be sent as a Patch
+        shapes = [
+            {
+                "type": "rect",
+                "x0": -0.4,
+                "x1": 0.4,
+                "y0": -0.5,
+                "y1": num_feature_rows - 0.5,
+                "line": {"color": "#4A90E2", "width": 3},
+                "fillcolor": "rgba(74, 144, 226, 0.1)",
+                "layer": "above",
+                "visible": False,
+            }
+        ]
+
+        # Strata boundaries and outlier markers are collected first so the
+        # figure data and layout are each assigned (and validated) once
+        strata_traces, annotations = self._create_strata_boundaries(
+            sessions, time_series_data.get("strata", []), num_feature_rows
         )
-
-        # Add outlier markers to heatmap
-        self._add_outlier_markers(
-            fig, sessions, time_series_data.get("is_outlier", []), len(feature_names)
+        outlier_traces = self._create_outlier_markers(
+            sessions, time_series_data.get("is_outlier", []), num_feature_rows
         )
 
+        fig = go.Figure(data=[heatmap_trace, *strata_traces, *outlier_traces])
+
         fig.update_layout(
             title=None,
             xaxis_title="Session",
@@ -142,181 +330,310 @@ class AppSubjectPercentileHeatmap:
             height=300,
             font=dict(size=9),
             plot_bgcolor="white",
+            # Skip update animations and keep zoom/pan state across highlight
+            # and colorscale re-renders of the same subject only
+            transition=dict(duration=0),
+            uirevision=f"percentile-heatmap-{subject_id}",
+            shapes=shapes,
+            annotations=annotations,
             xaxis=dict(
+                tickmode="array",
+                tickvals=session_positions[::tick_step].tolist(),
+                ticktext=session_labels[::tick_step].tolist(),
                 tickangle=-45,
                 tickfont=dict(size=8),
                 automargin=True,
             ),
-            yaxis=dict(tickfont=dict(size=10), automargin=True),
+            yaxis=dict(
+                tickmode="array",
+                tickvals=list(range(num_feature_rows)),
+                ticktext=feature_names,
+                tickfont=dict(size=10),
+                automargin=True,
+            ),
         )
 
-        return dcc.Graph(
-            id="percentile-heatmap",
-            figure=fig,
-            config={"displayModeBar": False},
-            style={"height": "300px", "width": "100%"},
+        figure_dict = fig.to_dict()
+        self._store_figure(cache_key, figure_dict)
+
+        return figure_dict
+
+    def _lookup_figure(self, cache_key):
+        """
+        Look up a base figure dict in the in-process cache, then the shared store
+
+        Returns:
+            tuple: (found, figure_dict); figure_dict may be None for invalid data
+        """
+        if cache_key in _FIGURE_CACHE:
+            _FIGURE_CACHE.move_to_end(cache_key)
+            return True, _FIGURE_CACHE[cache_key]
+
+        shared_store = _get_shared_figure_store()
+        if shared_store is not None:
+            try:
+                found, figure_dict = shared_store.get(cache_key, (False, None))
+            except Exception as e:
+                logger.error("Shared figure cache read failed: %s", e)
+                return False, None
+            if found:
+                self._remember_figure(cache_key, figure_dict)
+                return True, figure_dict
+
+        return False, None
+
+    def _store_figure(self, cache_key, figure_dict):
+        """Store a base figure dict locally and in the shared store, if any"""
+        self._remember_figure(cache_key, figure_dict)
+
+        shared_store = _get_shared_figure_store()
+        if shared_store is not None:
+            try:
+                shared_store.set(cache_key, (True, figure_dict))
+            except Exception as e:
+                logger.error("Shared figure cache write failed: %s", e)
+
+    def _remember_figure(self, cache_key, figure_dict):
+        """Store a base figure dict in memory, evicting the least recently used entry"""
+        _FIGURE_CACHE[cache_key] = figure_dict
+        if len(_FIGURE_CACHE) > FIGURE_CACHE_SIZE:
+            _FIGURE_CACHE.popitem(last=False)
+
+    def _get_highlight_index(self, sessions, highlighted_session):
+        """Get the column index of the highlighted session, or None"""
+        if highlighted_session is None or highlighted_session not in sessions:
+            return None
+
+        return StatisticalUtils.calculate_session_highlighting_coordinates(
+            sessions, highlighted_session
         )
 
-    def _create_custom_colorscale(self):
-        from app_utils.percentile_utils import calculate_heatmap_colorscale
+    def _highlight_position(self, session_idx):
+        """Highlight rectangle properties for a session column"""
+        return {"x0": session_idx - 0.4, "x1": session_idx + 0.4, "visible": True}
 
-        return calculate_heatmap_colorscale("binned")
+    def _apply_highlight(self, base_figure, sessions, highlighted_session):
+        """
+        Return a figure dict with the highlight slot positioned on a session
 
-    def _create_continuous_colorscale(self):
-        from app_utils.percentile_utils import calculate_heatmap_colorscale
+        The cached base figure is never mutated; only the layout and shapes
+        list containers are copied.
+        """
+        session_idx = self._get_highlight_index(sessions, highlighted_session)
+        if session_idx is None:
+            return base_figure
+
+        shapes = list(base_figure["layout"]["shapes"])
+        shapes[HIGHLIGHT_SHAPE_SLOT] = {
+            **shapes[HIGHLIGHT_SHAPE_SLOT],
+            **self._highlight_position(session_idx),
+        }
 
-        return calculate_heatmap_colorscale("continuous")
+        return {**base_figure, "layout": {**base_figure["layout"], "shapes": shapes}}
 
-    def _create_empty_heatmap(self, message):
-        """Create empty heatmap with message"""
-        fig = go.Figure()
-        fig.add_annotation(
-            text=message,
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=14, color="#666666"),
+    def _figure_cache_key(self, subject_id, time_series_data, colorscale_mode):
+        """
+        Content hash identifying a rendered base figure
+
+        The digest covers every input that shapes the figure and is stable across
+        processes (unlike the built-in hash), so it can key a shared store.
+
+        Parameters:
+            subject_id (str): Subject ID the heatmap is built for
+            time_series_data (dict): Time series data for a single subject
+            colorscale_mode (str): Either "binned" or "continuous"
+
+        Returns:
+            str: Hex digest of the figure inputs
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{subject_id}|{colorscale_mode}|{int(self.use_webgl)}".encode("utf-8")
         )
-        fig.update_layout(
-            margin=dict(l=10, r=10, t=10, b=10),
-            height=300,
-            plot_bgcolor="white",
-            xaxis=dict(showgrid=False, showticklabels=False),
-            yaxis=dict(showgrid=False, showticklabels=False),
+        digest.update(
+            "\x1f".join(map(str, time_series_data.get("strata", []))).encode("utf-8")
         )
+        for key in ("sessions", "is_outlier", *self.PERCENTILE_KEYS):
+            values = np.asarray(time_series_data.get(key, []), dtype=np.float64)
+            digest.update(key.encode("utf-8"))
+            digest.update(values.tobytes())
 
-        return dcc.Graph(
-            id="percentile-heatmap",
-            figure=fig,
-            config={"displayModeBar": False},
-            style={"height": "300px", "width": "100%"},
-        )
+        return digest.hexdigest()
 
-    def _add_strata_boundaries(self, fig, sessions, strata_data, num_feature_rows):
+    def _create_custom_colorscale(self):
+        return calculate_heatmap_colorscale("binned")
+
+    def _create_continuous_colorscale(self):
+        return calculate_heatmap_colorscale("continuous")
+
+    def _create_empty_heatmap(self, message):
+        """Create empty heatmap with message (cached per message)"""
+        return _create_empty_heatmap_graph(message)
+
+    def _create_strata_boundaries(self, sessions, strata_data, num_feature_rows):
         """
-        Add vertical lines for strata transitions in the heatmap
+        Create vertical lines and labels for strata transitions in the heatmap
 
         Parameters:
-            fig: plotly.graph_objects.Figure - The heatmap figure
             sessions: list - List of session numbers
             strata_data: list - List of strata for each session
             num_feature_rows: int - Number of feature rows in the heatmap
+
+        Returns:
+            tuple: (traces, annotations) - overlay traces and layout annotation dicts
         """
         if not strata_data or len(strata_data) != len(sessions):
             logger.info("No strata data available or length mismatch")
-            return
-
-        # Find transition points
-        transitions = []
-        current_strata = None
-
-        for i, (session, strata) in enumerate(zip(sessions, strata_data)):
-            if current_strata is None:
-                current_strata = strata
-                transitions.append(
-                    {
-                        "session_idx": i,
-                        "session": session,
-                        "strata": strata,
-                        "transition_type": "start",
-                    }
-                )
-            elif strata != current_strata:
-                transitions.append(
-                    {
-                        "session_idx": i,
-                        "session": session,
-                        "strata": strata,
-                        "transition_type": "transition",
-                    }
-                )
-                current_strata = strata
+            return [], []
 
-        logger.info(
-            f"Found {len(transitions)} strata transitions: {[t['session'] for t in transitions]}"
-        )
+        # Find transition points: indices where strata differs from the previous session
+        strata_array = np.asarray(strata_data, dtype=object)
+        transition_indices = np.flatnonzero(strata_array[1:] != strata_array[:-1]) + 1
 
-        # Add vertical lines for transitions
-        for transition in transitions[1:]:
-            session_idx = transition["session_idx"]
-            session = transition["session"]
-            strata = transition["strata"]
-            strata_abbr = self._get_strata_abbreviation(strata)
-
-            fig.add_shape(
-                type="line",
-                x0=session_idx - 0.5,
-                x1=session_idx - 0.5,
-                y0=-0.5,
-                y1=num_feature_rows - 0.5,
-                line=dict(
-                    color="rgba(128, 128, 128, 0.8)",
-                    width=2,
-                    dash="dash",
-                ),
-                layer="above",
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Found %d strata transitions: %s",
+                len(transition_indices) + 1,
+                [sessions[0]] + [sessions[i] for i in transition_indices],
             )
 
-            # Add text annotation for the new strata
-            fig.add_annotation(
-                x=session_idx - 0.5,
-                y=num_feature_rows - 0.2,
-                text=f"→ {strata_abbr}",
-                showarrow=False,
-                font=dict(size=8, color="gray"),
-                textangle=-90,
-                xanchor="center",
-                yanchor="bottom",
+        # Vertical lines for transitions form one dashed trace, separating
+        # line segments with None so Plotly renders them in a single pass
+        line_x = []
+        line_y = []
+        annotations = []
+        for session_idx in transition_indices.tolist():
+            session = sessions[session_idx]
+            strata_abbr = self._get_strata_abbreviation(strata_array[session_idx])
+
+            boundary_x = session_idx - 0.5
+            line_x.extend([boundary_x, boundary_x, None])
+            line_y.extend([-0.5, num_feature_rows - 0.5, None])
+
+            # Text annotation for the new strata
+            annotations.append(
+                {
+                    "x": boundary_x,
+                    "y": num_feature_rows - 0.2,
+                    "text": f"→ {strata_abbr}",
+                    "showarrow": False,
+                    "font": {"size": 8, "color": "gray"},
+                    "textangle": -90,
+                    "xanchor": "center",
+                    "yanchor": "bottom",
+                }
             )
 
             logger.info(
-                f"Added strata boundary at session {session} (index {session_idx}) for strata: {strata_abbr}"
+                "Added strata boundary at session %s (index %d) for strata: %s",
+                session,
+                session_idx,
+                strata_abbr,
             )
 
+        if not line_x:
+            return [], annotations
+
+        strata_trace = self._overlay_trace_class()(
+            x=line_x,
+            y=line_y,
+            mode="lines",
+            line=dict(
+                color="rgba(128, 128, 128, 0.8)",
+                width=2,
+                dash="dash",
+            ),
+            hoverinfo="skip",
+            showlegend=False,
+        )
+
+        return [strata_trace], annotations
+
+    def _overlay_trace_class(self):
+        """Scatter trace type used for overlays (WebGL unless disabled)"""
+        return go.Scattergl if self.use_webgl else go.Scatter
+
     def _get_strata_abbreviation(self, strata):
         """Get abbreviated strata name for display (same as time series)"""
         return get_strata_abbreviation(strata)
 
-    def _add_outlier_markers(self, fig, sessions, outlier_data, num_feature_rows):
+    def _create_outlier_markers(self, sessions, outlier_data, num_feature_rows):
         """
-        Add outlier markers to the heatmap by highlighting outlier session columns
+        Create outlier markers that highlight outlier session columns in the heatmap
 
         Parameters:
-            fig: plotly.graph_objects.Figure - The heatmap figure
             sessions: list - List of session numbers
             outlier_data: list - List of outlier indicators for each session
             num_feature_rows: int - Number of feature rows in the heatmap
+
+        Returns:
+            list: Overlay traces (empty if there are no outlier sessions)
         """
         if not outlier_data or len(outlier_data) != len(sessions):
             logger.info("No outlier data available or length mismatch")
-            return
-
-        outlier_count = 0
-
-        # Add vertical rectangles for outlier sessions
-        for session_idx, (session, is_outlier) in enumerate(
-            zip(sessions, outlier_data)
-        ):
-            if is_outlier:
-                # Add a rectangle with purple border around the entire column for this session
-                fig.add_shape(
-                    type="rect",
-                    x0=session_idx - 0.45,
-                    x1=session_idx + 0.45,
-                    y0=-0.45,
-                    y1=num_feature_rows - 0.55,
-                    line=dict(
-                        color="#9C27B0",
-                        width=2,
-                    ),
-                    fillcolor="rgba(156, 39, 176, 0.1)",
-                    layer="above",
-                )
-                outlier_count += 1
-
-        if outlier_count > 0:
-            logger.info(
-                f"Added outlier markers for {outlier_count} sessions with purple borders"
-            )
+            return []
+
+        # Column indices of outlier sessions from a single vectorized mask
+        outlier_indices = np.flatnonzero(np.asarray(outlier_data, dtype=bool))
+        outlier_count = len(outlier_indices)
+        if outlier_count == 0:
+            return []
+
+        # Dense histories are unreadable at one rectangle per session, so
+        # adjacent outlier sessions are merged into a single rectangle per run
+        if len(sessions) > MAX_DENSE_SESSIONS:
+            run_starts, run_ends = self._get_outlier_runs(outlier_indices)
+        else:
+            run_starts = run_ends = outlier_indices.tolist()
+
+        # Collect one closed rectangle per run, separated by None,
+        # so all outlier borders render as a single filled trace
+        rect_x = []
+        rect_y = []
+        y0 = -0.45
+        y1 = num_feature_rows - 0.55
+
+        for run_start, run_end in zip(run_starts, run_ends):
+            x0 = run_start - 0.45
+            x1 = run_end + 0.45
+            rect_x.extend([x0, x1, x1, x0, x0, None])
+            rect_y.extend([y0, y0, y1, y1, y0, None])
+
+        outlier_trace = self._overlay_trace_class()(
+            x=rect_x,
+            y=rect_y,
+            mode="lines",
+            line=dict(
+                color="#9C27B0",
+                width=2,
+            ),
+            fill="toself",
+            fillcolor="rgba(156, 39, 176, 0.1)",
+            hoverinfo="skip",
+            showlegend=False,
+        )
+        logger.info(
+            "Added outlier markers for %d sessions with purple borders", outlier_count
+        )
+
+        return [outlier_trace]
+
+    def _get_outlier_runs(self, outlier_indices):
+        """
+        Group outlier session indices into runs of consecutive sessions
+
+        Parameters:
+            outlier_indices: np.ndarray - Sorted column indices of outlier sessions
+
+        Returns:
+            tuple: (run_starts, run_ends) lists of first/last index for each run
+        """
+        if len(outlier_indices) == 0:
+            return [], []
+
+        indices = np.asarray(outlier_indices)
+        breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+        run_starts = indices[np.concatenate(([0], breaks))]
+        run_ends = indices[np.concatenate((breaks - 1, [len(indices) - 1]))]
+
+        return run_starts.tolist(), run_ends.tolist()
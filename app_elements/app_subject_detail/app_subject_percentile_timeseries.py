@@ -5,19 +5,236 @@ This module creates interactive timeseries plots showing percentile progression
 over time with confidence intervals using Wilson CI methodology.
 """
 
-import pandas as pd
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
 import plotly.graph_objects as go
 from dash import dcc, html
 
+from app_utils.app_analysis.statistical_utils import StatisticalUtils
 from app_utils.simple_logger import get_logger
 from app_utils.strata_utils import get_strata_abbreviation
 
 logger = get_logger("subject_percentile_timeseries")
 
+# Maximum number of points drawn per trace before LTTB downsampling kicks in
+MAX_TRACE_POINTS = 500
+
+# Maximum number of rendered percentile figures kept in memory
+FIGURE_CACHE_SIZE = 8
+
+# Outlier marker count above which markers use WebGL even when SVG is requested
+WEBGL_MARKER_THRESHOLD = 200
+
+# Reference lines for percentile categories: (y value, color, label)
+REFERENCE_LINES = (
+    (6.5, "red", "Severely Below (6.5%)"),
+    (28, "orange", "Below (28%)"),
+    (72, "orange", "Good (72%)"),
+    (93.5, "green", "Severely Good (93.5%)"),
+)
+
+# Static layout shared by the empty and populated figures
+_BASE_LAYOUT = dict(
+    title=None,
+    xaxis_title="Session Number",
+    template="plotly_white",
+    margin=dict(l=40, r=20, t=40, b=60),
+    height=550,
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    hovermode="x unified",
+    yaxis=dict(
+        range=[0, 100],
+        showgrid=True,
+        gridwidth=1,
+        gridcolor="rgba(211,211,211,0.3)",
+        zeroline=False,
+    ),
+)
+
+# Reference lines as plain shapes/annotations, validated once with the layout
+# instead of through one add_hline call per line
+_REFERENCE_SHAPES = tuple(
+    dict(
+        type="line",
+        xref="x domain",
+        yref="y",
+        x0=0,
+        x1=1,
+        y0=y_value,
+        y1=y_value,
+        line=dict(color=color, width=1, dash="dash"),
+        opacity=0.7,
+    )
+    for y_value, color, _ in REFERENCE_LINES
+)
+_REFERENCE_ANNOTATIONS = tuple(
+    dict(
+        text=label,
+        xref="x domain",
+        yref="y",
+        x=1,
+        y=y_value,
+        xanchor="left",
+        yanchor="middle",
+        showarrow=False,
+    )
+    for y_value, _, label in REFERENCE_LINES
+)
+
+_EMPTY_FIGURE_ANNOTATION = dict(
+    text="Select a subject to view percentile data",
+    xref="paper",
+    yref="paper",
+    x=0.5,
+    y=0.5,
+    showarrow=False,
+    font=dict(size=14, color="gray"),
+)
+
+# Outlier session marker style, shared by every render (go.Figure copies it)
+_OUTLIER_MARKER = dict(
+    color="#9C27B0", size=12, symbol="diamond", line=dict(width=2, color="#FFFFFF")
+)
+_OUTLIER_HOVER = "<b>Outlier Session</b><br>Session: %{x}<extra></extra>"
+
+# Hex colors used by the percentile plots (feature lines and outlier markers)
+PALETTE_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#9C27B0")
+
+
+@lru_cache(maxsize=128)
+def _parse_hex_rgb(hex_color):
+    """Parse a #RRGGBB hex color into an "r, g, b" string (gray if invalid)"""
+    try:
+        r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+        return f"{r}, {g}, {b}"
+    except (TypeError, ValueError):
+        return "128, 128, 128"  # Default gray
+
+
+_PALETTE_RGB = {color: _parse_hex_rgb(color) for color in PALETTE_COLORS}
+
+
+def _hex_to_rgb(hex_color):
+    """Convert hex color to RGB string for transparency"""
+    rgb = _PALETTE_RGB.get(hex_color)
+    return rgb if rgb is not None else _parse_hex_rgb(hex_color)
+
+
+def _filter_valid(percentiles, ci_lower, ci_upper, sessions, show_ci, min_points=1):
+    """
+    Mask out invalid percentile points (None/NaN/-1) in a single vectorized pass
+
+    Parameters:
+        percentiles: list - Percentile values aligned with sessions
+        ci_lower: list - Lower CI bounds aligned with percentiles (may be empty)
+        ci_upper: list - Upper CI bounds aligned with percentiles (may be empty)
+        sessions: np.ndarray - Session numbers
+        show_ci: bool - Whether confidence intervals are requested
+        min_points: int - Minimum number of valid points needed to draw the trace
+
+    Returns:
+        dict or None: Valid sessions/percentiles as ndarrays, CI bounds (NaN where
+            the session has a valid percentile but no valid CI) and has_ci flag;
+            None if fewer than min_points points are valid
+    """
+    has_ci = (
+        show_ci
+        and len(ci_lower) == len(percentiles)
+        and len(ci_upper) == len(percentiles)
+    )
+
+    # Coerce to float arrays once (None -> NaN)
+    num_points = min(len(sessions), len(percentiles))
+    percentiles_arr = np.asarray(percentiles[:num_points], dtype=np.float64)
+    valid = ~np.isnan(percentiles_arr) & (percentiles_arr != -1)
+
+    # Skip CI extraction entirely for traces that will not be drawn
+    if np.count_nonzero(valid) < min_points:
+        return None
+
+    valid_ci_lower = valid_ci_upper = np.empty(0, dtype=np.float64)
+    if has_ci:
+        ci_lower_arr = np.asarray(ci_lower[:num_points], dtype=np.float64)
+        ci_upper_arr = np.asarray(ci_upper[:num_points], dtype=np.float64)
+        ci_valid = (
+            ~np.isnan(ci_lower_arr)
+            & (ci_lower_arr != -1)
+            & ~np.isnan(ci_upper_arr)
+            & (ci_upper_arr != -1)
+        )
+
+        # Sessions with a valid percentile but invalid CI keep NaN bounds
+        valid_ci_lower = np.where(ci_valid, ci_lower_arr, np.nan)[valid]
+        valid_ci_upper = np.where(ci_valid, ci_upper_arr, np.nan)[valid]
+
+    return {
+        "sessions": sessions[:num_points][valid],
+        "percentiles": percentiles_arr[valid],
+        "ci_lower": valid_ci_lower,
+        "ci_upper": valid_ci_upper,
+        "has_ci": has_ci,
+    }
+
+
+@lru_cache(maxsize=1)
+def _empty_figure_dict():
+    """
+    Build the empty-state percentile figure once per process
+
+    Callers must not mutate the returned dict.
+    """
+    fig = go.Figure()
+
+    fig.update_layout(
+        _BASE_LAYOUT,
+        yaxis_title="Feature Percentiles",
+        annotations=[_EMPTY_FIGURE_ANNOTATION],
+    )
+
+    return fig.to_dict()
+
+
+def _hover_template(title, with_strata, has_ci):
+    """
+    Build a percentile trace hover template
+
+    customdata columns are ordered percentile, [ci_lower, ci_upper]; the strata
+    label is carried by the trace text so customdata stays purely numeric.
+
+    Parameters:
+        title: str - Bold trace title shown in the hover label
+        with_strata: bool - Whether the strata label leads the hover text
+        has_ci: bool - Whether CI bounds are included
+
+    Returns:
+        str: Plotly hovertemplate
+    """
+    template = "<b>Strata: %{text}</b><br><br>" if with_strata else ""
+    template += f"<b>{title}</b><br>" + "Percentile: %{y:.1f}%"
+    if has_ci:
+        template += (
+            "<br>"
+            + "95% CI: %{customdata[1]:.1f}% - %{customdata[2]:.1f}%<br>"
+            + "CI Method: Wilson"
+        )
+
+    return template + "<extra></extra>"
+
 
 class AppSubjectPercentileTimeseries:
-    def __init__(self):
-        """Initialize the percentile timeseries component"""
+    def __init__(self, use_webgl=True):
+        """
+        Initialize the percentile timeseries component
+
+        Parameters:
+            use_webgl (bool): Render traces with WebGL (Scattergl); disable to keep
+                SVG spline smoothing on the percentile lines
+        """
+        self.use_webgl = use_webgl
+
         # Define features to plot with their optimization preferences
         self.features_config = {
             "finished_trials": False,  # Higher is better
@@ -36,6 +253,49 @@ class AppSubjectPercentileTimeseries:
             "abs(bias_naive)": "#9467bd",  # Purple
         }
 
+        # Static per-feature values precomputed once instead of on every redraw
+        self._feature_display = {
+            feature: StatisticalUtils.format_feature_display_name(feature)
+            for feature in self.features_config
+        }
+        hover_titles = {
+            feature: feature.replace("_", " ").title()
+            for feature in self.features_config
+        }
+        hover_titles["overall"] = "Overall Percentile"
+        self._hover_templates = {
+            (key, with_strata, has_ci): _hover_template(title, with_strata, has_ci)
+            for key, title in hover_titles.items()
+            for with_strata in (True, False)
+            for has_ci in (True, False)
+        }
+        self._feature_options = self._build_feature_options()
+        self._feature_rgb = {
+            feature: _hex_to_rgb(color)
+            for feature, color in self.feature_colors.items()
+        }
+
+        # Subject data keys that shape the figure (used for cache fingerprints)
+        self._fingerprint_keys = (
+            "sessions",
+            "is_outlier",
+            *(
+                f"{feature}{suffix}"
+                for feature in self.features_config
+                for suffix in (
+                    "_percentiles",
+                    "_percentile_ci_lower",
+                    "_percentile_ci_upper",
+                )
+            ),
+            "overall_percentiles",
+            "overall_percentiles_ci_lower",
+            "overall_percentiles_ci_upper",
+        )
+
+        # Rendered figures keyed by plot inputs, most recently used last
+        self._fig_cache = OrderedDict()
+
     def build(self):
         """Build the complete percentile timeseries component"""
         return html.Div(
@@ -90,14 +350,15 @@ class AppSubjectPercentileTimeseries:
 
     def _get_feature_options(self):
         """Get dropdown options for feature selection"""
+        return self._feature_options
+
+    def _build_feature_options(self):
+        """Build dropdown options for feature selection"""
         options = [{"label": "All Features", "value": "all"}]
 
         # Add individual features
         for feature in self.features_config.keys():
-            label = (
-                feature.replace("_", " ").replace("abs(", "|").replace(")", "|").title()
-            )
-            options.append({"label": label, "value": feature})
+            options.append({"label": self._feature_display[feature], "value": feature})
 
         # Add overall percentile as a selectable option
         options.append({"label": "Overall Percentile", "value": "overall_percentile"})
@@ -105,46 +366,8 @@ class AppSubjectPercentileTimeseries:
         return options
 
     def _create_empty_figure(self):
-        """Create empty plot with proper styling"""
-        fig = go.Figure()
-
-        fig.update_layout(
-            title=None,
-            xaxis_title="Session Number",
-            yaxis_title="Feature Percentiles",
-            template="plotly_white",
-            margin=dict(
-                l=40,
-                r=20,
-                t=40,
-                b=60,
-            ),
-            height=550,
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-            ),
-            hovermode="x unified",
-            yaxis=dict(
-                range=[0, 100],
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="rgba(211,211,211,0.3)",
-                zeroline=False,
-            ),
-        )
-
-        # Add placeholder text
-        fig.add_annotation(
-            text="Select a subject to view percentile data",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=14, color="gray"),
-        )
-
-        return fig
+        """Get the (shared, cached) empty plot with proper styling"""
+        return _empty_figure_dict()
 
     def create_plot(
         self,
@@ -161,6 +384,10 @@ class AppSubjectPercentileTimeseries:
             selected_features: list - Features to plot
             highlighted_session: int - Session to highlight
             show_confidence_intervals: bool - Whether to show confidence interval bands
+
+        Returns:
+            dict: Percentile timeseries figure dict; cached figures are shared
+                between calls, so callers must not mutate the result
         """
         logger.info(
             f"Creating percentile timeseries plot for subject with data keys: {list(subject_data.keys()) if subject_data else 'None'}"
@@ -170,8 +397,79 @@ class AppSubjectPercentileTimeseries:
         if not self._validate_input_data(subject_data):
             return self._create_empty_figure()
 
-        fig = go.Figure()
+        # Reuse the un-highlighted figure when only the highlighted session changed
+        cache_key = (
+            self._data_fingerprint(subject_data),
+            tuple(selected_features),
+            bool(show_confidence_intervals),
+        )
+        if cache_key in self._fig_cache:
+            self._fig_cache.move_to_end(cache_key)
+            base_figure = self._fig_cache[cache_key]
+        else:
+            base_figure = self._build_plot(
+                subject_data, selected_features, show_confidence_intervals
+            ).to_dict()
+
+            self._fig_cache[cache_key] = base_figure
+            if len(self._fig_cache) > FIGURE_CACHE_SIZE:
+                self._fig_cache.popitem(last=False)
+
+        return self._apply_highlight(
+            base_figure, subject_data["sessions"], highlighted_session
+        )
+
+    def _apply_highlight(self, base_figure, sessions, highlighted_session):
+        """
+        Return a figure dict with a vertical highlight line on a session
+
+        The cached base figure is never mutated; only the layout and its shapes
+        and annotations lists are copied.
+        """
+        if not highlighted_session or highlighted_session not in sessions:
+            return base_figure
+
+        layout = base_figure["layout"]
+        highlight_shape = dict(
+            type="line",
+            xref="x",
+            yref="y domain",
+            x0=highlighted_session,
+            x1=highlighted_session,
+            y0=0,
+            y1=1,
+            line=dict(color="rgba(65, 105, 225, 0.6)", width=3, dash="solid"),
+        )
+        highlight_annotation = dict(
+            text=f"Session {highlighted_session}",
+            xref="x",
+            yref="y domain",
+            x=highlighted_session,
+            y=1,
+            xanchor="center",
+            yanchor="bottom",
+            showarrow=False,
+        )
+
+        return {
+            **base_figure,
+            "layout": {
+                **layout,
+                "shapes": [*layout.get("shapes", ()), highlight_shape],
+                "annotations": [*layout.get("annotations", ()), highlight_annotation],
+            },
+        }
+
+    def _build_plot(
+        self,
+        subject_data,
+        selected_features,
+        show_confidence_intervals,
+    ):
+        """Build the un-highlighted percentile timeseries figure for validated subject data"""
+        traces = []
         sessions = subject_data["sessions"]
+        sessions_arr = np.asarray(sessions)
 
         # Prepare plot data
         features_to_plot, show_overall_percentile = self._prepare_features_to_plot(
@@ -181,10 +479,10 @@ class AppSubjectPercentileTimeseries:
 
         # Plot individual features
         self._add_feature_traces(
-            fig,
+            traces,
             subject_data,
             features_to_plot,
-            sessions,
+            sessions_arr,
             strata_sessions_map,
             show_confidence_intervals,
         )
@@ -192,19 +490,46 @@ class AppSubjectPercentileTimeseries:
         # Add overall percentile if selected
         if show_overall_percentile:
             self._add_overall_percentile_trace(
-                fig,
+                traces,
                 subject_data,
-                sessions,
+                sessions_arr,
                 strata_sessions_map,
                 show_confidence_intervals,
                 features_to_plot,
             )
 
-        # Configure plot layout and enhancements
-        self._configure_plot_layout(fig)
-        self._add_plot_enhancements(fig, subject_data, sessions, highlighted_session)
+        # Add strata transition lines and outlier markers
+        strata_shapes, strata_annotations = self._create_strata_transitions(
+            sessions, subject_data.get("strata", [])
+        )
+        self._add_outlier_markers(traces, sessions, subject_data.get("is_outlier", []))
+
+        # Validate all traces and the layout in a single Figure construction
+        return go.Figure(
+            data=traces,
+            layout=self._plot_layout(strata_shapes, strata_annotations),
+        )
+
+    def _data_fingerprint(self, subject_data):
+        """
+        Content hash of the subject data that shapes the figure
 
-        return fig
+        Parameters:
+            subject_data: dict - Time series data from app_utils
+
+        Returns:
+            str: Hex digest of sessions, strata, outlier flags and percentile/CI columns
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            "\x1f".join(map(str, subject_data.get("strata", []))).encode("utf-8")
+        )
+        for key in self._fingerprint_keys:
+            values = np.asarray(subject_data.get(key, []), dtype=np.float64)
+            digest.update(key.encode("utf-8"))
+            digest.update(values.tobytes())
+
+        return digest.hexdigest()
 
     def _validate_input_data(self, subject_data):
         """Validate input data for plotting"""
@@ -249,7 +574,7 @@ class AppSubjectPercentileTimeseries:
 
     def _add_feature_traces(
         self,
-        fig,
+        traces,
         subject_data,
         features_to_plot,
         sessions,
@@ -268,17 +593,17 @@ class AppSubjectPercentileTimeseries:
                 subject_data, feature, sessions, show_confidence_intervals
             )
 
-            if not valid_data or len(valid_data["sessions"]) < 2:
+            if valid_data is None:
                 logger.info(f"Insufficient valid percentile data for {feature}")
                 continue
 
             # Add confidence interval bands if available
             if valid_data["has_ci"]:
-                self._add_confidence_intervals(fig, feature, valid_data)
+                self._add_confidence_intervals(traces, feature, valid_data)
 
             # Add main feature trace
             self._add_feature_trace(
-                fig, feature, valid_data, strata_sessions_map, i == 0
+                traces, feature, valid_data, strata_sessions_map, i == 0
             )
 
     def _get_valid_percentile_data(
@@ -289,191 +614,136 @@ class AppSubjectPercentileTimeseries:
         ci_lower_key = f"{feature}_percentile_ci_lower"
         ci_upper_key = f"{feature}_percentile_ci_upper"
 
-        percentile_data = subject_data[percentile_key]
-        ci_lower_data = subject_data.get(ci_lower_key, [])
-        ci_upper_data = subject_data.get(ci_upper_key, [])
-
-        has_ci_data = (
-            len(ci_lower_data) == len(percentile_data)
-            and len(ci_upper_data) == len(percentile_data)
-            and show_confidence_intervals
-        )
-
-        # Filter out invalid values
-        valid_sessions, valid_percentiles, valid_ci_lower, valid_ci_upper = (
-            [],
-            [],
-            [],
-            [],
+        valid_data = _filter_valid(
+            subject_data[percentile_key],
+            subject_data.get(ci_lower_key, []),
+            subject_data.get(ci_upper_key, []),
+            sessions,
+            show_confidence_intervals,
+            min_points=2,
         )
+        if valid_data is None:
+            return None
 
-        for j, (session, percentile) in enumerate(zip(sessions, percentile_data)):
-            if percentile is not None and not pd.isna(percentile) and percentile != -1:
-                valid_sessions.append(session)
-                valid_percentiles.append(percentile)
-
-                if has_ci_data and j < len(ci_lower_data) and j < len(ci_upper_data):
-                    ci_lower = ci_lower_data[j]
-                    ci_upper = ci_upper_data[j]
-
-                    if (
-                        ci_lower is not None
-                        and not pd.isna(ci_lower)
-                        and ci_lower != -1
-                        and ci_upper is not None
-                        and not pd.isna(ci_upper)
-                        and ci_upper != -1
-                    ):
-                        valid_ci_lower.append(ci_lower)
-                        valid_ci_upper.append(ci_upper)
-                    else:
-                        valid_ci_lower.append(None)
-                        valid_ci_upper.append(None)
+        return StatisticalUtils.downsample_trace_data(valid_data, MAX_TRACE_POINTS)
 
-        return {
-            "sessions": valid_sessions,
-            "percentiles": valid_percentiles,
-            "ci_lower": valid_ci_lower,
-            "ci_upper": valid_ci_upper,
-            "has_ci": has_ci_data and len(valid_ci_lower) == len(valid_sessions),
-        }
-
-    def _add_confidence_intervals(self, fig, feature, valid_data):
+    def _add_confidence_intervals(self, traces, feature, valid_data):
         """Add confidence interval bands for a feature"""
-        # Filter CI data to match valid sessions
-        valid_ci_lower = [ci for ci in valid_data["ci_lower"] if ci is not None]
-        valid_ci_upper = [ci for ci in valid_data["ci_upper"] if ci is not None]
-        valid_sessions_ci = [
-            session
-            for session, ci_lower, ci_upper in zip(
-                valid_data["sessions"], valid_data["ci_lower"], valid_data["ci_upper"]
-            )
-            if ci_lower is not None and ci_upper is not None
-        ]
+        feature_rgb = self._feature_rgb.get(feature, "0, 0, 0")
+        band_sessions = self._add_ci_band(
+            traces, valid_data, feature, f"rgba({feature_rgb}, 0.2)"
+        )
 
-        if not valid_ci_lower or not valid_sessions_ci:
-            return
+        if band_sessions:
+            logger.info(f"Added CI bands for {feature}: {band_sessions} sessions")
 
-        feature_color = self.feature_colors.get(feature, "#000000")
+    def _add_ci_band(self, traces, valid_data, name_prefix, fillcolor):
+        """
+        Add a filled CI band between the upper and lower bounds of a trace
 
-        # Add upper bound (invisible line)
-        fig.add_trace(
-            go.Scatter(
-                x=valid_sessions_ci,
-                y=valid_ci_upper,
-                fill=None,
-                mode="lines",
-                line=dict(color="rgba(0,0,0,0)"),
-                showlegend=False,
-                hoverinfo="skip",
-                name=f"{feature}_ci_upper",
-            )
-        )
+        Parameters:
+            traces: list - Trace dicts to append the band to
+            valid_data: dict - Validated trace data from _filter_valid
+            name_prefix: str - Prefix for the band trace name
+            fillcolor: str - Band fill color
 
-        # Add lower bound with fill
-        fig.add_trace(
-            go.Scatter(
-                x=valid_sessions_ci,
-                y=valid_ci_lower,
-                fill="tonexty",
+        Returns:
+            int: Number of sessions in the band (0 if nothing was added)
+        """
+        # _filter_valid blanks both bounds together, so one mask covers both
+        ci_mask = ~np.isnan(valid_data["ci_lower"])
+        if not ci_mask.any():
+            return 0
+
+        valid_sessions_ci = valid_data["sessions"][ci_mask]
+
+        # Draw the band as one closed polygon: along the upper bound, then back
+        # along the lower bound, instead of an invisible upper trace plus a
+        # "tonexty" lower trace
+        traces.append(
+            dict(
+                type=self._trace_type(),
+                x=np.concatenate([valid_sessions_ci, valid_sessions_ci[::-1]]),
+                y=np.concatenate(
+                    [
+                        valid_data["ci_upper"][ci_mask],
+                        valid_data["ci_lower"][ci_mask][::-1],
+                    ]
+                ),
+                fill="toself",
                 mode="lines",
                 line=dict(color="rgba(0,0,0,0)"),
-                fillcolor=f"rgba({self._hex_to_rgb(feature_color)}, 0.2)",
+                fillcolor=fillcolor,
                 showlegend=False,
                 hoverinfo="skip",
-                name=f"{feature}_ci_band",
+                name=f"{name_prefix}_ci_band",
             )
         )
 
-        logger.info(f"Added CI bands for {feature}: {len(valid_sessions_ci)} sessions")
+        return len(valid_sessions_ci)
 
     def _add_feature_trace(
-        self, fig, feature, valid_data, strata_sessions_map, is_first_trace
+        self, traces, feature, valid_data, strata_sessions_map, is_first_trace
     ):
         """Add main feature trace to the plot"""
         feature_color = self.feature_colors.get(feature, "#000000")
 
         # Prepare hover data and template
-        hover_template, custom_data = self._prepare_hover_data(
+        hover_kwargs = self._prepare_hover_data(
             feature, valid_data, strata_sessions_map, is_first_trace
         )
 
         # Create trace for feature percentiles
-        fig.add_trace(
-            go.Scatter(
+        traces.append(
+            dict(
+                type=self._trace_type(),
                 x=valid_data["sessions"],
                 y=valid_data["percentiles"],
                 mode="lines",
-                name=feature.replace("_", " ")
-                .replace("abs(", "|")
-                .replace(")", "|")
-                .title(),
-                line=dict(color=feature_color, width=2, shape="spline", smoothing=1.0),
-                hovertemplate=hover_template,
-                customdata=custom_data,
+                name=self._feature_display[feature],
+                line=dict(color=feature_color, width=2, **self._line_smoothing()),
+                **hover_kwargs,
             )
         )
 
     def _prepare_hover_data(
-        self, feature, valid_data, strata_sessions_map, is_first_trace
+        self, hover_key, valid_data, strata_sessions_map, with_strata
     ):
-        """Prepare hover template and custom data for a feature trace"""
-        if is_first_trace:
-            strata_hover_info = [
+        """
+        Prepare hover template and custom data for a percentile trace
+
+        Parameters:
+            hover_key: str - Feature name, or "overall" for the overall trace
+            valid_data: dict - Validated trace data from _filter_valid
+            strata_sessions_map: dict - Session number to strata abbreviation
+            with_strata: bool - Whether to include strata in the hover label
+
+        Returns:
+            dict: hovertemplate, numeric customdata and (with strata) text trace
+                properties
+        """
+        columns = [valid_data["percentiles"]]
+        if valid_data["has_ci"]:
+            columns.append(np.nan_to_num(valid_data["ci_lower"], nan=0.0))
+            columns.append(np.nan_to_num(valid_data["ci_upper"], nan=0.0))
+
+        hover_kwargs = {
+            "hovertemplate": self._hover_templates[
+                (hover_key, with_strata, valid_data["has_ci"])
+            ],
+            "customdata": np.column_stack(columns),
+        }
+        if with_strata:
+            hover_kwargs["text"] = [
                 strata_sessions_map.get(session, "Unknown")
                 for session in valid_data["sessions"]
             ]
 
-            if valid_data["has_ci"]:
-                hover_template = (
-                    "<b>Strata: %{customdata[1]}</b><br><br>"
-                    + f"<b>{feature.replace('_', ' ').title()}</b><br>"
-                    + "Percentile: %{y:.1f}%<br>"
-                    + "95% CI: %{customdata[2]:.1f}% - %{customdata[3]:.1f}%<br>"
-                    + "CI Method: Wilson<extra></extra>"
-                )
-                custom_data = list(
-                    zip(
-                        valid_data["percentiles"],
-                        strata_hover_info,
-                        [ci or 0 for ci in valid_data["ci_lower"]],
-                        [ci or 0 for ci in valid_data["ci_upper"]],
-                    )
-                )
-            else:
-                hover_template = (
-                    "<b>Strata: %{customdata[1]}</b><br><br>"
-                    + f"<b>{feature.replace('_', ' ').title()}</b><br>"
-                    + "Percentile: %{y:.1f}%<extra></extra>"
-                )
-                custom_data = list(zip(valid_data["percentiles"], strata_hover_info))
-        else:
-            if valid_data["has_ci"]:
-                hover_template = (
-                    f"<b>{feature.replace('_', ' ').title()}</b><br>"
-                    + "Percentile: %{y:.1f}%<br>"
-                    + "95% CI: %{customdata[1]:.1f}% - %{customdata[2]:.1f}%<br>"
-                    + "CI Method: Wilson<extra></extra>"
-                )
-                custom_data = list(
-                    zip(
-                        valid_data["percentiles"],
-                        [ci or 0 for ci in valid_data["ci_lower"]],
-                        [ci or 0 for ci in valid_data["ci_upper"]],
-                    )
-                )
-            else:
-                hover_template = (
-                    f"<b>{feature.replace('_', ' ').title()}</b><br>"
-                    + "Percentile: %{y:.1f}%<extra></extra>"
-                )
-                custom_data = list(zip(valid_data["percentiles"]))
-
-        return hover_template, custom_data
+        return hover_kwargs
 
     def _add_overall_percentile_trace(
         self,
-        fig,
+        traces,
         subject_data,
         sessions,
         strata_sessions_map,
@@ -493,196 +763,56 @@ class AppSubjectPercentileTimeseries:
         )
 
         # Get valid overall percentile data
-        valid_overall_data = self._get_valid_overall_percentile_data(
-            sessions,
+        valid_overall_data = _filter_valid(
             overall_percentiles,
             overall_ci_lower,
             overall_ci_upper,
+            sessions,
             show_confidence_intervals,
         )
 
-        if not valid_overall_data["sessions"]:
+        if valid_overall_data is None:
             return
 
+        valid_overall_data = StatisticalUtils.downsample_trace_data(
+            valid_overall_data, MAX_TRACE_POINTS
+        )
+
         # Add overall CI bands if available
         if valid_overall_data["has_ci"]:
-            self._add_overall_confidence_intervals(fig, valid_overall_data)
+            self._add_overall_confidence_intervals(traces, valid_overall_data)
 
         # Add main overall percentile trace
         self._add_overall_trace(
-            fig, valid_overall_data, strata_sessions_map, features_to_plot
+            traces, valid_overall_data, strata_sessions_map, features_to_plot
         )
 
-    def _get_valid_overall_percentile_data(
-        self,
-        sessions,
-        overall_percentiles,
-        overall_ci_lower,
-        overall_ci_upper,
-        show_confidence_intervals,
-    ):
-        """Extract and validate overall percentile data"""
-        has_overall_ci = (
-            len(overall_ci_lower) == len(overall_percentiles)
-            and len(overall_ci_upper) == len(overall_percentiles)
-            and show_confidence_intervals
-        )
-
-        valid_sessions, valid_percentiles, valid_ci_lower, valid_ci_upper = (
-            [],
-            [],
-            [],
-            [],
-        )
-
-        for j, (session, percentile) in enumerate(zip(sessions, overall_percentiles)):
-            if percentile is not None and not pd.isna(percentile) and percentile != -1:
-                valid_sessions.append(session)
-                valid_percentiles.append(percentile)
-
-                if (
-                    has_overall_ci
-                    and j < len(overall_ci_lower)
-                    and j < len(overall_ci_upper)
-                ):
-                    ci_lower = overall_ci_lower[j]
-                    ci_upper = overall_ci_upper[j]
-
-                    if (
-                        ci_lower is not None
-                        and not pd.isna(ci_lower)
-                        and ci_lower != -1
-                        and ci_upper is not None
-                        and not pd.isna(ci_upper)
-                        and ci_upper != -1
-                    ):
-                        valid_ci_lower.append(ci_lower)
-                        valid_ci_upper.append(ci_upper)
-                    else:
-                        valid_ci_lower.append(None)
-                        valid_ci_upper.append(None)
-
-        return {
-            "sessions": valid_sessions,
-            "percentiles": valid_percentiles,
-            "ci_lower": valid_ci_lower,
-            "ci_upper": valid_ci_upper,
-            "has_ci": has_overall_ci and len(valid_ci_lower) == len(valid_sessions),
-        }
-
-    def _add_overall_confidence_intervals(self, fig, valid_overall_data):
+    def _add_overall_confidence_intervals(self, traces, valid_overall_data):
         """Add confidence interval bands for overall percentile"""
-        # Filter CI data to match valid sessions
-        valid_ci_lower = [ci for ci in valid_overall_data["ci_lower"] if ci is not None]
-        valid_ci_upper = [ci for ci in valid_overall_data["ci_upper"] if ci is not None]
-        valid_sessions_ci = [
-            session
-            for session, ci_lower, ci_upper in zip(
-                valid_overall_data["sessions"],
-                valid_overall_data["ci_lower"],
-                valid_overall_data["ci_upper"],
-            )
-            if ci_lower is not None and ci_upper is not None
-        ]
-
-        if not valid_ci_lower:
-            return
-
-        # Add upper bound (invisible line)
-        fig.add_trace(
-            go.Scatter(
-                x=valid_sessions_ci,
-                y=valid_ci_upper,
-                fill=None,
-                mode="lines",
-                line=dict(color="rgba(0,0,0,0)"),
-                showlegend=False,
-                hoverinfo="skip",
-                name="overall_ci_upper",
-            )
-        )
-
-        # Add lower bound with fill (sea green with transparency)
-        fig.add_trace(
-            go.Scatter(
-                x=valid_sessions_ci,
-                y=valid_ci_lower,
-                fill="tonexty",
-                mode="lines",
-                line=dict(color="rgba(0,0,0,0)"),
-                fillcolor="rgba(46, 139, 87, 0.2)",
-                showlegend=False,
-                hoverinfo="skip",
-                name="overall_ci_band",
-            )
+        # Sea green band with transparency
+        band_sessions = self._add_ci_band(
+            traces, valid_overall_data, "overall", "rgba(46, 139, 87, 0.2)"
         )
 
-        logger.info(f"Added overall CI bands: {len(valid_sessions_ci)} sessions")
+        if band_sessions:
+            logger.info(f"Added overall CI bands: {band_sessions} sessions")
 
     def _add_overall_trace(
-        self, fig, valid_overall_data, strata_sessions_map, features_to_plot
+        self, traces, valid_overall_data, strata_sessions_map, features_to_plot
     ):
         """Add the main overall percentile trace"""
-        # Create strata info for hover
-        strata_hover_info = [
-            strata_sessions_map.get(session, "Unknown")
-            for session in valid_overall_data["sessions"]
-        ]
-
-        is_only_trace = len(features_to_plot) == 0
-
-        # Create hover template
-        if is_only_trace or not features_to_plot:
-            if valid_overall_data["has_ci"]:
-                hover_template = (
-                    "<b>Strata: %{customdata[1]}</b><br><br>"
-                    + "<b>Overall Percentile</b><br>"
-                    + "Percentile: %{y:.1f}%<br>"
-                    + "95% CI: %{customdata[2]:.1f}% - %{customdata[3]:.1f}%<br>"
-                    + "CI Method: Wilson<extra></extra>"
-                )
-                custom_data = list(
-                    zip(
-                        valid_overall_data["percentiles"],
-                        strata_hover_info,
-                        [ci or 0 for ci in valid_overall_data["ci_lower"]],
-                        [ci or 0 for ci in valid_overall_data["ci_upper"]],
-                    )
-                )
-            else:
-                hover_template = (
-                    "<b>Strata: %{customdata[1]}</b><br><br>"
-                    + "<b>Overall Percentile</b><br>"
-                    + "Percentile: %{y:.1f}%<extra></extra>"
-                )
-                custom_data = list(
-                    zip(valid_overall_data["percentiles"], strata_hover_info)
-                )
-        else:
-            if valid_overall_data["has_ci"]:
-                hover_template = (
-                    "<b>Overall Percentile</b><br>"
-                    + "Percentile: %{y:.1f}%<br>"
-                    + "95% CI: %{customdata[1]:.1f}% - %{customdata[2]:.1f}%<br>"
-                    + "CI Method: Wilson<extra></extra>"
-                )
-                custom_data = list(
-                    zip(
-                        valid_overall_data["percentiles"],
-                        [ci or 0 for ci in valid_overall_data["ci_lower"]],
-                        [ci or 0 for ci in valid_overall_data["ci_upper"]],
-                    )
-                )
-            else:
-                hover_template = (
-                    "<b>Overall Percentile</b><br>"
-                    + "Percentile: %{y:.1f}%<extra></extra>"
-                )
-                custom_data = list(zip(valid_overall_data["percentiles"]))
+        # Strata lead the hover label only when no feature trace carries them
+        hover_kwargs = self._prepare_hover_data(
+            "overall",
+            valid_overall_data,
+            strata_sessions_map,
+            with_strata=not features_to_plot,
+        )
 
         # Add overall percentile trace with distinctive styling
-        fig.add_trace(
-            go.Scatter(
+        traces.append(
+            dict(
+                type=self._trace_type(),
                 x=valid_overall_data["sessions"],
                 y=valid_overall_data["percentiles"],
                 mode="lines",
@@ -691,140 +821,107 @@ class AppSubjectPercentileTimeseries:
                     color="#2E8B57",
                     width=4,
                     dash="dash",
-                    shape="spline",
-                    smoothing=1.0,
+                    **self._line_smoothing(),
                 ),
-                hovertemplate=hover_template,
-                customdata=custom_data,
+                **hover_kwargs,
             )
         )
 
-    def _configure_plot_layout(self, fig):
-        """Configure the plot layout and reference lines"""
-        # Add reference lines for percentile categories
-        reference_lines = [
-            (6.5, "red", "Severely Below (6.5%)"),
-            (28, "orange", "Below (28%)"),
-            (72, "orange", "Good (72%)"),
-            (93.5, "green", "Severely Good (93.5%)"),
-        ]
-
-        for y_value, color, label in reference_lines:
-            fig.add_hline(
-                y=y_value,
-                line_dash="dash",
-                line_color=color,
-                line_width=1,
-                opacity=0.7,
-                annotation_text=label,
-                annotation_position="right",
-            )
+    def _plot_layout(self, strata_shapes, strata_annotations):
+        """
+        Build the populated figure layout with reference and strata lines
+
+        Parameters:
+            strata_shapes: list - Strata transition line shapes
+            strata_annotations: list - Strata transition labels
 
-        # Update layout
-        fig.update_layout(
-            title=None,
-            xaxis_title="Session Number",
+        Returns:
+            dict: Layout for the percentile timeseries figure
+        """
+        return dict(
+            _BASE_LAYOUT,
             yaxis_title="Feature Percentiles (%)",
-            template="plotly_white",
-            margin=dict(l=40, r=20, t=40, b=60),
-            height=550,
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-            ),
-            hovermode="x unified",
             xaxis=dict(showgrid=True, gridwidth=1, gridcolor="rgba(211,211,211,0.3)"),
-            yaxis=dict(
-                range=[0, 100],
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="rgba(211,211,211,0.3)",
-                zeroline=False,
-            ),
+            shapes=[*_REFERENCE_SHAPES, *strata_shapes],
+            annotations=[*_REFERENCE_ANNOTATIONS, *strata_annotations],
         )
 
-    def _add_plot_enhancements(self, fig, subject_data, sessions, highlighted_session):
-        """Add plot enhancements like strata transitions, highlights, and outliers"""
-        # Add strata transition lines
-        strata_data = subject_data.get("strata", [])
-        if strata_data and len(strata_data) == len(sessions):
-            self._add_strata_transitions(fig, sessions, strata_data)
-
-        # Add session highlight if specified
-        if highlighted_session and sessions and highlighted_session in sessions:
-            fig.add_vline(
-                x=highlighted_session,
-                line=dict(color="rgba(65, 105, 225, 0.6)", width=3, dash="solid"),
-                annotation_text=f"Session {highlighted_session}",
-                annotation_position="top",
-            )
+    def _trace_type(self):
+        """Scatter trace type used for all traces (WebGL unless disabled)"""
+        return "scattergl" if self.use_webgl else "scatter"
 
-        # Add outlier markers
-        self._add_outlier_markers(fig, sessions, subject_data.get("is_outlier", []))
+    def _line_smoothing(self):
+        """Spline line properties; WebGL traces only support linear lines"""
+        return {} if self.use_webgl else {"shape": "spline", "smoothing": 1.0}
 
     def _get_strata_abbreviation(self, strata):
         """Get abbreviated strata name for display"""
         return get_strata_abbreviation(strata)
 
-    def _add_strata_transitions(self, fig, sessions, strata_data):
-        """Add vertical lines for strata transitions"""
-        if not strata_data or len(strata_data) != len(sessions):
-            return
+    def _create_strata_transitions(self, sessions, strata_data):
+        """
+        Create vertical lines and labels for strata transitions
 
-        # Find transition points
-        transitions = []
-        current_strata = None
+        Parameters:
+            sessions: list - List of session numbers
+            strata_data: list - Strata name for each session
 
-        for i, (session, strata) in enumerate(zip(sessions, strata_data)):
-            if current_strata is None:
-                current_strata = strata
-                transitions.append(
-                    {"session": session, "strata": strata, "transition_type": "start"}
-                )
-            elif strata != current_strata:
-                transitions.append(
-                    {
-                        "session": session,
-                        "strata": strata,
-                        "transition_type": "transition",
-                    }
+        Returns:
+            tuple: (shapes, annotations) lists, empty if there are no transitions
+        """
+        if not strata_data or len(strata_data) != len(sessions):
+            return [], []
+
+        # Find transition points (sessions whose strata differs from the previous one)
+        strata_arr = np.asarray(strata_data, dtype=object)
+        transition_indices = np.flatnonzero(strata_arr[1:] != strata_arr[:-1]) + 1
+
+        shapes = []
+        annotations = []
+        for idx in transition_indices:
+            session = sessions[idx]
+            strata_abbr = self._get_strata_abbreviation(strata_data[idx])
+
+            shapes.append(
+                dict(
+                    type="line",
+                    xref="x",
+                    yref="y domain",
+                    x0=session,
+                    x1=session,
+                    y0=0,
+                    y1=1,
+                    line=dict(color="rgba(128, 128, 128, 0.6)", width=2, dash="dash"),
                 )
-                current_strata = strata
-
-        # Add vertical lines for transitions
-        for transition in transitions[1:]:
-            session = transition["session"]
-            strata = transition["strata"]
-            strata_abbr = self._get_strata_abbreviation(strata)
-
-            fig.add_vline(
-                x=session,
-                line=dict(color="rgba(128, 128, 128, 0.6)", width=2, dash="dash"),
-                annotation=dict(
+            )
+            annotations.append(
+                dict(
                     text=f"→ {strata_abbr}",
                     textangle=-90,
                     font=dict(size=10, color="gray"),
                     showarrow=False,
                     yshift=10,
-                ),
+                    xref="x",
+                    yref="y domain",
+                    x=session,
+                    y=1,
+                    xanchor="left",
+                    yanchor="top",
+                )
             )
 
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB string for transparency"""
-        hex_color = hex_color.lstrip("#")
-        try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return f"{r}, {g}, {b}"
-        except Exception:
-            return "128, 128, 128"  # Default gray
-
-    def _add_outlier_markers(self, fig, sessions, outlier_data):
+        return shapes, annotations
+
+    def _add_outlier_markers(self, traces, sessions, outlier_data):
         """
         Add purple markers for outlier sessions on the percentile time series plot
 
+        Markers follow the component's trace type, except that more than
+        WEBGL_MARKER_THRESHOLD markers are always drawn with Scattergl (WebGL
+        context required; plotly.js falls back to SVG where it is unavailable).
+
         Parameters:
-            fig: plotly.graph_objects.Figure - The percentile time series figure
+            traces: list - Trace dicts for the percentile time series figure
             sessions: list - List of session numbers
             outlier_data: list - List of boolean outlier indicators for each session
         """
@@ -834,34 +931,32 @@ class AppSubjectPercentileTimeseries:
             )
             return
 
-        outlier_sessions = []
-
-        # Find outlier sessions
-        for session, is_outlier in zip(sessions, outlier_data):
-            if is_outlier:
-                outlier_sessions.append(session)
+        # Find outlier sessions with a single boolean mask
+        outlier_sessions = np.asarray(sessions)[np.asarray(outlier_data, dtype=bool)]
 
-        if not outlier_sessions:
+        if outlier_sessions.size == 0:
             return
 
         # Add purple markers for outlier sessions
-        fig.add_trace(
-            go.Scatter(
+        trace_type = (
+            "scattergl"
+            if outlier_sessions.size > WEBGL_MARKER_THRESHOLD
+            else self._trace_type()
+        )
+
+        traces.append(
+            dict(
+                type=trace_type,
                 x=outlier_sessions,
-                y=[95] * len(outlier_sessions),
+                y=np.full(outlier_sessions.shape, 95, dtype=np.int8),
                 mode="markers",
-                marker=dict(
-                    color="#9C27B0",
-                    size=12,
-                    symbol="diamond",
-                    line=dict(width=2, color="#FFFFFF"),
-                ),
+                marker=_OUTLIER_MARKER,
                 name="Outlier Sessions",
-                hovertemplate="<b>Outlier Session</b><br>Session: %{x}<extra></extra>",
+                hovertemplate=_OUTLIER_HOVER,
                 showlegend=True,
             )
         )
 
         logger.info(
-            f"Added outlier markers to percentile plot for {len(outlier_sessions)} sessions: {outlier_sessions}"
+            f"Added outlier markers to percentile plot for {len(outlier_sessions)} sessions: {outlier_sessions.tolist()}"
         )
@@ -15,6 +15,9 @@ from app_utils.strata_utils import get_strata_abbreviation
 
 logger = get_logger("subject_timeseries")
 
+# Outlier marker count above which markers are drawn with WebGL (Scattergl)
+WEBGL_MARKER_THRESHOLD = 200
+
 
 class AppSubjectTimeseries:
     def __init__(self):
@@ -259,11 +262,13 @@ class AppSubjectTimeseries:
 
     def _filter_valid_data(self, sessions, raw_data):
         """Filter out invalid values from raw data"""
-        valid_data = []
-        for session, value in zip(sessions, raw_data):
-            if value is not None and not pd.isna(value) and value != -1:
-                valid_data.append((session, value))
-        return valid_data
+        # One array-level NaN check (None -> NaN) instead of pd.isna per value
+        num_points = min(len(sessions), len(raw_data))
+        values = np.asarray(raw_data[:num_points], dtype=np.float64)
+        valid = ~pd.isna(values) & (values != -1)
+
+        valid_sessions = np.asarray(sessions[:num_points])[valid]
+        return list(zip(valid_sessions.tolist(), values[valid].tolist()))
 
     def _create_hover_data(
         self,
@@ -460,6 +465,10 @@ class AppSubjectTimeseries:
         """
         Add purple markers for outlier sessions on the time series plot
 
+        Large outlier sets (more than WEBGL_MARKER_THRESHOLD) are drawn with
+        Scattergl, which needs a WebGL context in the browser; plotly.js falls
+        back to SVG rendering where WebGL is unavailable.
+
         Parameters:
             fig: plotly.graph_objects.Figure - The time series figure
             sessions: list - List of session numbers
@@ -484,8 +493,14 @@ class AppSubjectTimeseries:
         y_range = fig.layout.yaxis.range if fig.layout.yaxis.range else [-3, 3]
         marker_y_position = y_range[1] * 0.9
 
+        trace_class = (
+            go.Scattergl
+            if len(outlier_sessions) > WEBGL_MARKER_THRESHOLD
+            else go.Scatter
+        )
+
         fig.add_trace(
-            go.Scatter(
+            trace_class(
                 x=outlier_sessions,
                 y=[marker_y_position] * len(outlier_sessions),
                 mode="markers",
@@ -1,8 +1,23 @@
-from typing import Any, Dict, Optional
+import weakref
+from collections import Counter, OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .alert_service import AlertService
+from app_utils.simple_logger import get_logger
+
+from .alert_service import (
+    PERCENTILE_CATEGORY_CODES,
+    PERCENTILE_CATEGORY_ORDER,
+    AlertService,
+)
+
+logger = get_logger("alert_coordinator")
+
+# Maximum number of subject selections kept in the per-selection alert caches
+ALERT_CACHE_SIZE = 32
 
 
 class AlertCoordinator:
@@ -13,6 +28,23 @@ class AlertCoordinator:
     and caching for the AIND Dashboard.
     """
 
+    # Slot-backed attributes; "__dict__" keeps instances patchable (e.g. mocks),
+    # and CPython only allocates it if an undeclared attribute is set
+    __slots__ = (
+        "cache_manager",
+        "pipeline_manager",
+        "alert_service",
+        "_epoch",
+        "_unified_cache",
+        "_quantile_cache",
+        "_summary_cache",
+        "_table_cache",
+        "_filter_dispatch",
+        "_memo_df_ref",
+        "_df_memo",
+        "__dict__",
+    )
+
     def __init__(self, cache_manager=None, pipeline_manager=None):
         """
         Initialize the AlertCoordinator
@@ -25,6 +57,75 @@ class AlertCoordinator:
         self.pipeline_manager = pipeline_manager
         self.alert_service = None
 
+        # LRU caches keyed by cache epoch and subject selection (see
+        # _selection_key); bumping the epoch invalidates every entry at once
+        self._epoch = 0
+        self._unified_cache = OrderedDict()
+        self._quantile_cache = OrderedDict()
+        self._summary_cache = OrderedDict()
+        self._table_cache = OrderedDict()
+
+        # Alert category -> filter function, resolved with one dict lookup
+        self._filter_dispatch = self._build_filter_dispatch()
+
+        # Alert masks for the dataframe currently being filtered
+        self._memo_df_ref = None
+        self._df_memo = {}
+
+    def _selection_key(self, subject_ids) -> Tuple[int, Optional[frozenset]]:
+        """
+        Cache key for a subject selection in the current cache epoch
+
+        Parameters:
+            subject_ids (List[str], optional): Subject selection (None for all)
+
+        Returns:
+            Tuple[int, Optional[frozenset]]: (epoch, order-independent selection)
+        """
+        selection = None if subject_ids is None else frozenset(subject_ids)
+        return (self._epoch, selection)
+
+    def _remember(self, cache: OrderedDict, key, value) -> None:
+        """Store a value in a bounded LRU cache, evicting the oldest entry"""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > ALERT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _memo_for(self, df: pd.DataFrame) -> Dict[Any, Any]:
+        """
+        Memo of derived arrays for one dataframe, reset when a new one is passed
+
+        The dataframe is tracked by weak reference (not a bare id, which can be
+        reused once the frame is garbage collected), so within one callback the
+        filter and aggregation paths share masks for the same frame.
+
+        Parameters:
+            df (pd.DataFrame): DataFrame the memoized values are derived from
+
+        Returns:
+            Dict[Any, Any]: Memo dictionary for this dataframe
+        """
+        if self._memo_df_ref is None or self._memo_df_ref() is not df:
+            self._memo_df_ref = weakref.ref(df)
+            self._df_memo = {}
+        return self._df_memo
+
+    def _cached_mask(self, df: pd.DataFrame, alert_category: str) -> pd.Series:
+        """Alert category mask for the dataframe, computed once per dataframe"""
+        memo = self._memo_for(df)
+        key = ("mask", alert_category)
+        if key not in memo:
+            memo[key] = self.alert_service.get_alert_category_mask(df, alert_category)
+        return memo[key]
+
+    def _cached_category_masks(self, df: pd.DataFrame) -> np.ndarray:
+        """Per-category row masks for the dataframe, computed once per dataframe"""
+        memo = self._memo_for(df)
+        if "category_masks" not in memo:
+            _, memo["category_masks"] = self.alert_service.get_all_category_masks(df)
+        return memo["category_masks"]
+
     def initialize_alert_service(
         self, app_utils, config: Optional[Dict[str, Any]] = None
     ) -> AlertService:
@@ -41,9 +142,8 @@ class AlertCoordinator:
         # Create alert service with access to the AppUtils instance
         self.alert_service = AlertService(app_utils=app_utils, config=config)
 
-        # Force reset caches for a clean start
-        if hasattr(self.alert_service, "force_reset"):
-            self.alert_service.force_reset()
+        # Start a new cache epoch so alerts from a previous service are not reused
+        self._epoch += 1
 
         return self.alert_service
 
@@ -62,7 +162,24 @@ class AlertCoordinator:
                 "Alert service not initialized. Call initialize_alert_service() first."
             )
 
-        return self.alert_service.get_quantile_alerts(subject_ids)
+        # Reuse alerts for this selection while the service still holds the
+        # quantile alerts they were filtered from
+        cache_key = self._selection_key(subject_ids)
+        cached = self._quantile_cache.get(cache_key)
+        if cached is not None and cached[0] is self._quantile_source():
+            self._quantile_cache.move_to_end(cache_key)
+            return cached[1]
+
+        alerts = self.alert_service.get_quantile_alerts(subject_ids)
+        self._remember(
+            self._quantile_cache, cache_key, (self._quantile_source(), alerts)
+        )
+
+        return alerts
+
+    def _quantile_source(self):
+        """Quantile alerts dict the service currently serves lookups from"""
+        return getattr(self.alert_service, "_quantile_alerts", None)
 
     def get_unified_alerts(self, subject_ids=None, use_cache=True):
         """
@@ -88,18 +205,56 @@ class AlertCoordinator:
             and self.cache_manager
             and self.cache_manager.has("unified_alerts")
         ):
-            print("Using cached unified alerts")
+            logger.info("Using cached unified alerts")
             return self.cache_manager.get("unified_alerts")
 
+        # Return cached alerts for a previously requested subject selection
+        cache_key = self._selection_key(subject_ids)
+        if use_cache and cache_key in self._unified_cache:
+            self._unified_cache.move_to_end(cache_key)
+            return self._unified_cache[cache_key]
+
         # Get alerts from alert service
         alerts = self.alert_service.get_unified_alerts(subject_ids)
 
         # Cache results if getting alerts for all subjects
         if subject_ids is None and self.cache_manager:
             self.cache_manager.set("unified_alerts", alerts)
+        else:
+            self._remember(self._unified_cache, cache_key, alerts)
+
+        # Fresh alerts make any summary computed for this selection stale
+        self._summary_cache.pop(cache_key, None)
 
         return alerts
 
+    def get_unified_alerts_table(
+        self, unified_alerts: Dict[str, Dict[str, Any]], build: Callable
+    ) -> Any:
+        """
+        Get a table derived from unified alerts returned by this coordinator
+
+        Repeated selections return the same alerts dict within a cache epoch,
+        so the table is cached against the epoch and that dict; the cached
+        entry holds the dict itself so its id cannot be reused.
+
+        Parameters:
+            unified_alerts (Dict[str, Dict[str, Any]]): Alerts from get_unified_alerts
+            build (Callable): Builds the table from the alerts dict on a miss
+
+        Returns:
+            Any: The table built from unified_alerts
+        """
+        cache_key = (self._epoch, id(unified_alerts))
+        cached = self._table_cache.get(cache_key)
+        if cached is not None and cached[0] is unified_alerts:
+            self._table_cache.move_to_end(cache_key)
+            return cached[1]
+
+        table = build(unified_alerts)
+        self._remember(self._table_cache, cache_key, (unified_alerts, table))
+        return table
+
     def clear_alert_cache(self):
         """
         Clear cached alert data to force refresh
@@ -107,12 +262,27 @@ class AlertCoordinator:
         if self.cache_manager:
             # Clear unified alerts cache
             if self.cache_manager.has("unified_alerts"):
-                print("Clearing unified alerts cache")
-                pass
+                logger.info("Clearing unified alerts cache")
+                self.cache_manager.delete("unified_alerts")
+
+            # Alert columns applied to the table were derived from those alerts
+            self.cache_manager.delete("unified_alert_columns")
+
+        # Invalidate per-selection alert and summary caches in O(1); stale
+        # entries age out of the bounded LRUs
+        self._epoch += 1
+        self._memo_df_ref = None
+        self._df_memo = {}
 
         # Clear alert service internal caches if available
-        if self.alert_service and hasattr(self.alert_service, "_quantile_alerts"):
-            self.alert_service._quantile_alerts = {}
+        if self.alert_service and hasattr(self.alert_service, "_reset_quantile_alerts"):
+            self.alert_service._reset_quantile_alerts()
+        if self.alert_service and hasattr(self.alert_service, "_ns_reason_cache"):
+            self.alert_service._ns_reason_cache.clear()
+        if self.alert_service and hasattr(
+            self.alert_service, "_overall_percentile_cache"
+        ):
+            self.alert_service._overall_percentile_cache.clear()
 
     def get_alert_summary_stats(self, subject_ids=None) -> Dict[str, Any]:
         """
@@ -131,30 +301,44 @@ class AlertCoordinator:
                 "category_counts": {},
             }
 
+        # Reuse summary statistics already computed for this selection
+        cache_key = self._selection_key(subject_ids)
+        if cache_key in self._summary_cache:
+            self._summary_cache.move_to_end(cache_key)
+            return self._summary_cache[cache_key]
+
         try:
             # Get unified alerts for analysis
             alerts = self.get_unified_alerts(subject_ids=subject_ids, use_cache=True)
 
-            # Calculate summary statistics
+            # Calculate summary statistics in one pass (Counter tallies in C)
             total_subjects = len(alerts)
-            category_counts = {}
-
-            for subject_id, alert_data in alerts.items():
-                category = alert_data.get("alert_category", "Unknown")
-                category_counts[category] = category_counts.get(category, 0) + 1
+            category_counts = dict(
+                Counter(
+                    alert_data.get("alert_category", "Unknown")
+                    for alert_data in alerts.values()
+                )
+            )
 
-            # Calculate percentages
-            category_percentages = {}
-            if total_subjects > 0:
-                for category, count in category_counts.items():
-                    category_percentages[category] = (count / total_subjects) * 100
+            # Calculate percentages with one vector divide (empty if no subjects)
+            counts = np.fromiter(
+                category_counts.values(),
+                dtype=np.float64,
+                count=len(category_counts),
+            )
+            category_percentages = dict(
+                zip(category_counts, (counts / max(total_subjects, 1) * 100).tolist())
+            )
 
-            return {
+            summary = {
                 "total_subjects": total_subjects,
                 "category_counts": category_counts,
                 "category_percentages": category_percentages,
                 "categories_found": list(category_counts.keys()),
             }
+            self._remember(self._summary_cache, cache_key, summary)
+
+            return summary
 
         except Exception as e:
             return {
@@ -179,25 +363,30 @@ class AlertCoordinator:
         if "percentile_categories" in config:
             categories = config["percentile_categories"]
 
-            # Expected category keys
+            # Expected category keys, in threshold order
             expected_keys = ["SB", "B", "N", "G", "SG"]
 
-            for key in expected_keys:
-                if key not in categories:
-                    validation_result["errors"].append(
-                        f"Missing category threshold: {key}"
-                    )
-                    validation_result["valid"] = False
-                elif not isinstance(categories[key], (int, float)):
-                    validation_result["errors"].append(
-                        f"Invalid threshold type for {key}: must be numeric"
-                    )
-                    validation_result["valid"] = False
+            missing = set(expected_keys).difference(categories)
+            validation_result["errors"].extend(
+                f"Missing category threshold: {key}"
+                for key in expected_keys
+                if key in missing
+            )
+            validation_result["errors"].extend(
+                f"Invalid threshold type for {key}: must be numeric"
+                for key in expected_keys
+                if key not in missing and not isinstance(categories[key], (int, float))
+            )
+            validation_result["valid"] = not validation_result["errors"]
 
             # Check threshold ordering
             if validation_result["valid"]:
-                thresholds = [categories[key] for key in expected_keys]
-                if thresholds != sorted(thresholds):
+                thresholds = np.fromiter(
+                    (categories[key] for key in expected_keys),
+                    dtype=np.float64,
+                    count=len(expected_keys),
+                )
+                if not np.all(np.diff(thresholds) >= 0):
                     validation_result["warnings"].append(
                         "Category thresholds may not be in expected order"
                     )
@@ -235,48 +424,76 @@ class AlertCoordinator:
                 "Alert service not initialized. Call initialize_alert_service() first."
             )
 
-        print(f" Applying alert category filter: {alert_category}")
+        logger.info(" Applying alert category filter: %s", alert_category)
 
-        if alert_category == "T":
-            # Use AlertService for complex threshold alert filtering
-            filtered_df = self.alert_service.filter_by_threshold_alerts(df)
-        else:
-            # Use AlertService for category mask generation with validation
-            try:
-                mask = self.alert_service.get_alert_category_mask(df, alert_category)
-                before_count = len(df)
-                filtered_df = df[mask]
-                after_count = len(filtered_df)
-
-                print(
-                    f"Alert category '{alert_category}' filter applied: {before_count} → {after_count} subjects"
-                )
+        filter_fn = self._filter_dispatch.get(alert_category)
+        if filter_fn is None:
+            return self._filter_by_category_mask(df, alert_category)
+        return filter_fn(df)
 
-                # Additional validation for category filtering
-                if alert_category in ["NS", "B", "G", "SB", "SG"]:
-                    # Verify the filtering worked correctly
-                    percentile_col = (
-                        "overall_percentile_category"
-                        if "overall_percentile_category" in filtered_df.columns
-                        else "percentile_category"
-                    )
-                    if percentile_col in filtered_df.columns and not filtered_df.empty:
-                        actual_categories = filtered_df[percentile_col].unique()
-                        if len(actual_categories) > 1 or (
-                            len(actual_categories) == 1
-                            and actual_categories[0] != alert_category
-                        ):
-                            print(
-                                f" WARNING: Filter validation failed. Expected '{alert_category}', found: {actual_categories}"
-                            )
-
-            except Exception as e:
-                print(
-                    f" Error applying alert category filter '{alert_category}': {str(e)}"
-                )
-                # Return original dataframe on error to avoid breaking the UI
-                filtered_df = df
+    def _build_filter_dispatch(self) -> Dict[str, Callable[[pd.DataFrame], Any]]:
+        """Map each known alert category to its specialised filter function"""
+        dispatch = {
+            category: partial(
+                self._filter_by_category_code, alert_category=category, code=code
+            )
+            for category, code in PERCENTILE_CATEGORY_CODES.items()
+        }
+        dispatch["T"] = self._filter_threshold_alerts
+        return dispatch
+
+    def _filter_threshold_alerts(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keep subjects with any threshold alert (mask shared with aggregation)"""
+        before_count = len(df)
+        filtered_df = df[self._cached_mask(df, "T")]
+        logger.info(
+            "Threshold filter applied: %d → %d subjects",
+            before_count,
+            len(filtered_df),
+        )
+        return filtered_df
 
+    def _filter_by_category_code(
+        self, df: pd.DataFrame, alert_category: str, code: int
+    ) -> pd.DataFrame:
+        """Keep subjects in one percentile category using the shared category masks"""
+        try:
+            masks = self._cached_category_masks(df)
+            filtered_df = df.iloc[np.flatnonzero(masks[code])]
+        except Exception as e:
+            logger.error(
+                " Error applying alert category filter '%s': %s", alert_category, e
+            )
+            # Return original dataframe on error to avoid breaking the UI
+            return df
+
+        logger.info(
+            "Alert category '%s' filter applied: %d → %d subjects",
+            alert_category,
+            len(df),
+            len(filtered_df),
+        )
+        return filtered_df
+
+    def _filter_by_category_mask(
+        self, df: pd.DataFrame, alert_category: str
+    ) -> pd.DataFrame:
+        """Fallback for unrecognised categories using AlertService's mask"""
+        try:
+            filtered_df = df[self._cached_mask(df, alert_category)]
+        except Exception as e:
+            logger.error(
+                " Error applying alert category filter '%s': %s", alert_category, e
+            )
+            # Return original dataframe on error to avoid breaking the UI
+            return df
+
+        logger.info(
+            "Alert category '%s' filter applied: %d → %d subjects",
+            alert_category,
+            len(df),
+            len(filtered_df),
+        )
         return filtered_df
 
     def aggregate_alert_categories(self, df: pd.DataFrame) -> Dict[str, int]:
@@ -294,7 +511,9 @@ class AlertCoordinator:
 
         # Ensure alert service is initialized
         if self.alert_service is None:
-            print(" Alert service not initialized, returning basic aggregation")
+            logger.warning(
+                " Alert service not initialized, returning basic aggregation"
+            )
             return self._fallback_aggregation(df)
 
         try:
@@ -305,50 +524,60 @@ class AlertCoordinator:
             return aggregation_results
 
         except Exception as e:
-            print(f"Error in alert category aggregation: {str(e)}")
+            logger.error("Error in alert category aggregation: %s", e)
             return self._fallback_aggregation(df)
 
     def _fallback_aggregation(self, df: pd.DataFrame) -> Dict[str, int]:
         """Fallback aggregation method when alert service is not available"""
-        percentile_col = (
-            "overall_percentile_category"
-            if "overall_percentile_category" in df.columns
-            else "percentile_category"
-        )
+        percentile_col = self._get_percentile_column(df)
         if percentile_col in df.columns:
-            return df[percentile_col].value_counts().to_dict()
+            counts = df[percentile_col].value_counts()
+            # Categorical columns report unobserved categories with a zero count
+            return counts[counts > 0].to_dict()
         return {}
 
+    def _get_percentile_column(self, df: pd.DataFrame) -> str:
+        """Name of the percentile category column, resolved once per dataframe"""
+        memo = self._memo_for(df)
+        if "percentile_col" not in memo:
+            memo["percentile_col"] = (
+                "overall_percentile_category"
+                if "overall_percentile_category" in df.columns
+                else "percentile_category"
+            )
+        return memo["percentile_col"]
+
     def _count_standard_categories(self, df: pd.DataFrame) -> Dict[str, int]:
         """Count subjects in each standard percentile category"""
-        aggregation_results = {}
-        standard_categories = ["NS", "SB", "B", "N", "G", "SG"]
+        percentile_col = self._get_percentile_column(df)
+        if percentile_col not in df.columns:
+            logger.error(
+                "Error counting categories: missing column '%s'", percentile_col
+            )
+            return {}
 
-        for category in standard_categories:
-            try:
-                mask = self.alert_service.get_alert_category_mask(df, category)
-                count = mask.sum() if hasattr(mask, "sum") else 0
-                if count > 0:
-                    aggregation_results[category] = count
-            except Exception as e:
-                print(f"Error counting category '{category}': {str(e)}")
-                aggregation_results[category] = 0
+        # Reduce the shared (n_categories, n_rows) masks to per-category counts
+        counts = self._cached_category_masks(df).sum(axis=1)
 
-        return aggregation_results
+        return {
+            category: int(count)
+            for category, count in zip(PERCENTILE_CATEGORY_ORDER, counts)
+            if count > 0
+        }
 
     def _count_threshold_alerts(
         self, df: pd.DataFrame, aggregation_results: Dict[str, int]
     ):
         """Count threshold alerts and add to aggregation results"""
         try:
-            threshold_mask = self.alert_service.get_alert_category_mask(df, "T")
+            threshold_mask = self._cached_mask(df, "T")
             threshold_count = (
                 threshold_mask.sum() if hasattr(threshold_mask, "sum") else 0
             )
             if threshold_count > 0:
                 aggregation_results["T"] = threshold_count
         except Exception as e:
-            print(f"Error counting threshold alerts: {str(e)}")
+            logger.error("Error counting threshold alerts: %s", e)
             aggregation_results["T"] = 0
 
     def _validate_and_adjust_counts(
@@ -358,11 +587,13 @@ class AlertCoordinator:
         total_aggregated = sum(aggregation_results.values())
         actual_total = len(df)
 
-        print(f"Alert category aggregation: {aggregation_results}")
-        print(f"Total subjects: {actual_total}, Aggregated: {total_aggregated}")
+        logger.info("Alert category aggregation: %s", aggregation_results)
+        logger.info(
+            "Total subjects: %d, Aggregated: %d", actual_total, total_aggregated
+        )
 
         # Add any missing subjects to 'Unknown' category if needed
         if total_aggregated < actual_total:
             missing_count = actual_total - total_aggregated
             aggregation_results["Unknown"] = missing_count
-            print(f"Added {missing_count} subjects to 'Unknown' category")
+            logger.info("Added %d subjects to 'Unknown' category", missing_count)
@@ -4,13 +4,152 @@ Alert service for AIND Dashboard
 This module provides services for managing and calculating alerts based on percentile rankings.
 """
 
-from typing import Any, Dict, List, Optional
+import math
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from app_utils.simple_logger import get_logger
 
+# Labels for the bins produced by searching the SB/B/N/G thresholds
+PERCENTILE_BIN_LABELS = np.array(["SB", "B", "N", "G", "SG"], dtype=object)
+
+# Maximum number of subjects whose not scored (NS) reasons are cached
+NS_REASON_CACHE_SIZE = 512
+
+# Session-level overall percentiles are cached for this many subject
+# selections; smaller one-off selections are cheap enough to recompute
+OVERALL_PERCENTILE_CACHE_SIZE = 8
+OVERALL_PERCENTILE_CACHE_MIN_SUBJECTS = 16
+
+# Features the most recent session needs for scoring, and the NS reason for
+# each combination of them being missing (indexed by a bit per feature)
+NS_REQUIRED_FEATURES = ["total_trials", "finished_trials", "ignore_rate"]
+NS_MISSING_FEATURE_REASONS = [""] + [
+    "Missing features: "
+    + ", ".join(
+        feature
+        for bit, feature in enumerate(NS_REQUIRED_FEATURES)
+        if missing & (1 << bit)
+    )
+    for missing in range(1, 1 << len(NS_REQUIRED_FEATURES))
+]
+
+# Features whose session percentiles are attached to quantile alerts
+QUANTILE_ALERT_FEATURES = [
+    "finished_trials",
+    "ignore_rate",
+    "total_trials",
+    "foraging_performance",
+    "abs(bias_naive)",
+]
+
+# Individual threshold alerts are encoded as "T | <value>" or
+# "T | <stage> | <value>", so a prefix test identifies them
+THRESHOLD_ALERT_PREFIX = "T |"
+THRESHOLD_ALERT_COLUMNS = [
+    "total_sessions_alert",
+    "stage_sessions_alert",
+    "water_day_total_alert",
+]
+
+# Most recent session columns read when building threshold alerts
+THRESHOLD_SESSION_COLUMNS = [
+    "subject_id",
+    "session_date",
+    "session",
+    "current_stage_actual",
+    "water_day_total",
+]
+
+# Overall threshold alert values, stored as a Categorical by ThresholdAnalyzer
+THRESHOLD_ALERT_DTYPE = pd.CategoricalDtype(categories=["T", "N", "NS"])
+
+# General threshold alert configuration for the table display cache
+THRESHOLD_CONFIG = {
+    "session": {"condition": "gt", "value": 40},
+    "water_day_total": {"condition": "gt", "value": 3.5},
+}
+
+# Session-count thresholds per curriculum stage; only these stages are
+# compared, so session stages are cast to a Categorical over them
+STAGE_SESSION_THRESHOLDS = {
+    "STAGE_1": 5,
+    "STAGE_2": 5,
+    "STAGE_3": 6,
+    "STAGE_4": 10,
+    "STAGE_FINAL": 10,
+    "GRADUATED": 20,
+}
+STAGE_DTYPE = pd.CategoricalDtype(categories=list(STAGE_SESSION_THRESHOLDS))
+STAGE_THRESHOLDS_ARR = np.array(list(STAGE_SESSION_THRESHOLDS.values()), dtype=np.int32)
+
+# Ordered alert categories for the percentile category columns, stored as a
+# Categorical so masks and counts compare int8 codes instead of strings
+PERCENTILE_CATEGORY_ORDER = ["NS", "SB", "B", "N", "G", "SG"]
+PERCENTILE_CATEGORY_DTYPE = pd.CategoricalDtype(
+    categories=PERCENTILE_CATEGORY_ORDER, ordered=True
+)
+PERCENTILE_CATEGORY_CODES = {
+    category: code for code, category in enumerate(PERCENTILE_CATEGORY_ORDER)
+}
+
+# Combined percentile and threshold alerts shown in the table ("G, T", "T", ...)
+COMBINED_ALERT_DTYPE = pd.CategoricalDtype(
+    categories=PERCENTILE_CATEGORY_ORDER
+    + [f"{category}, T" for category in PERCENTILE_CATEGORY_ORDER[1:]]
+    + ["T"]
+)
+
+# Combined alert code for each percentile category code (rows), without and
+# with a threshold alert (columns)
+COMBINED_ALERT_CODES = np.array(
+    [
+        [
+            COMBINED_ALERT_DTYPE.categories.get_loc(category),
+            COMBINED_ALERT_DTYPE.categories.get_loc(
+                "T" if category == "NS" else f"{category}, T"
+            ),
+        ]
+        for category in PERCENTILE_CATEGORY_ORDER
+    ],
+    dtype=np.int8,
+)
+
+
+def _feature_percentile_kernel(
+    percentiles: np.ndarray, thresholds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bin a subjects-by-features percentile matrix and average each row
+
+    Parameters:
+        percentiles (np.ndarray): Float matrix of percentiles, NaN where missing
+        thresholds (np.ndarray): Sorted SB/B/N/G category upper bounds
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Bin index into PERCENTILE_BIN_LABELS per
+        cell (-1 where missing), and each row's mean of its present percentiles
+        (NaN when none are present)
+    """
+    present = ~np.isnan(percentiles)
+    bins = np.where(present, np.searchsorted(thresholds, percentiles, side="right"), -1)
+
+    # Average every row at once; rows without percentiles stay NaN
+    present_counts = present.sum(axis=1)
+    overall = np.divide(
+        np.where(present, percentiles, 0.0).sum(axis=1),
+        present_counts,
+        out=np.full(len(percentiles), np.nan),
+        where=present_counts > 0,
+    )
+    return bins, overall
+
 
 class AlertService:
     """
@@ -26,6 +165,17 @@ class AlertService:
         "SG": 100,  # Significantly Good: > 93.5% ( > +2.75 std dev)
     }
 
+    # Human-readable descriptions of the percentile categories
+    CATEGORY_DESCRIPTIONS = MappingProxyType(
+        {
+            "SB": "Significantly Below Average",
+            "B": "Below Average",
+            "N": "Average",
+            "G": "Above Average",
+            "SG": "Significantly Above Average",
+        }
+    )
+
     # Default minimum sessions for eligibility
     DEFAULT_MIN_SESSIONS = 1
 
@@ -47,12 +197,23 @@ class AlertService:
             "min_sessions": self.DEFAULT_MIN_SESSIONS,
         }
 
+        # Category label and description of each percentile bin, indexed by bin
+        self._category_labels = PERCENTILE_BIN_LABELS.tolist()
+        self._category_descriptions = [
+            self.get_category_description(label) for label in self._category_labels
+        ]
+
+        # Initialize alert caches
+        self._reset_quantile_alerts()
+        self._ns_reason_cache = OrderedDict()
+        self._overall_percentile_cache = OrderedDict()
+        self._ns_reason_source = None
+
         # Override defaults if provided with config
         if config:
             self._update_config(config)
-
-        # Initialize alert caches
-        self._quantile_alerts = {}
+        else:
+            self._build_category_thresholds()
 
     def _update_config(self, config: Dict[str, Any]) -> None:
         """
@@ -68,6 +229,59 @@ class AlertService:
         if "feature_config" in config:
             self.config["feature_config"].update(config["feature_config"])
 
+        self._build_category_thresholds()
+        self._ns_reason_cache.clear()
+
+        # Cached categories were binned with the previous thresholds
+        self._reset_quantile_alerts()
+
+    def _reset_quantile_alerts(self) -> None:
+        """
+        Drop every cached quantile alert so the next lookup recalculates them
+        """
+        self._quantile_alerts = {}
+        self._quantile_alerts_df = None
+        # Subjects already scored, including those that came back with no sessions
+        self._quantile_scored_ids = set()
+        self._quantile_alerts_complete = False
+
+    def _build_category_thresholds(self) -> None:
+        """
+        Rebuild the sorted upper bounds used to bin percentiles into categories
+        """
+        categories = self.config["percentile_categories"]
+        self._category_thresholds = np.array(
+            [categories["SB"], categories["B"], categories["N"], categories["G"]],
+            dtype=float,
+        )
+
+        # Plain-float copy for scalar lookups, which bisect faster than NumPy
+        self._category_bounds = tuple(self._category_thresholds.tolist())
+
+    def map_percentiles_to_categories(
+        self, percentiles, missing: str = "Unknown"
+    ) -> np.ndarray:
+        """
+        Map an array of percentile values to their categories in one pass
+
+        Parameters:
+            percentiles (array-like): Percentile values to map
+            missing (str): Category assigned to missing (NaN/None) values
+
+        Returns:
+            np.ndarray: Object array of category abbreviations (SB, B, N, G, SG)
+        """
+        values = np.asarray(percentiles, dtype=float)
+
+        # Missing values index the sentinel label appended after SG
+        labels = np.append(PERCENTILE_BIN_LABELS, missing)
+        bins = np.where(
+            np.isnan(values),
+            -1,
+            np.searchsorted(self._category_thresholds, values, side="right"),
+        )
+        return labels[bins]
+
     def map_percentile_to_category(self, percentile: float) -> str:
         """
         Map a percentile value to its corresponding category
@@ -78,21 +292,13 @@ class AlertService:
         Returns:
             str: Category abbreviation (SB, B, N, G, SG)
         """
-        if percentile is None or np.isnan(percentile):
-            return "Unknown"
+        return self._percentile_category(percentile, "Unknown")
 
-        categories = self.config["percentile_categories"]
-
-        if percentile < categories["SB"]:
-            return "SB"
-        elif percentile < categories["B"]:
-            return "B"
-        elif percentile < categories["N"]:
-            return "N"
-        elif percentile < categories["G"]:
-            return "G"
-        else:
-            return "SG"
+    def _percentile_category(self, percentile: float, missing: str) -> str:
+        """Bin a single percentile against the cached category thresholds"""
+        if percentile is None or math.isnan(percentile):
+            return missing
+        return PERCENTILE_BIN_LABELS[bisect_right(self._category_bounds, percentile)]
 
     def get_category_description(self, category: str) -> str:
         """
@@ -104,14 +310,7 @@ class AlertService:
         Returns:
             str: Description of the category
         """
-        descriptions = {
-            "SB": "Significantly Below Average",
-            "B": "Below Average",
-            "N": "Average",
-            "G": "Above Average",
-            "SG": "Significantly Above Average",
-        }
-        return descriptions.get(category, "Unknown")
+        return self.CATEGORY_DESCRIPTIONS.get(category, "Unknown")
 
     def _validate_analyzer(self) -> bool:
         """
@@ -152,81 +351,208 @@ class AlertService:
         if not self._validate_analyzer():
             return {}
 
-        # Get session-level overall percentiles using the new approach
-        session_percentiles = self.app_utils.get_session_overall_percentiles(
-            subject_ids=subject_ids
+        return self._calculate_quantile_alerts(subject_ids)
+
+    def _calculate_quantile_alerts(
+        self, subject_ids: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Private method to calculate quantile alerts once analyzers are validated
+
+        Parameters:
+            subject_ids: Optional[List[str]]
+                List of subject IDs to calculate alerts for
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping subject IDs to their quantile alerts
+        """
+        # A full calculation replaces every cached entry
+        if subject_ids is None:
+            session_percentiles = self.app_utils.get_session_overall_percentiles()
+
+            # Columnar alerts are the canonical store; dicts are packed from them
+            alerts_df = self._build_quantile_alerts_frame(session_percentiles)
+            self._quantile_alerts_df = alerts_df
+            self._quantile_alerts = self._quantile_alerts_from_frame(alerts_df)
+            self._quantile_alerts_complete = True
+            return self._quantile_alerts
+
+        # Targeted calculation only scores subjects that were not scored yet
+        cached = self._quantile_alerts
+        missing = []
+        if not self._quantile_alerts_complete:
+            missing = [
+                sid
+                for sid in dict.fromkeys(subject_ids)
+                if sid not in self._quantile_scored_ids
+            ]
+        if missing:
+            session_percentiles = self.app_utils.get_session_overall_percentiles(
+                subject_ids=missing
+            )
+            new_df = self._build_quantile_alerts_frame(session_percentiles)
+            if self._quantile_alerts_df is None:
+                self._quantile_alerts_df = new_df
+            else:
+                self._quantile_alerts_df = pd.concat([self._quantile_alerts_df, new_df])
+            cached = {**cached, **self._quantile_alerts_from_frame(new_df)}
+            self._quantile_alerts = cached
+            self._quantile_scored_ids.update(missing)
+
+        return {sid: cached[sid] for sid in subject_ids if sid in cached}
+
+    def get_quantile_alerts_frame(
+        self, subject_ids: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Get the most recently calculated quantile alerts as a dataframe
+
+        Parameters:
+            subject_ids: Optional[List[str]]
+                List of subject IDs to keep (all subjects if None)
+
+        Returns:
+            pd.DataFrame: One row per subject (indexed by subject_id) with the
+                overall and feature percentiles and their categories
+        """
+        if self._quantile_alerts_df is None:
+            return pd.DataFrame()
+        if subject_ids is None:
+            return self._quantile_alerts_df
+        return self._quantile_alerts_df[
+            self._quantile_alerts_df.index.isin(subject_ids)
+        ]
+
+    def _build_quantile_alerts_frame(
+        self, session_percentiles: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Private method to compute quantile alert columns for every session at once
+
+        Percentiles are stored as float64 so the packed alerts keep their full
+        precision; categories are Categoricals backed by int8 codes.
+
+        Parameters:
+            session_percentiles (pd.DataFrame): Session-level overall and feature percentiles
+
+        Returns:
+            pd.DataFrame: Alerts indexed by subject_id with overall_percentile,
+                alert_category, strata, ns_reason and per-feature
+                {feature}_percentile / {feature}_category columns
+        """
+
+        def column(name, default):
+            if name in session_percentiles.columns:
+                return session_percentiles[name]
+            return pd.Series(default, index=session_percentiles.index, dtype=object)
+
+        # Pull the session columns out once instead of boxing every row
+        session_subject_ids = session_percentiles["subject_id"].to_numpy()
+        overall_values = column("session_overall_percentile", np.nan).to_numpy(
+            dtype=float, na_value=np.nan
         )
+        not_scored = np.isnan(overall_values)
+
+        # Look up the not scored reasons in one pass over the session data
+        ns_reasons = np.full(len(session_subject_ids), None, dtype=object)
+        if not_scored.any():
+            reasons = self._precompute_ns_reasons(session_subject_ids[not_scored])
+            ns_reasons[not_scored] = [
+                reasons[subject_id] for subject_id in session_subject_ids[not_scored]
+            ]
 
-        # Create a dictionary to store alerts by subject ID
-        alerts = {}
+        columns = {
+            "overall_percentile": overall_values,
+            "alert_category": pd.Categorical(
+                self.map_percentiles_to_categories(overall_values, missing="NS"),
+                dtype=PERCENTILE_CATEGORY_DTYPE,
+            ),
+            # Kept as object so missing strata stay None rather than NaN
+            "strata": pd.Series(column("strata", "Unknown").to_numpy(), dtype=object),
+            "ns_reason": pd.Series(ns_reasons, dtype=object),
+        }
+
+        # Categorize each feature's session percentiles in one vectorized pass
+        for feature in QUANTILE_ALERT_FEATURES:
+            session_percentile_col = f"{feature}_session_percentile"
+            if session_percentile_col in session_percentiles.columns:
+                values = session_percentiles[session_percentile_col].to_numpy(
+                    dtype=float, na_value=np.nan
+                )
+                columns[f"{feature}_percentile"] = values
+                columns[f"{feature}_category"] = pd.Categorical(
+                    self.map_percentiles_to_categories(values, missing=None),
+                    dtype=PERCENTILE_CATEGORY_DTYPE,
+                )
 
-        # Process each subject's most recent session
-        for _, row in session_percentiles.iterrows():
-            subject_id = row["subject_id"]
+        return pd.DataFrame(columns).set_axis(
+            pd.Index(session_subject_ids, name="subject_id")
+        )
+
+    def _quantile_alerts_from_frame(
+        self, alerts_df: pd.DataFrame
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Private method to pack columnar quantile alerts into per-subject dicts
 
-            # Extract overall percentile from session data
-            overall_percentile = row.get("session_overall_percentile")
+        Parameters:
+            alerts_df (pd.DataFrame): Alerts built by _build_quantile_alerts_frame
 
-            # Skip subjects with no percentile (not scored)
-            if pd.isna(overall_percentile):
-                # Get reason for not scored
-                ns_reason = self.get_not_scored_reason(subject_id)
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping subject IDs to their quantile alerts
+        """
+        subject_ids = alerts_df.index.to_numpy()
+        overall_values = alerts_df["overall_percentile"].to_numpy(dtype=float)
+        overall_categories = alerts_df["alert_category"].to_numpy()
+        strata = alerts_df["strata"].to_numpy()
+        ns_reasons = alerts_df["ns_reason"].to_numpy()
+        not_scored = np.isnan(overall_values)
+
+        feature_columns = []
+        for feature in QUANTILE_ALERT_FEATURES:
+            if f"{feature}_percentile" in alerts_df.columns:
+                values = alerts_df[f"{feature}_percentile"].to_numpy(dtype=float)
+                feature_columns.append(
+                    (
+                        feature,
+                        values,
+                        alerts_df[f"{feature}_category"].to_numpy(),
+                        ~np.isnan(values),
+                    )
+                )
 
-                # Create alert with not scored status
+        alerts = {}
+        for position, subject_id in enumerate(subject_ids):
+            # Subjects with no percentile are not scored
+            if not_scored[position]:
                 alerts[subject_id] = {
                     "subject_id": subject_id,
                     "overall_percentile": None,
                     "alert_category": "NS",
-                    "ns_reason": ns_reason,
-                    "strata": row.get("strata", "Unknown"),
+                    "ns_reason": ns_reasons[position],
+                    "strata": strata[position],
                 }
                 continue
 
-            # Map percentile to category using configured thresholds
-            alert_category = self.map_percentile_to_category(overall_percentile)
-
-            # Create alert
             alerts[subject_id] = {
                 "subject_id": subject_id,
-                "overall_percentile": overall_percentile,
-                "alert_category": alert_category,
-                "strata": row.get("strata", "Unknown"),
+                "overall_percentile": overall_values[position],
+                "alert_category": overall_categories[position],
+                "strata": strata[position],
             }
 
-            # Add feature-specific percentiles from session data
-            feature_percentiles = {}
-            for feature in [
-                "finished_trials",
-                "ignore_rate",
-                "total_trials",
-                "foraging_performance",
-                "abs(bias_naive)",
-            ]:
-                session_percentile_col = f"{feature}_session_percentile"
-
-                # Check if feature percentile is in the session data
-                if session_percentile_col in row and not pd.isna(
-                    row[session_percentile_col]
-                ):
-                    feature_percentile = row[session_percentile_col]
-                    feature_category = self.map_percentile_to_category(
-                        feature_percentile
-                    )
-
-                    # Add to feature percentiles
-                    feature_percentiles[feature] = {
-                        "percentile": feature_percentile,
-                        "category": feature_category,
-                    }
-
-            # Add feature percentiles to alert
+            # Attach feature-specific percentiles present for this session
+            feature_percentiles = {
+                feature: {
+                    "percentile": values[position],
+                    "category": categories[position],
+                }
+                for feature, values, categories, valid in feature_columns
+                if valid[position]
+            }
             if feature_percentiles:
                 alerts[subject_id]["feature_percentiles"] = feature_percentiles
 
-        # Store alerts for later retrieval
-        self._quantile_alerts = alerts
-
-        # Return alerts dictionary
         return alerts
 
     def get_quantile_alerts(
@@ -246,21 +572,29 @@ class AlertService:
         if not self._validate_analyzer():
             return {}
 
-        # Calculate alerts if not already calculated
-        if not hasattr(self, "_quantile_alerts") or self._quantile_alerts is None:
-            self.calculate_quantile_alerts()
+        return self._get_quantile_alerts(subject_ids)
 
-        # Return all alerts if no subject IDs specified
+    def _get_quantile_alerts(
+        self, subject_ids: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Private method to look up quantile alerts once analyzers are validated
+
+        Parameters:
+            subject_ids: Optional[List[str]]
+                List of subject IDs to get alerts for
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping subject IDs to their quantile alerts
+        """
+        # Return all alerts if no subject IDs specified, calculating them once
         if subject_ids is None:
+            if not self._quantile_alerts_complete:
+                self._calculate_quantile_alerts()
             return self._quantile_alerts
 
-        # Otherwise, filter alerts for specified subjects
-        result = {}
-        for subject_id in subject_ids:
-            if subject_id in self._quantile_alerts:
-                result[subject_id] = self._quantile_alerts[subject_id]
-
-        return result
+        # Otherwise only score the requested subjects missing from the cache
+        return self._calculate_quantile_alerts(subject_ids)
 
     def map_overall_percentile_to_category(self, overall_percentile):
         """
@@ -272,21 +606,7 @@ class AlertService:
         Returns:
             str: Category abbreviation (SB, B, N, G, SG)
         """
-        if overall_percentile is None or np.isnan(overall_percentile):
-            return "NS"  # Not scored
-
-        categories = self.config["percentile_categories"]
-
-        if overall_percentile < categories["SB"]:
-            return "SB"
-        elif overall_percentile < categories["B"]:
-            return "B"
-        elif overall_percentile < categories["N"]:
-            return "N"
-        elif overall_percentile < categories["G"]:
-            return "G"
-        else:
-            return "SG"
+        return self._percentile_category(overall_percentile, "NS")  # NS: not scored
 
     def get_not_scored_reason(self, subject_id: str) -> str:
         """
@@ -298,86 +618,144 @@ class AlertService:
         Returns:
             str: Reason why the subject is not scored
         """
+        return self._precompute_ns_reasons([subject_id])[subject_id]
+
+    def _precompute_ns_reasons(self, subject_ids) -> Dict[str, str]:
+        """
+        Get the not scored (NS) reasons for several subjects in one pass
+
+        The session data is filtered and grouped by subject once instead of
+        being scanned again for every subject.
+
+        Parameters:
+            subject_ids (Iterable[str]): The subject IDs to check
+
+        Returns:
+            Dict[str, str]: Mapping of subject ID to the reason it is not scored
+        """
+        subject_ids = list(subject_ids)
         try:
             if self.app_utils is None:
-                return "No app_utils available"
+                return dict.fromkeys(subject_ids, "No app_utils available")
 
-            # Get session data for this subject
             session_data = self.app_utils.get_session_data(use_cache=True)
             if session_data.empty:
-                return "No session data"
+                return dict.fromkeys(subject_ids, "No session data")
+
+            cache = self._ns_reason_cache_for(session_data)
+            reasons = {}
+            uncached = []
+            for subject_id in subject_ids:
+                if subject_id in cache:
+                    cache.move_to_end(subject_id)
+                    reasons[subject_id] = cache[subject_id]
+                else:
+                    uncached.append(subject_id)
+            if not uncached:
+                return reasons
+
+            computed = dict.fromkeys(uncached, "Subject not found")
+            computed.update(
+                self._classify_ns_reasons(
+                    session_data[session_data["subject_id"].isin(uncached)]
+                )
+            )
 
-            # Filter for this subject
-            subject_sessions = session_data[session_data["subject_id"] == subject_id]
-            if subject_sessions.empty:
-                return "Subject not found"
+            for subject_id, reason in computed.items():
+                cache[subject_id] = reason
+                if len(cache) > NS_REASON_CACHE_SIZE:
+                    cache.popitem(last=False)
+            reasons.update(computed)
+            return reasons
 
-            # Check session count requirements
-            session_count_reason = self._check_session_count_requirements(
-                subject_sessions
-            )
-            if session_count_reason:
-                return session_count_reason
+        except Exception as e:
+            return dict.fromkeys(subject_ids, f"Error determining reason: {str(e)}")
+
+    def _ns_reason_cache_for(self, session_data: pd.DataFrame) -> OrderedDict:
+        """
+        LRU cache of NS reasons for the given session data
 
-            # Check trial requirements
-            trial_reason = self._check_trial_requirements(subject_sessions)
-            if trial_reason:
-                return trial_reason
+        The cache is emptied whenever a different session dataframe is passed
+        (for example after the data is reloaded). The frame is tracked by weak
+        reference so a recycled id cannot revive stale reasons.
 
-            # Check feature availability
-            feature_reason = self._check_feature_availability(subject_sessions)
-            if feature_reason:
-                return feature_reason
+        Parameters:
+            session_data (pd.DataFrame): Session data the reasons are derived from
+
+        Returns:
+            OrderedDict: Mapping of subject ID to cached NS reason
+        """
+        source = self._ns_reason_source() if self._ns_reason_source else None
+        if source is not session_data:
+            self._ns_reason_source = weakref.ref(session_data)
+            self._ns_reason_cache.clear()
+        return self._ns_reason_cache
 
-            # Default reason
-            return "Scoring criteria not met"
+    def _classify_ns_reasons(self, sessions: pd.DataFrame) -> Dict[str, str]:
+        """
+        Classify the NS reason of every subject in the given sessions at once
 
-        except Exception as e:
-            return f"Error determining reason: {str(e)}"
+        Checks, in order of precedence: too few sessions, no finished trials in
+        the most recent session, and required features missing from it. Each
+        subject gets a reason code from array comparisons; codes are turned
+        into strings once at the end.
+
+        Parameters:
+            sessions (pd.DataFrame): Session rows of the subjects to classify
+
+        Returns:
+            Dict[str, str]: Mapping of subject ID to the reason it is not scored
+        """
+        if sessions.empty:
+            return {}
+
+        subject_codes, subjects = pd.factorize(sessions["subject_id"])
+        session_counts = np.bincount(subject_codes)
+
+        # Most recent session of each subject: the first row with the latest
+        # date, or the subject's first row when none of its dates are known
+        _, most_recent = np.unique(subject_codes, return_index=True)
+        dates = pd.Series(sessions["session_date"].to_numpy())
+        dated = dates.notna().to_numpy()
+        latest = dates[dated].groupby(subject_codes[dated]).idxmax()
+        most_recent[latest.index.to_numpy()] = latest.to_numpy()
+
+        def latest_values(feature):
+            if feature not in sessions.columns:
+                return np.full(len(subjects), np.nan)
+            return sessions[feature].to_numpy(dtype=float, na_value=np.nan)[most_recent]
+
+        finished_trials = latest_values("finished_trials")
+        missing_bits = np.zeros(len(subjects), dtype=np.int8)
+        for bit, feature in enumerate(NS_REQUIRED_FEATURES):
+            missing_bits |= np.isnan(latest_values(feature)).astype(np.int8) << bit
 
-    def _check_session_count_requirements(
-        self, subject_sessions: pd.DataFrame
-    ) -> Optional[str]:
-        """Check if subject has sufficient sessions for scoring"""
-        total_sessions = len(subject_sessions)
         min_sessions = self.config.get(
             "min_sessions_for_scoring", self.DEFAULT_MIN_SESSIONS
         )
+        reason_codes = np.select(
+            [
+                session_counts < min_sessions,
+                np.isnan(finished_trials) | (finished_trials == 0),
+                missing_bits > 0,
+            ],
+            [1, 2, 3],
+            default=0,
+        )
 
-        if total_sessions < min_sessions:
-            return f"Insufficient sessions: {total_sessions} < {min_sessions}"
-        return None
-
-    def _check_trial_requirements(
-        self, subject_sessions: pd.DataFrame
-    ) -> Optional[str]:
-        """Check if subject has sufficient trials for scoring"""
-        most_recent = subject_sessions.sort_values(
-            "session_date", ascending=False
-        ).iloc[0]
-        finished_trials = most_recent.get("finished_trials")
-
-        if pd.isna(finished_trials) or finished_trials == 0:
-            return "No finished trials"
-        return None
-
-    def _check_feature_availability(
-        self, subject_sessions: pd.DataFrame
-    ) -> Optional[str]:
-        """Check if required features are available for scoring"""
-        most_recent = subject_sessions.sort_values(
-            "session_date", ascending=False
-        ).iloc[0]
-        required_features = ["total_trials", "finished_trials", "ignore_rate"]
-        missing_features = []
-
-        for feature in required_features:
-            if pd.isna(most_recent.get(feature)):
-                missing_features.append(feature)
-
-        if missing_features:
-            return f"Missing features: {', '.join(missing_features)}"
-        return None
+        reasons = {}
+        for subject_id, code, count, bits in zip(
+            subjects, reason_codes.tolist(), session_counts.tolist(), missing_bits
+        ):
+            if code == 1:
+                reasons[subject_id] = f"Insufficient sessions: {count} < {min_sessions}"
+            elif code == 2:
+                reasons[subject_id] = "No finished trials"
+            elif code == 3:
+                reasons[subject_id] = NS_MISSING_FEATURE_REASONS[bits]
+            else:
+                reasons[subject_id] = "Scoring criteria not met"
+        return reasons
 
     def filter_by_threshold_alerts(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -434,13 +812,14 @@ class AlertService:
         # Check each alert column and gather value counts
         for col in alert_columns:
             if col in df.columns:
-                # Get value counts for this column
-                value_counts = df[col].value_counts()
-                validation_results["value_counts"][col] = value_counts.to_dict()
+                # Value counts, missing count and unique count in one pass
+                value_counts, missing_values, unique_values = self._profile_column(
+                    df[col]
+                )
+                validation_results["value_counts"][col] = value_counts
 
                 # Calculate quality metrics
                 total_values = len(df)
-                missing_values = df[col].isna().sum()
 
                 validation_results["quality_metrics"][col] = {
                     "total_values": total_values,
@@ -448,17 +827,48 @@ class AlertService:
                     "missing_percentage": (
                         (missing_values / total_values * 100) if total_values > 0 else 0
                     ),
-                    "unique_values": df[col].nunique(),
+                    "unique_values": unique_values,
                 }
             else:
                 validation_results["missing_columns"].append(col)
 
         # Analyze threshold patterns specifically
-        threshold_patterns = self._analyze_threshold_patterns(df)
+        threshold_patterns = self._analyze_threshold_patterns(
+            df, self._threshold_pattern_masks(df)
+        )
         validation_results["threshold_patterns"] = threshold_patterns
 
         return validation_results
 
+    def _profile_column(self, values: pd.Series) -> Tuple[Dict[Any, int], Any, int]:
+        """
+        Private method to count values, missing entries and unique values at once
+
+        The column is encoded to integer codes a single time (reusing the codes
+        of Categorical columns) and every statistic is derived from them.
+
+        Parameters:
+            values (pd.Series): Alert column to profile
+
+        Returns:
+            Tuple[Dict[Any, int], Any, int]: Value counts (most frequent first),
+                number of missing values and number of distinct values
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            labels = values.cat.categories.tolist()
+        else:
+            codes, uniques = pd.factorize(values)
+            labels = uniques.tolist()
+
+        present = codes >= 0
+        counts = np.bincount(codes[present], minlength=len(labels))
+        order = np.argsort(-counts, kind="stable")
+        value_counts = {
+            labels[i]: count for i, count in zip(order.tolist(), counts[order].tolist())
+        }
+        return value_counts, (~present).sum(), int(np.count_nonzero(counts))
+
     def get_alert_category_mask(
         self, df: pd.DataFrame, alert_category: str
     ) -> pd.Series:
@@ -476,28 +886,7 @@ class AlertService:
             return pd.Series([], dtype=bool)
 
         if alert_category == "T":
-            # Complex threshold alert pattern matching
-            threshold_mask = (
-                # Overall threshold alert column set to 'T'
-                (df.get("threshold_alert", pd.Series(dtype="object")) == "T")
-                # Individual threshold alerts contain "T |" pattern
-                | (
-                    df.get(
-                        "total_sessions_alert", pd.Series(dtype="object")
-                    ).str.contains(r"T \|", na=False)
-                )
-                | (
-                    df.get(
-                        "stage_sessions_alert", pd.Series(dtype="object")
-                    ).str.contains(r"T \|", na=False)
-                )
-                | (
-                    df.get(
-                        "water_day_total_alert", pd.Series(dtype="object")
-                    ).str.contains(r"T \|", na=False)
-                )
-            )
-            return threshold_mask
+            return self._threshold_mask(df)
 
         elif alert_category == "NS":
             # Not Scored subjects - use the correct column name
@@ -506,7 +895,7 @@ class AlertService:
                 if "overall_percentile_category" in df.columns
                 else "percentile_category"
             )
-            return df[percentile_col] == "NS"
+            return self._category_equals(df[percentile_col], "NS")
 
         else:
             # Percentile category filtering (B, G, SB, SG)
@@ -515,18 +904,139 @@ class AlertService:
                 if "overall_percentile_category" in df.columns
                 else "percentile_category"
             )
-            return df[percentile_col] == alert_category
+            return self._category_equals(df[percentile_col], alert_category)
+
+    def compute_category_codes(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Percentile category of every row as int8 codes (see PERCENTILE_CATEGORY_CODES)
+
+        Categorical columns reuse their stored codes; other columns are converted
+        once. Values outside the known categories map to -1.
+
+        Parameters:
+            df (pd.DataFrame): DataFrame with a percentile category column
 
-    def _analyze_threshold_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
+        Returns:
+            np.ndarray: int8 category codes aligned with the dataframe rows
+        """
+        percentile_col = (
+            "overall_percentile_category"
+            if "overall_percentile_category" in df.columns
+            else "percentile_category"
+        )
+        categories = df[percentile_col]
+        if categories.dtype == PERCENTILE_CATEGORY_DTYPE:
+            return categories.cat.codes.to_numpy()
+        return PERCENTILE_CATEGORY_DTYPE.categories.get_indexer(categories).astype(
+            np.int8
+        )
+
+    def get_all_category_masks(self, df: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
+        """
+        Boolean masks for every percentile category from one pass over the column
+
+        Parameters:
+            df (pd.DataFrame): DataFrame with a percentile category column
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Category names (PERCENTILE_CATEGORY_ORDER)
+                and a (n_categories, n_rows) boolean matrix whose row i masks the
+                rows in category i
+        """
+        codes = self.compute_category_codes(df)
+        category_codes = np.arange(len(PERCENTILE_CATEGORY_ORDER), dtype=np.int8)
+        masks = codes[np.newaxis, :] == category_codes[:, np.newaxis]
+        return list(PERCENTILE_CATEGORY_ORDER), masks
+
+    def _category_equals(self, categories: pd.Series, category: str) -> pd.Series:
+        """
+        Boolean mask of rows whose percentile category equals the given category
+
+        Parameters:
+            categories (pd.Series): Percentile category column
+            category (str): Category to match
+
+        Returns:
+            pd.Series: Boolean mask aligned with the category column
+        """
+        if isinstance(categories.dtype, pd.CategoricalDtype):
+            known = categories.cat.categories
+            if category not in known:
+                return pd.Series(False, index=categories.index)
+            # Compare the integer codes directly rather than the string values
+            return pd.Series(
+                categories.cat.codes.to_numpy() == known.get_loc(category),
+                index=categories.index,
+            )
+        return categories == category
+
+    def _threshold_pattern_masks(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Private method to flag individual threshold alerts in each alert column
+
+        Parameters:
+            df (pd.DataFrame): DataFrame to scan
+
+        Returns:
+            Dict[str, pd.Series]: Boolean mask per alert column present in the dataframe
+        """
+        return {
+            col: df[col].str.startswith(THRESHOLD_ALERT_PREFIX, na=False)
+            for col in THRESHOLD_ALERT_COLUMNS
+            if col in df.columns
+        }
+
+    def _threshold_mask(
+        self,
+        df: pd.DataFrame,
+        pattern_masks: Optional[Dict[str, pd.Series]] = None,
+    ) -> pd.Series:
+        """
+        Private method to combine the overall and individual threshold alerts
+
+        Parameters:
+            df (pd.DataFrame): DataFrame to generate mask for
+            pattern_masks (Dict[str, pd.Series]): Precomputed column masks (optional)
+
+        Returns:
+            pd.Series: Boolean mask of subjects with any threshold alert
+        """
+        if pattern_masks is None:
+            pattern_masks = self._threshold_pattern_masks(df)
+
+        # Individual threshold alerts start with "T |"; only columns that are
+        # present contribute, so no placeholder Series are built
+        masks = list(pattern_masks.values())
+
+        # Overall threshold alert column set to 'T'
+        if "threshold_alert" in df.columns:
+            masks.append(self._category_equals(df["threshold_alert"], "T"))
+
+        if not masks:
+            return pd.Series(np.zeros(len(df), dtype=bool), index=df.index)
+        return pd.Series(
+            np.logical_or.reduce([mask.to_numpy(dtype=bool) for mask in masks]),
+            index=df.index,
+        )
+
+    def _analyze_threshold_patterns(
+        self,
+        df: pd.DataFrame,
+        pattern_masks: Optional[Dict[str, pd.Series]] = None,
+    ) -> Dict[str, Any]:
         """
         Private method to analyze threshold patterns in the dataframe
 
         Parameters:
             df (pd.DataFrame): DataFrame to analyze
+            pattern_masks (Dict[str, pd.Series]): Precomputed column masks (optional)
 
         Returns:
             Dict[str, Any]: Analysis results for threshold patterns
         """
+        if pattern_masks is None:
+            pattern_masks = self._threshold_pattern_masks(df)
+
         analysis = {
             "exact_matches": 0,
             "pattern_matches": {},
@@ -538,20 +1048,13 @@ class AlertService:
             analysis["exact_matches"] = (df["threshold_alert"] == "T").sum()
 
         # Count pattern matches for each alert type
-        alert_columns = [
-            "total_sessions_alert",
-            "stage_sessions_alert",
-            "water_day_total_alert",
-        ]
-
-        for col in alert_columns:
-            if col in df.columns:
-                pattern_matches = df[col].str.contains(r"T \|", na=False).sum()
-                analysis["pattern_matches"][col] = pattern_matches
+        for col, mask in pattern_masks.items():
+            analysis["pattern_matches"][col] = mask.sum()
 
         # Calculate total subjects with any threshold alert
-        mask = self.get_alert_category_mask(df, "T")
-        analysis["total_threshold_subjects"] = mask.sum()
+        analysis["total_threshold_subjects"] = self._threshold_mask(
+            df, pattern_masks
+        ).sum()
 
         return analysis
 
@@ -571,8 +1074,8 @@ class AlertService:
                 "Required analyzers not available. Initialize with AppUtils instance."
             )
 
-        # Get quantile alerts
-        quantile_alerts = self.get_quantile_alerts(subject_ids)
+        # Get quantile alerts (analyzers were validated above)
+        quantile_alerts = self._get_quantile_alerts(subject_ids)
 
         # Get threshold alerts
         threshold_alerts = self._get_threshold_alerts()
@@ -582,11 +1085,22 @@ class AlertService:
             subject_ids, quantile_alerts, threshold_alerts
         )
 
+        # Derive the NS reasons of every subject that may need one from a
+        # single grouped pass over the session data
+        ns_reasons = self._precompute_ns_reasons(
+            np.union1d(
+                all_subjects,
+                np.fromiter(
+                    threshold_alerts, dtype=object, count=len(threshold_alerts)
+                ),
+            )
+        )
+
         # Initialize unified alerts structure
         unified_alerts = {}
 
         # Handle off-curriculum subjects
-        self._handle_off_curriculum_subjects(all_subjects, unified_alerts)
+        self._handle_off_curriculum_subjects(all_subjects, unified_alerts, ns_reasons)
 
         # Process quantile and threshold alerts
         self._process_quantile_and_threshold_alerts(
@@ -594,13 +1108,17 @@ class AlertService:
         )
 
         # Add feature-specific percentiles
-        self._add_feature_percentiles(unified_alerts, subject_ids)
+        calculated_percentiles = self._add_feature_percentiles(
+            unified_alerts, subject_ids
+        )
 
         # Calculate and add overall percentiles
-        self._add_overall_percentiles(all_subjects, unified_alerts)
+        self._add_overall_percentiles(
+            all_subjects, unified_alerts, ns_reasons, calculated_percentiles
+        )
 
         # Handle subjects without alerts
-        self._handle_subjects_without_alerts(all_subjects, unified_alerts)
+        self._handle_subjects_without_alerts(all_subjects, unified_alerts, ns_reasons)
 
         return unified_alerts
 
@@ -615,8 +1133,18 @@ class AlertService:
         ):
             df = self.app_utils.get_session_data()
             threshold_df = self.app_utils.threshold_analyzer.analyze_thresholds(df)
+
+            # Order only the session dates, then carry just the columns the
+            # alerts read, instead of sorting the whole session table
+            date_order = (
+                threshold_df["session_date"].reset_index(drop=True).sort_values().index
+            )
+            columns = [
+                col for col in THRESHOLD_SESSION_COLUMNS if col in threshold_df.columns
+            ]
             most_recent = (
-                threshold_df.sort_values("session_date")
+                threshold_df[columns]
+                .take(date_order)
                 .groupby("subject_id")
                 .last()
                 .reset_index()
@@ -627,49 +1155,125 @@ class AlertService:
 
     def _process_threshold_alerts(self, most_recent_df: pd.DataFrame) -> Dict[str, Any]:
         """Process threshold alerts from most recent session data"""
-        threshold_alerts = {}
-        stage_thresholds = {
-            "STAGE_1": 5,
-            "STAGE_2": 5,
-            "STAGE_3": 6,
-            "STAGE_4": 10,
-            "STAGE_FINAL": 10,
-            "GRADUATED": 20,
-        }
 
-        for _, row in most_recent_df.iterrows():
-            subject_id = row["subject_id"]
-            current_stage = row.get("current_stage_actual", "")
-            session_count = row.get("session", 0)
-            water_day_total = row.get("water_day_total", 0)
+        def column(name, default):
+            if name in most_recent_df.columns:
+                return most_recent_df[name]
+            return pd.Series(default, index=most_recent_df.index, dtype=object)
+
+        subject_ids = most_recent_df["subject_id"].tolist()
+        current_stages = column("current_stage_actual", "")
+        session_counts = column("session", 0)
+        water_day_totals = column("water_day_total", 0)
+
+        # Evaluate every threshold for all subjects up front
+        session_alerts = (session_counts > 40).to_numpy()
+        water_alerts = (water_day_totals > 3.5).to_numpy()
+        # Stages without a threshold get code -1; their lookup is masked out
+        stage_codes = STAGE_DTYPE.categories.get_indexer(current_stages)
+        has_stage_threshold = stage_codes >= 0
+        stage_thresholds = STAGE_THRESHOLDS_ARR[stage_codes]
+        stage_counts = self._count_stage_sessions(subject_ids, current_stages)
+        stage_alerts = has_stage_threshold & (stage_counts > stage_thresholds)
+        any_alert = session_alerts | water_alerts | stage_alerts
+
+        rows = zip(
+            subject_ids,
+            current_stages.tolist(),
+            session_counts.tolist(),
+            water_day_totals.tolist(),
+            column("session_date", None).tolist(),
+            stage_thresholds.tolist(),
+            stage_counts.tolist(),
+        )
 
-            # Create threshold alert structure
+        # Pack the precomputed results into the per-subject alert structure
+        threshold_alerts = {}
+        for position, (
+            subject_id,
+            current_stage,
+            session_count,
+            water_day_total,
+            session_date,
+            stage_threshold,
+            stage_sessions_count,
+        ) in enumerate(rows):
             subject_threshold_alerts = self._create_threshold_alert_structure(
-                session_count, water_day_total, current_stage, row
+                session_count,
+                water_day_total,
+                current_stage,
+                session_date,
+                session_alerts[position],
+                water_alerts[position],
             )
 
-            # Add stage-specific threshold
-            if current_stage in stage_thresholds:
-                self._add_stage_threshold(
-                    subject_threshold_alerts,
-                    subject_id,
-                    current_stage,
-                    stage_thresholds[current_stage],
+            if has_stage_threshold[position]:
+                subject_threshold_alerts["specific_alerts"]["stage_sessions"] = (
+                    self._stage_threshold_alert(
+                        current_stage,
+                        stage_sessions_count,
+                        stage_threshold,
+                        stage_alerts[position],
+                    )
                 )
 
-            # Set overall threshold alert
-            if any(
-                alert["alert"] == "T"
-                for alert in subject_threshold_alerts["specific_alerts"].values()
-            ):
+            if any_alert[position]:
                 subject_threshold_alerts["threshold_alert"] = "T"
 
             threshold_alerts[subject_id] = subject_threshold_alerts
 
         return threshold_alerts
 
+    def _count_stage_sessions(
+        self, subject_ids, current_stages: pd.Series
+    ) -> np.ndarray:
+        """
+        Count each subject's sessions in its current stage with a single groupby
+
+        Parameters:
+            subject_ids (List[str]): Subject of each row
+            current_stages (pd.Series): Current stage of each row
+
+        Returns:
+            np.ndarray: Number of sessions each subject has spent in its current stage
+        """
+        if not hasattr(self.app_utils, "get_session_data"):
+            return np.zeros(len(subject_ids), dtype=np.int64)
+
+        # Only stages with a session threshold are counted; casting to a
+        # Categorical over them groups on integer codes
+        all_sessions = self.app_utils.get_session_data()
+        stage_codes = STAGE_DTYPE.categories.get_indexer(
+            all_sessions["current_stage_actual"]
+        )
+        stage_counts = (
+            pd.DataFrame(
+                {
+                    "subject_id": all_sessions["subject_id"].to_numpy(),
+                    "current_stage_actual": pd.Categorical.from_codes(
+                        stage_codes, dtype=STAGE_DTYPE
+                    ),
+                }
+            )
+            .groupby(["subject_id", "current_stage_actual"], observed=True)
+            .size()
+        )
+        lookup = pd.MultiIndex.from_arrays(
+            [
+                np.asarray(subject_ids, dtype=object),
+                current_stages.to_numpy(dtype=object),
+            ]
+        )
+        return stage_counts.reindex(lookup, fill_value=0).to_numpy()
+
     def _create_threshold_alert_structure(
-        self, session_count, water_day_total, current_stage, row
+        self,
+        session_count,
+        water_day_total,
+        current_stage,
+        session_date,
+        session_alert,
+        water_alert,
     ):
         """Create the basic threshold alert structure for a subject"""
         return {
@@ -677,89 +1281,114 @@ class AlertService:
             "session_count": session_count,
             "water_day_total": water_day_total,
             "stage": current_stage,
-            "session_date": row.get("session_date"),
+            "session_date": session_date,
             "specific_alerts": {
                 "total_sessions": {
                     "value": session_count,
                     "threshold": 40,
-                    "alert": "T" if session_count > 40 else "N",
+                    "alert": "T" if session_alert else "N",
                     "description": (
-                        f"Total sessions: {session_count} > 40"
-                        if session_count > 40
-                        else ""
+                        f"Total sessions: {session_count} > 40" if session_alert else ""
                     ),
                 },
                 "water_day_total": {
                     "value": water_day_total,
                     "threshold": 3.5,
-                    "alert": "T" if water_day_total > 3.5 else "N",
+                    "alert": "T" if water_alert else "N",
                     "description": (
                         f"Water day total: {water_day_total} > 3.5ml"
-                        if water_day_total > 3.5
+                        if water_alert
                         else ""
                     ),
                 },
             },
         }
 
-    def _add_stage_threshold(
-        self, subject_threshold_alerts, subject_id, current_stage, stage_threshold
+    def _stage_threshold_alert(
+        self, current_stage, stage_sessions_count, stage_threshold, stage_alert
     ):
-        """Add stage-specific threshold alert to subject"""
-        stage_sessions_count = 0
-        if hasattr(self.app_utils, "get_session_data"):
-            all_sessions = self.app_utils.get_session_data()
-            stage_sessions_count = len(
-                all_sessions[
-                    (all_sessions["subject_id"] == subject_id)
-                    & (all_sessions["current_stage_actual"] == current_stage)
-                ]
-            )
-
-        subject_threshold_alerts["specific_alerts"]["stage_sessions"] = {
+        """Create the stage-specific threshold alert for a subject"""
+        return {
             "value": stage_sessions_count,
             "threshold": stage_threshold,
-            "alert": "T" if stage_sessions_count > stage_threshold else "N",
+            "alert": "T" if stage_alert else "N",
             "description": (
                 f"{current_stage}: {stage_sessions_count} > {stage_threshold}"
-                if stage_sessions_count > stage_threshold
+                if stage_alert
                 else ""
             ),
             "stage": current_stage,
         }
 
     def _determine_all_subjects(self, subject_ids, quantile_alerts, threshold_alerts):
-        """Determine the complete set of subjects to process"""
-        all_subjects = set()
+        """
+        Determine the complete set of subjects to process
 
+        Returns:
+            np.ndarray: Sorted unique subject IDs (object dtype), so downstream
+                iteration order is deterministic
+        """
         if subject_ids is not None:
-            all_subjects.update(subject_ids)
-        else:
-            all_subjects.update(quantile_alerts.keys())
-            all_subjects.update(threshold_alerts.keys())
+            return np.unique(np.asarray(list(subject_ids), dtype=object))
+
+        subject_arrays = [
+            np.fromiter(quantile_alerts, dtype=object, count=len(quantile_alerts)),
+            np.fromiter(threshold_alerts, dtype=object, count=len(threshold_alerts)),
+        ]
+
+        # Include all subjects from session data if no specific IDs requested
+        if hasattr(self.app_utils, "get_session_data"):
+            df = self.app_utils.get_session_data()
+            if df is not None and not df.empty:
+                subject_arrays.append(
+                    np.asarray(df["subject_id"].dropna().unique(), dtype=object)
+                )
+
+        return np.unique(np.concatenate(subject_arrays))
 
-            # Include all subjects from session data if no specific IDs requested
-            if hasattr(self.app_utils, "get_session_data"):
-                df = self.app_utils.get_session_data()
-                if df is not None and not df.empty:
-                    all_subjects.update(df["subject_id"].unique())
+    def _complete_ns_reasons(self, subject_ids, ns_reasons=None) -> Dict[str, str]:
+        """
+        Ensure NS reasons cover the given subjects, batching any not precomputed
 
-        return all_subjects
+        Parameters:
+            subject_ids (List[str]): Subjects that need an NS reason
+            ns_reasons (Dict[str, str], optional): Precomputed NS reasons
 
-    def _handle_off_curriculum_subjects(self, all_subjects, unified_alerts):
+        Returns:
+            Dict[str, str]: NS reasons including every subject in subject_ids
+        """
+        ns_reasons = ns_reasons or {}
+        missing = [
+            subject_id for subject_id in subject_ids if subject_id not in ns_reasons
+        ]
+        if not missing:
+            return ns_reasons
+        return {**ns_reasons, **self._precompute_ns_reasons(missing)}
+
+    def _handle_off_curriculum_subjects(
+        self, all_subjects, unified_alerts, ns_reasons=None
+    ):
         """Handle off-curriculum subjects by setting them as NS"""
-        for subject_id in all_subjects:
-            if (
-                hasattr(self.app_utils, "off_curriculum_subjects")
-                and subject_id in self.app_utils.off_curriculum_subjects
-            ):
-                ns_reason = self.get_not_scored_reason(subject_id)
-                unified_alerts[subject_id] = {
-                    "alert_category": "NS",
-                    "overall_percentile": None,
-                    "ns_reason": ns_reason,
-                    "threshold": {"threshold_alert": "N", "specific_alerts": {}},
-                }
+        if not hasattr(self.app_utils, "off_curriculum_subjects"):
+            return
+
+        off_curriculum = [
+            subject_id
+            for subject_id in all_subjects
+            if subject_id in self.app_utils.off_curriculum_subjects
+        ]
+        if not off_curriculum:
+            return
+
+        if ns_reasons is None:
+            ns_reasons = self._precompute_ns_reasons(off_curriculum)
+        for subject_id in off_curriculum:
+            unified_alerts[subject_id] = {
+                "alert_category": "NS",
+                "overall_percentile": None,
+                "ns_reason": ns_reasons[subject_id],
+                "threshold": {"threshold_alert": "N", "specific_alerts": {}},
+            }
 
     def _process_quantile_and_threshold_alerts(
         self, quantile_alerts, threshold_alerts, unified_alerts
@@ -789,7 +1418,12 @@ class AlertService:
                 }
 
     def _add_feature_percentiles(self, unified_alerts, subject_ids):
-        """Add feature-specific percentiles and categories to unified alerts"""
+        """
+        Add feature-specific percentiles and categories to unified alerts
+
+        Returns:
+            Dict[str, float]: Mean feature percentile of each subject that has any
+        """
         if (
             hasattr(self.app_utils, "quantile_analyzer")
             and self.app_utils.quantile_analyzer is not None
@@ -799,7 +1433,11 @@ class AlertService:
             )
 
             if not all_data.empty:
-                self._process_feature_percentiles(all_data, unified_alerts, subject_ids)
+                return self._process_feature_percentiles(
+                    all_data, unified_alerts, subject_ids
+                )
+
+        return {}
 
     def _process_feature_percentiles(self, all_data, unified_alerts, subject_ids):
         """Process feature percentiles from comprehensive dataframe"""
@@ -811,128 +1449,251 @@ class AlertService:
         if subject_ids is not None:
             all_data = all_data[all_data["subject_id"].isin(subject_ids)]
 
-        # Process each subject
-        for subject_id in all_data["subject_id"].unique():
-            if subject_id not in unified_alerts:
-                continue
-
-            # Get current strata data for this subject
-            subject_data = all_data[
-                (all_data["subject_id"] == subject_id) & (all_data["is_current"])
-            ]
+        # Keep the first current strata row of each subject with unified alerts
+        current_rows = all_data[
+            all_data["is_current"] & all_data["subject_id"].isin(list(unified_alerts))
+        ].drop_duplicates(subset="subject_id")
 
-            if subject_data.empty:
-                continue
+        if current_rows.empty:
+            return {}
 
-            row = subject_data.iloc[0]
-            feature_percentiles, percentile_values = self._extract_feature_percentiles(
-                row, percentile_cols
-            )
+        feature_percentiles, calculated_overall = (
+            self._extract_feature_percentiles_batch(current_rows, percentile_cols)
+        )
+        has_strata = "strata" in current_rows.columns
+        strata = (
+            current_rows["strata"].tolist()
+            if has_strata
+            else [None] * len(feature_percentiles)
+        )
 
+        rows = zip(
+            current_rows["subject_id"].tolist(),
+            feature_percentiles,
+            calculated_overall.tolist(),
+            strata,
+        )
+        calculated_percentiles = {}
+        for subject_id, subject_features, subject_overall, subject_strata in rows:
             # Add to unified alerts
-            unified_alerts[subject_id]["feature_percentiles"] = feature_percentiles
+            unified_alerts[subject_id]["feature_percentiles"] = subject_features
 
-            # Calculate overall percentile as average of feature percentiles
-            if percentile_values:
-                calculated_overall = sum(percentile_values) / len(percentile_values)
-                unified_alerts[subject_id][
-                    "calculated_overall_percentile"
-                ] = calculated_overall
+            # Overall percentile is the average of the present feature percentiles
+            if not np.isnan(subject_overall):
+                calculated_percentiles[subject_id] = subject_overall
 
             # Add strata information
-            if "strata" in row:
-                unified_alerts[subject_id]["strata"] = row["strata"]
+            if has_strata:
+                unified_alerts[subject_id]["strata"] = subject_strata
 
-    def _extract_feature_percentiles(self, row, percentile_cols):
-        """Extract feature percentiles from a data row"""
-        feature_percentiles = {}
-        percentile_values = []
+        return calculated_percentiles
 
-        for col in percentile_cols:
-            feature = col.replace("_percentile", "")
-            percentile = row[col] if col in row and not pd.isna(row[col]) else None
+    def _extract_feature_percentiles_batch(self, rows, percentile_cols):
+        """
+        Extract feature percentiles for every row of a dataframe in one pass
 
-            if percentile is None:
-                continue
+        Parameters:
+            rows (pd.DataFrame): One row per subject
+            percentile_cols (List[str]): Percentile columns to extract
 
-            percentile_values.append(percentile)
-            category = self.map_percentile_to_category(percentile)
+        Returns:
+            Tuple[List[Dict[str, Any]], np.ndarray]: Feature percentile dicts in row
+            order, and each row's mean percentile (NaN when no feature is present)
+        """
+        features = [col.replace("_percentile", "") for col in percentile_cols]
+        percentiles = rows[percentile_cols].to_numpy(dtype=np.float64)
+        bins, calculated_overall = _feature_percentile_kernel(
+            percentiles, self._category_thresholds
+        )
 
-            feature_percentiles[feature] = {
+        # Processed values are attached only where the column exists
+        processed = {}
+        for index, feature in enumerate(features):
+            processed_col = f"{feature}_processed"
+            if processed_col in rows.columns:
+                values = rows[processed_col]
+                processed[index] = (values.tolist(), values.notna().to_numpy())
+
+        # Walk only the present cells, row-major so features keep column order
+        extracted = [{} for _ in range(len(bins))]
+        cell_rows, cell_cols = np.nonzero(bins >= 0)
+        for position, index, percentile, bin_index in zip(
+            cell_rows.tolist(),
+            cell_cols.tolist(),
+            percentiles[cell_rows, cell_cols].tolist(),
+            bins[cell_rows, cell_cols].tolist(),
+        ):
+            feature_percentile = {
                 "percentile": percentile,
-                "category": category,
-                "description": self.get_category_description(category),
+                "category": self._category_labels[bin_index],
+                "description": self._category_descriptions[bin_index],
             }
 
             # Add processed value if available
-            processed_col = f"{feature}_processed"
-            if processed_col in row and not pd.isna(row[processed_col]):
-                feature_percentiles[feature]["processed_value"] = row[processed_col]
+            if index in processed and processed[index][1][position]:
+                feature_percentile["processed_value"] = processed[index][0][position]
 
-        return feature_percentiles, percentile_values
+            extracted[position][features[index]] = feature_percentile
 
-    def _add_overall_percentiles(self, all_subjects, unified_alerts):
+        return extracted, calculated_overall
+
+    def _add_overall_percentiles(
+        self, all_subjects, unified_alerts, ns_reasons=None, calculated_percentiles=None
+    ):
         """Calculate and add overall percentiles to unified alerts"""
+        overall_percentiles = self._session_overall_percentiles(all_subjects)
+
+        # Categorize every subject from one columnar frame, then write back
+        overall_frame = self._overall_percentile_frame(
+            unified_alerts, overall_percentiles, calculated_percentiles or {}
+        )
+        subject_ids = overall_frame.index.tolist()
+        not_scored = overall_frame["not_scored"].tolist()
+
+        # Not scored subjects without an NS reason yet get theirs in one batch
+        needs_reason = [
+            subject_not_scored and "ns_reason" not in unified_alerts[subject_id]
+            for subject_id, subject_not_scored in zip(subject_ids, not_scored)
+        ]
+        ns_reasons = self._complete_ns_reasons(
+            [
+                subject_id
+                for subject_id, needed in zip(subject_ids, needs_reason)
+                if needed
+            ],
+            ns_reasons,
+        )
+
+        rows = zip(
+            subject_ids,
+            overall_frame["overall_percentile"].tolist(),
+            overall_frame["has_percentile"].tolist(),
+            needs_reason,
+            overall_frame["alert_category"].tolist(),
+        )
+        for (
+            subject_id,
+            overall_percentile,
+            has_percentile,
+            needed,
+            alert_category,
+        ) in rows:
+            subject_alerts = unified_alerts[subject_id]
+            subject_alerts["overall_percentile"] = (
+                overall_percentile if has_percentile else None
+            )
+            if needed:
+                subject_alerts["ns_reason"] = ns_reasons[subject_id]
+            subject_alerts["alert_category"] = alert_category
+
+    def _session_overall_percentiles(self, all_subjects) -> Dict[str, float]:
+        """
+        Look up session-level overall percentiles, memoized per subject selection
+
+        Parameters:
+            all_subjects (array-like): Subjects to look up
+
+        Returns:
+            Dict[str, float]: Overall percentile of each subject that has one
+        """
+        cache_key = frozenset(all_subjects)
+        if cache_key in self._overall_percentile_cache:
+            self._overall_percentile_cache.move_to_end(cache_key)
+            return self._overall_percentile_cache[cache_key]
+
         overall_percentiles = {}
         try:
             overall_df = self.app_utils.get_session_overall_percentiles(
                 list(all_subjects)
             )
             if not overall_df.empty:
-                overall_percentiles = dict(
-                    zip(
-                        overall_df["subject_id"],
-                        overall_df["session_overall_percentile"],
-                    )
-                )
+                overall_percentiles = overall_df.set_index("subject_id")[
+                    "session_overall_percentile"
+                ].to_dict()
         except Exception as e:
             self.logger.error(
                 f"Error calculating session-level overall percentiles: {e}"
             )
+            return {}
 
-        # Add overall percentiles and categories to all subjects
-        for subject_id in unified_alerts:
-            self._process_subject_overall_percentile(
-                subject_id, unified_alerts, overall_percentiles
-            )
+        # Only selections large enough to amortize the lookup are cached
+        if len(cache_key) >= OVERALL_PERCENTILE_CACHE_MIN_SUBJECTS:
+            self._overall_percentile_cache[cache_key] = overall_percentiles
+            if len(self._overall_percentile_cache) > OVERALL_PERCENTILE_CACHE_SIZE:
+                self._overall_percentile_cache.popitem(last=False)
 
-    def _process_subject_overall_percentile(
-        self, subject_id, unified_alerts, overall_percentiles
-    ):
-        """Process overall percentile for a single subject"""
-        # Use calculated percentile if available, otherwise fall back to app_utils
-        if "calculated_overall_percentile" in unified_alerts[subject_id]:
-            overall_percentile = unified_alerts[subject_id][
-                "calculated_overall_percentile"
-            ]
-            unified_alerts[subject_id].pop("calculated_overall_percentile", None)
-        else:
-            overall_percentile = overall_percentiles.get(subject_id)
+        return overall_percentiles
 
-        # Add to unified alerts
-        unified_alerts[subject_id]["overall_percentile"] = overall_percentile
+    def _overall_percentile_frame(
+        self, unified_alerts, overall_percentiles, calculated_percentiles
+    ) -> pd.DataFrame:
+        """
+        Build the overall percentile and alert category of every subject as columns
 
-        # Calculate alert category from overall percentile
-        if overall_percentile is not None and not np.isnan(overall_percentile):
-            alert_category = self.map_overall_percentile_to_category(overall_percentile)
-        else:
-            alert_category = "NS"
-            if "ns_reason" not in unified_alerts[subject_id]:
-                unified_alerts[subject_id]["ns_reason"] = self.get_not_scored_reason(
-                    subject_id
-                )
+        Parameters:
+            unified_alerts (Dict[str, Dict[str, Any]]): Unified alerts being built
+            overall_percentiles (Dict[str, float]): Session-level overall percentiles
+            calculated_percentiles (Dict[str, float]): Mean feature percentiles,
+                preferred over the session-level values
 
-        unified_alerts[subject_id]["alert_category"] = alert_category
+        Returns:
+            pd.DataFrame: Indexed by subject ID with overall_percentile,
+            has_percentile, not_scored and alert_category columns
+        """
+        # Use calculated percentile if available, otherwise fall back to app_utils
+        percentiles = [
+            (
+                calculated_percentiles[subject_id]
+                if subject_id in calculated_percentiles
+                else overall_percentiles.get(subject_id)
+            )
+            for subject_id in unified_alerts
+        ]
+
+        has_percentile = np.fromiter(
+            (percentile is not None for percentile in percentiles),
+            dtype=bool,
+            count=len(percentiles),
+        )
+        # None converts to NaN, so one mask flags every not scored subject
+        values = np.array(percentiles, dtype=float)
+
+        return pd.DataFrame(
+            {
+                "overall_percentile": values,
+                "has_percentile": has_percentile,
+                "not_scored": np.isnan(values),
+                "alert_category": self.map_percentiles_to_categories(
+                    values, missing="NS"
+                ),
+            },
+            index=pd.Index(list(unified_alerts), dtype=object, name="subject_id"),
+        )
 
-    def _handle_subjects_without_alerts(self, all_subjects, unified_alerts):
+    def _handle_subjects_without_alerts(
+        self, all_subjects, unified_alerts, ns_reasons=None
+    ):
         """Handle subjects that don't have alerts yet"""
-        subjects_without_alerts = all_subjects - set(unified_alerts.keys())
-        for subject_id in subjects_without_alerts:
-            ns_reason = self.get_not_scored_reason(subject_id)
-            unified_alerts[subject_id] = {
-                "quantile": {"current": {}, "historical": {}},
-                "threshold": {"threshold_alert": "N", "specific_alerts": {}},
-                "overall_percentile": None,
-                "alert_category": "NS",
-                "ns_reason": ns_reason,
+        subjects_without_alerts = [
+            subject_id
+            for subject_id in all_subjects
+            if subject_id not in unified_alerts
+        ]
+        if not subjects_without_alerts:
+            return
+
+        # Resolve any reasons not precomputed in one batch, not per subject
+        ns_reasons = self._complete_ns_reasons(subjects_without_alerts, ns_reasons)
+
+        unified_alerts.update(
+            {
+                subject_id: {
+                    "quantile": {"current": {}, "historical": {}},
+                    "threshold": {"threshold_alert": "N", "specific_alerts": {}},
+                    "overall_percentile": None,
+                    "alert_category": "NS",
+                    "ns_reason": ns_reasons[subject_id],
+                }
+                for subject_id in subjects_without_alerts
             }
+        )
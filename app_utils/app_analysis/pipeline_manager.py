@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from app_utils.app_alerts.alert_service import PERCENTILE_CATEGORY_DTYPE
 from app_utils.simple_logger import get_logger
 
 logger = get_logger("pipeline_manager")
@@ -285,11 +286,9 @@ class DataPipelineManager:
             if percentile_col in result_df.columns:
                 # Map percentiles to categories using UI data manager if available
                 if self.ui_data_manager:
-                    result_df[category_col] = result_df[percentile_col].apply(
-                        lambda x: (
-                            self.ui_data_manager.map_percentile_to_category(x)
-                            if not pd.isna(x)
-                            else "NS"
+                    result_df[category_col] = (
+                        self.ui_data_manager.map_percentiles_to_categories(
+                            result_df[percentile_col].to_numpy(dtype=float)
                         )
                     )
                 else:
@@ -305,13 +304,9 @@ class DataPipelineManager:
         # Add overall percentile category
         if "session_overall_percentile" in result_df.columns:
             if self.ui_data_manager:
-                result_df["overall_percentile_category"] = result_df[
-                    "session_overall_percentile"
-                ].apply(
-                    lambda x: (
-                        self.ui_data_manager.map_percentile_to_category(x)
-                        if not pd.isna(x)
-                        else "NS"
+                result_df["overall_percentile_category"] = (
+                    self.ui_data_manager.map_percentiles_to_categories(
+                        result_df["session_overall_percentile"].to_numpy(dtype=float)
                     )
                 )
             else:
@@ -325,6 +320,11 @@ class DataPipelineManager:
                     )
                 )
 
+            # Store as an ordered Categorical for fast alert masks and counts
+            result_df["overall_percentile_category"] = result_df[
+                "overall_percentile_category"
+            ].astype(PERCENTILE_CATEGORY_DTYPE)
+
         # Add simple boolean outlier flag based on outlier_weight
         if "outlier_weight" in result_df.columns:
             result_df["is_outlier"] = result_df["outlier_weight"] < 1.0
@@ -19,6 +19,13 @@ from .statistical_utils import StatisticalUtils
 
 logger = logging.getLogger(__name__)
 
+# Curriculum columns that must all be set for a session to be on-curriculum
+OFF_CURRICULUM_COLUMNS = (
+    "curriculum_name",
+    "current_stage_actual",
+    "curriculum_version",
+)
+
 
 class ReferenceProcessor:
     """
@@ -130,7 +137,8 @@ class ReferenceProcessor:
 
     def _prepare_input_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare and clean input data"""
-        df = df.copy()
+        # Shallow copy: columns are only replaced below, never written in place
+        df = df.copy(deep=False)
 
         # Convert to datetime if necessary
         if not pd.api.types.is_datetime64_any_dtype(df["session_date"]):
@@ -153,14 +161,17 @@ class ReferenceProcessor:
 
     def _filter_off_curriculum_sessions(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filter out off-curriculum sessions"""
-        off_curriculum_mask = (
-            df["curriculum_name"].isna()
-            | (df["curriculum_name"] == "None")
-            | df["current_stage_actual"].isna()
-            | (df["current_stage_actual"] == "None")
-            | df["curriculum_version"].isna()
-            | (df["curriculum_version"] == "None")
-        )
+        # A session is off-curriculum when any curriculum column is missing or
+        # "None"; factorizing gives both checks from one pass per column
+        off_curriculum_mask = np.zeros(len(df), dtype=bool)
+        for column in OFF_CURRICULUM_COLUMNS:
+            codes, uniques = pd.factorize(df[column])
+            np.logical_or(off_curriculum_mask, codes == -1, out=off_curriculum_mask)
+            none_code = uniques.get_indexer(["None"])[0]
+            if none_code >= 0:
+                np.logical_or(
+                    off_curriculum_mask, codes == none_code, out=off_curriculum_mask
+                )
 
         # Remove off-curriculum sessions
         off_count = off_curriculum_mask.sum()
@@ -168,7 +179,7 @@ class ReferenceProcessor:
             logger.info(
                 f"Reference processor preprocess: Removing {off_count} off-curriculum sessions"
             )
-            df = df[~off_curriculum_mask].copy()
+            df = df[~off_curriculum_mask]
 
         return df
 
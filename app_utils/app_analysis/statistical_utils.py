@@ -252,57 +252,78 @@ class StatisticalUtils:
 
     @staticmethod
     def process_heatmap_matrix_data(
-        time_series_data: Dict[str, Any], features_config: Dict[str, bool]
-    ) -> Tuple[List[List[float]], List[str]]:
+        time_series_data: Dict[str, Any],
+        features_config: Union[Dict[str, bool], Tuple[Tuple[str, bool], ...]],
+    ) -> Tuple[np.ndarray, List[str]]:
         """
         Process time series data into heatmap matrix format with feature names
 
+        The matrix is returned as a C-contiguous float32 array (percentiles lie in
+        [0, 100], so float32 precision is ample) that can be passed straight to
+        Plotly as the heatmap ``z`` values.
+
         Parameters:
             time_series_data: Dict[str, Any]
                 Time series data containing percentile information for features
-            features_config: Dict[str, bool]
-                Configuration dict mapping feature names to whether they should be included
+            features_config: Union[Dict[str, bool], Tuple[Tuple[str, bool], ...]]
+                Feature names mapped to their lower-is-better flag, either as a dict
+                or as a tuple of (feature, lower_is_better) pairs
 
         Returns:
-            Tuple[List[List[float]], List[str]]:
-                - Matrix data for heatmap (list of feature percentile arrays)
+            Tuple[np.ndarray, List[str]]:
+                - Matrix data for heatmap, shape (n_rows, n_sessions), NaN for invalid
                 - Feature display names for heatmap labels
         """
         heatmap_data = []
         feature_names = []
 
-        # Process each configured feature
-        for feature in features_config.keys():
-            percentile_key = f"{feature}_percentiles"
+        # Collect candidate rows (percentile key, display name) in display order
+        candidate_rows = [
+            (
+                f"{feature}_percentiles",
+                StatisticalUtils.format_feature_display_name(feature),
+            )
+            for feature in dict(features_config)
+        ]
+        candidate_rows.append(("overall_percentiles", "Overall Percentile"))
 
-            if percentile_key in time_series_data:
-                percentiles = time_series_data[percentile_key]
+        for percentile_key, display_name in candidate_rows:
+            if percentile_key not in time_series_data:
+                continue
 
-                # Validate and clean percentile data
-                valid_percentiles = StatisticalUtils.validate_percentile_data(
-                    percentiles
-                )
+            # Mask invalid markers for the whole row in one vectorized pass
+            valid_percentiles = StatisticalUtils._mask_invalid_percentiles(
+                time_series_data[percentile_key]
+            )
 
-                # Only include features with at least some valid data
-                if any(not np.isnan(p) for p in valid_percentiles):
-                    heatmap_data.append(valid_percentiles)
+            # Only include rows with at least some valid data
+            if not np.isnan(valid_percentiles).all():
+                heatmap_data.append(valid_percentiles)
+                feature_names.append(display_name)
 
-                    # Format display name for visualization
-                    display_name = StatisticalUtils.format_feature_display_name(feature)
-                    feature_names.append(display_name)
+        if not heatmap_data:
+            return np.empty((0, 0), dtype=np.float32), feature_names
 
-        # Add overall percentile row if available
-        if "overall_percentiles" in time_series_data:
-            overall_percentiles = time_series_data["overall_percentiles"]
-            valid_overall = StatisticalUtils.validate_percentile_data(
-                overall_percentiles
-            )
+        return np.ascontiguousarray(heatmap_data, dtype=np.float32), feature_names
 
-            if any(not np.isnan(p) for p in valid_overall):
-                heatmap_data.append(valid_overall)
-                feature_names.append("Overall Percentile")
+    @staticmethod
+    def _mask_invalid_percentiles(
+        percentiles: List[Union[float, int]], invalid_marker: float = -1
+    ) -> np.ndarray:
+        """
+        Vectorized counterpart of validate_percentile_data returning a float array
+
+        Parameters:
+            percentiles: List[Union[float, int]]
+                Raw percentile data that may contain invalid markers
+            invalid_marker: float
+                Value used to mark invalid/missing data (default: -1)
 
-        return heatmap_data, feature_names
+        Returns:
+            np.ndarray: float64 array with NaN in place of invalid markers
+        """
+        values = np.asarray(percentiles, dtype=np.float64)
+        return np.where(values == invalid_marker, np.nan, values)
 
     @staticmethod
     def format_feature_display_name(feature: str) -> str:
@@ -342,3 +363,89 @@ class StatisticalUtils:
         except ValueError:
             logger.info(f"Session {highlighted_session} not found in session list")
             return None
+
+    @staticmethod
+    def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+        """
+        Select point indices with Largest-Triangle-Three-Buckets downsampling
+
+        Keeps the first and last points and, for each bucket in between, the point
+        forming the largest triangle with the previously kept point and the mean of
+        the next bucket, preserving the visual shape of the series.
+
+        Parameters:
+            x: np.ndarray
+                Monotonic x values (session numbers)
+            y: np.ndarray
+                y values aligned with x
+            threshold: int
+                Number of points to keep
+
+        Returns:
+            np.ndarray: Sorted indices of the points to keep
+        """
+        num_points = len(x)
+        if threshold >= num_points or threshold < 3:
+            return np.arange(num_points)
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        # threshold - 2 buckets between the fixed first and last points
+        edges = np.linspace(1, num_points - 1, threshold - 1).astype(np.intp)
+        edges = np.append(edges, num_points)
+
+        indices = np.empty(threshold, dtype=np.intp)
+        indices[0] = 0
+        indices[-1] = num_points - 1
+        selected = 0
+
+        for bucket in range(threshold - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+
+            areas = np.abs(
+                (x[selected] - avg_x) * (y[start:end] - y[selected])
+                - (x[selected] - x[start:end]) * (avg_y - y[selected])
+            )
+            selected = start + int(np.argmax(areas))
+            indices[bucket + 1] = selected
+
+        return indices
+
+    @staticmethod
+    def downsample_trace_data(
+        trace_data: Dict[str, Any], max_points: int
+    ) -> Dict[str, Any]:
+        """
+        Thin a validated percentile trace to at most max_points using LTTB
+
+        CI bounds are gathered with the same indices so bands stay aligned.
+
+        Parameters:
+            trace_data: Dict[str, Any]
+                Trace arrays keyed "sessions", "percentiles", "ci_lower" and
+                "ci_upper", plus the "has_ci" flag
+            max_points: int
+                Maximum number of points to keep
+
+        Returns:
+            Dict[str, Any]: trace_data unchanged if already small enough,
+                otherwise a thinned copy
+        """
+        if len(trace_data["sessions"]) <= max_points:
+            return trace_data
+
+        keep = StatisticalUtils.lttb_indices(
+            trace_data["sessions"], trace_data["percentiles"], max_points
+        )
+        thinned = dict(trace_data)
+        for key in ("sessions", "percentiles"):
+            thinned[key] = trace_data[key][keep]
+        if trace_data["has_ci"]:
+            for key in ("ci_lower", "ci_upper"):
+                thinned[key] = trace_data[key][keep]
+
+        return thinned
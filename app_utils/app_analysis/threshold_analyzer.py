@@ -2,6 +2,8 @@ from typing import Any, Dict
 
 import pandas as pd
 
+from app_utils.app_alerts.alert_service import THRESHOLD_ALERT_DTYPE
+
 
 class ThresholdAnalyzer:
     """
@@ -79,12 +81,17 @@ class ThresholdAnalyzer:
         for feature, config in self.threshold_config.items():
             self._process_threshold_feature(df_result, feature, config)
 
+        df_result["threshold_alert"] = df_result["threshold_alert"].astype(
+            THRESHOLD_ALERT_DTYPE
+        )
         return df_result
 
     def _create_default_result(self, df: pd.DataFrame) -> pd.DataFrame:
         """Create default result when no thresholds are configured"""
         df_result = df.copy()
-        df_result["threshold_alert"] = "N"
+        df_result["threshold_alert"] = pd.Series(
+            "N", index=df_result.index, dtype=THRESHOLD_ALERT_DTYPE
+        )
         return df_result
 
     def _process_threshold_feature(
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -201,11 +201,13 @@ class AppUtils:
             use_cache,
         )
 
-    def get_table_display_data(self, use_cache: bool = True) -> List[Dict[str, Any]]:
-        """Get optimized table display data"""
+    def get_table_display_data(
+        self, use_cache: bool = True, as_frame: bool = False
+    ) -> Union[List[Dict[str, Any]], pd.DataFrame]:
+        """Get optimized table display data, as row records or a DataFrame"""
         return self._get_ui_data_with_fallback(
             lambda ui_structures: self.ui_data_manager.get_table_display_data(
-                ui_structures
+                ui_structures, as_frame=as_frame
             ),
             use_cache,
         )
@@ -71,6 +71,16 @@ class CacheManager:
         """
         self._cache[key] = value
 
+    def delete(self, key: str) -> None:
+        """
+        Remove a cached value by key (no-op if the key is not cached)
+
+        Parameters:
+            key: str
+                Cache key to remove
+        """
+        self._cache.pop(key, None)
+
     def has(self, key: str) -> bool:
         """
         Check if cache has a key with non-None value
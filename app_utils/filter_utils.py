@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Dict
 
 import pandas as pd
@@ -220,21 +221,21 @@ def _apply_alert_category_filter_fallback(
         threshold_mask = (
             # Overall threshold alert column set to 'T'
             (df.get("threshold_alert", pd.Series(dtype="object")) == "T")
-            # Individual threshold alerts contain "T |" pattern
+            # Individual threshold alerts start with "T |"
             | (
-                df.get("total_sessions_alert", pd.Series(dtype="object")).str.contains(
-                    r"T \|", na=False
-                )
+                df.get(
+                    "total_sessions_alert", pd.Series(dtype="object")
+                ).str.startswith("T |", na=False)
             )
             | (
-                df.get("stage_sessions_alert", pd.Series(dtype="object")).str.contains(
-                    r"T \|", na=False
-                )
+                df.get(
+                    "stage_sessions_alert", pd.Series(dtype="object")
+                ).str.startswith("T |", na=False)
             )
             | (
-                df.get("water_day_total_alert", pd.Series(dtype="object")).str.contains(
-                    r"T \|", na=False
-                )
+                df.get(
+                    "water_day_total_alert", pd.Series(dtype="object")
+                ).str.startswith("T |", na=False)
             )
         )
 
@@ -359,19 +360,30 @@ def apply_all_filters(
     filtered_df = apply_alert_category_filter(filtered_df, alert_category)
     filtered_df = apply_sorting_logic(filtered_df, sort_option)
 
-    # Count percentile categories for debugging
+    # Count percentile categories for debugging (only when INFO is shown)
+    if logger.is_enabled_for(logging.INFO):
+        _log_percentile_category_counts(filtered_df)
+    logger.info("Applied sorting: %s", sort_option)
+
+    return filtered_df
+
+
+def _log_percentile_category_counts(df: pd.DataFrame) -> None:
+    """
+    Log subject counts per percentile category of the filtered table
+
+    Parameters:
+        df: Filtered DataFrame
+    """
     percentile_col = (
         "overall_percentile_category"
-        if "overall_percentile_category" in filtered_df.columns
+        if "overall_percentile_category" in df.columns
         else "percentile_category"
     )
-    if percentile_col in filtered_df.columns:
-        percentile_counts = filtered_df[percentile_col].value_counts().to_dict()
+    if percentile_col in df.columns:
+        percentile_counts = df[percentile_col].value_counts().to_dict()
         logger.info(f"Percentile categories: {percentile_counts}")
     else:
         logger.info(
-            f"No percentile category column found. Available columns: {list(filtered_df.columns)}"
+            f"No percentile category column found. Available columns: {list(df.columns)}"
         )
-    logger.info(f"Applied sorting: {sort_option}")
-
-    return filtered_df
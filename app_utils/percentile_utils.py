@@ -7,6 +7,7 @@ calculation requirements.
 
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -349,24 +350,28 @@ class PercentileCoordinator:
         return validation_results
 
 
-def calculate_heatmap_colorscale(mode: str = "binned") -> List[Tuple[float, str]]:
+@lru_cache(maxsize=4)
+def calculate_heatmap_colorscale(mode: str = "binned") -> Tuple[Tuple[Any, ...], ...]:
     """
     Calculate colorscale for percentile heatmaps with alert category mapping
 
     This function provides colorscales that match the alert category system used
-    throughout the dashboard for consistent visual representation.
+    throughout the dashboard for consistent visual representation. Results are
+    memoized per mode, so the colorscale is returned as immutable nested tuples.
 
     Parameters:
         mode: str
             Colorscale mode - 'binned' for discrete categories, 'continuous' for smooth gradients
 
     Returns:
-        List[Tuple[float, str]]: Colorscale definition as list of (position, color) tuples
+        Tuple[Tuple[Any, ...], ...]: Colorscale definition as (position, color) pairs
     """
     if mode == "continuous":
-        return _create_continuous_colorscale()
+        colorscale = _create_continuous_colorscale()
     else:
-        return _create_custom_colorscale()
+        colorscale = _create_custom_colorscale()
+
+    return tuple(tuple(stop) for stop in colorscale)
 
 
 def _create_custom_colorscale() -> List[Tuple[float, str]]:
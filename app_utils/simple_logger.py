@@ -40,23 +40,31 @@ class SimpleLogger:
 
         self.logger.addHandler(handler)
 
-    def info(self, message: str, **kwargs):
-        """Info level - shown in DEV only"""
+    def info(self, message: str, *args, **kwargs):
+        """Info level - shown in DEV only
+
+        Positional args are passed through for lazy %-style formatting, so the
+        message is only formatted when INFO is enabled.
+        """
         if kwargs:
             message = f"{message} {kwargs}"
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Warning level - shown in DEV and PROD"""
         if kwargs:
             message = f"{message} {kwargs}"
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Error level - always shown"""
         if kwargs:
             message = f"{message} {kwargs}"
-        self.logger.error(message)
+        self.logger.error(message, *args)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at the given logging level would be emitted"""
+        return self.logger.isEnabledFor(level)
 
 
 def get_logger(name: str) -> SimpleLogger:
@@ -6,13 +6,17 @@ across the AIND dashboard. It ensures consistent mapping and display of
 strata names throughout all components.
 """
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=256)
 def get_strata_abbreviation(strata_name):
     """
     Convert full strata name to abbreviated forms for UI display
 
     This function provides a centralized way to abbreviate strata names
     used across the dashboard for consistent display in charts and tables.
+    Results are memoized, since only a few dozen distinct strata exist.
 
     Parameters:
         strata_name (str): The full strata name (e.g., "Uncoupled Baiting_ADVANCED_v3")
@@ -1,13 +1,119 @@
-from datetime import datetime
-from typing import Any, Dict, List
+import hashlib
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, List, Union
 
+import numpy as np
 import pandas as pd
 
+from app_utils.app_alerts.alert_coordinator import AlertCoordinator
+from app_utils.app_alerts.alert_service import (
+    COMBINED_ALERT_CODES,
+    COMBINED_ALERT_DTYPE,
+    PERCENTILE_CATEGORY_CODES,
+    PERCENTILE_CATEGORY_DTYPE,
+    STAGE_SESSION_THRESHOLDS,
+    STAGE_THRESHOLDS_ARR,
+    THRESHOLD_ALERT_DTYPE,
+    THRESHOLD_CONFIG,
+)
+from app_utils.cache_utils import CacheManager
 from app_utils.simple_logger import get_logger
 from app_utils.strata_utils import get_strata_abbreviation
 
 logger = get_logger("ui_utils")
 
+# Category labels ordered by percentile bin, plus the not scored label
+PERCENTILE_CATEGORY_LABELS = np.array(["SB", "B", "N", "G", "SG"], dtype=object)
+PERCENTILE_CATEGORY_MISSING = "NS"
+
+# Lower bin edges for searchsorted(side="right"); the N and G upper bounds are
+# inclusive, so their edges sit one float step above 72 and 93.5
+PERCENTILE_CATEGORY_EDGES = np.array(
+    [6.5, 28.0, np.nextafter(72.0, np.inf), np.nextafter(93.5, np.inf)]
+)
+
+# String columns with few distinct values, stored as Categoricals
+LOW_CARDINALITY_COLUMNS = frozenset(
+    [
+        "strata",
+        "PI",
+        "trainer",
+        "rig",
+        "curriculum_name",
+        "current_stage_actual",
+        "overall_percentile_category",
+    ]
+)
+
+# Rows taken from each end of the data for the fallback data hash
+DATA_HASH_SAMPLE_ROWS = 64
+
+# CI certainty labels indexed by classification code (0/1/2)
+CI_CERTAINTY_LABELS = np.array(["certain", "intermediate", "uncertain"], dtype=object)
+
+# CI width thresholds relative to the point estimate, and absolute thresholds
+# used when the estimate is too close to zero to divide by
+CI_CERTAIN_RELATIVE_WIDTH = 0.30
+CI_UNCERTAIN_RELATIVE_WIDTH = 0.60
+CI_SMALL_TARGET = 1e-6
+CI_CERTAIN_ABSOLUTE_WIDTH = 0.01
+CI_UNCERTAIN_ABSOLUTE_WIDTH = 0.05
+
+# Empty table returned when there is no data, so the UI keeps its columns
+_EMPTY_TABLE_PROTOTYPE = pd.DataFrame(
+    columns=[
+        "subject_id",
+        "combined_alert",
+        "percentile_category",
+        "overall_percentile",
+        "session_date",
+        "session",
+    ]
+)
+
+# Shared read-only result for UI lookups that miss
+_EMPTY_LOOKUP = MappingProxyType({})
+
+# Alert columns written by the unified alerts pass, and the cache manager key
+# holding the last result against the alerts dict and a digest of its inputs
+ALERT_RESULT_COLUMNS = [
+    "percentile_category",
+    "threshold_alert",
+    "combined_alert",
+    "ns_reason",
+]
+ALERT_RESULT_CACHE_KEY = "unified_alert_columns"
+
+# Default values for alert columns missing from the table data
+ALERT_COLUMN_DEFAULTS = {
+    "percentile_category": "NS",
+    "threshold_alert": "N",
+    "combined_alert": "NS",
+    "ns_reason": "",
+    "strata_abbr": "",
+    "total_sessions_alert": "N",
+    "stage_sessions_alert": "N",
+    "water_day_total_alert": "N",
+}
+
+# Low-cardinality alert columns stored as Categoricals in the table data
+ALERT_COLUMN_DTYPES = {
+    "percentile_category": PERCENTILE_CATEGORY_DTYPE,
+    "threshold_alert": THRESHOLD_ALERT_DTYPE,
+    "combined_alert": COMBINED_ALERT_DTYPE,
+}
+COMBINED_ALERT_LABELS = np.asarray(COMBINED_ALERT_DTYPE.categories, dtype=object)
+
+# Combine general thresholds with stage-specific thresholds
+COMBINED_THRESHOLD_CONFIG = {
+    **THRESHOLD_CONFIG,
+    **{
+        f"stage_{stage}_sessions": {"condition": "gt", "value": threshold}
+        for stage, threshold in STAGE_SESSION_THRESHOLDS.items()
+    },
+}
+
 
 class UIDataManager:
     """
@@ -35,20 +141,28 @@ class UIDataManager:
         Returns:
             str: Alert category (SB, B, N, G, SG)
         """
-        if pd.isna(percentile):
-            return "NS"
-
-        # Use the correct thresholds from the alert service
-        if percentile < 6.5:
-            return "SB"  # Severely Below: < 6.5%
-        elif percentile < 28:
-            return "B"  # Below: < 28%
-        elif percentile <= 72:
-            return "N"  # Normal: 28% - 72%
-        elif percentile <= 93.5:
-            return "G"  # Good: 72% - 93.5%
-        else:
-            return "SG"  # Significantly Good: > 93.5%
+        return self.map_percentiles_to_categories([percentile])[0]
+
+    def map_percentiles_to_categories(self, percentiles) -> np.ndarray:
+        """
+        Map an array of percentile values to alert categories in one pass
+
+        Thresholds match the alert service: SB < 6.5 <= B < 28 <= N <= 72
+        < G <= 93.5 < SG, with missing values mapped to NS.
+
+        Parameters:
+            percentiles: array-like
+                Percentile values (0-100), NaN/None for missing
+
+        Returns:
+            np.ndarray: Object array of alert categories
+        """
+        values = np.asarray(percentiles, dtype=float)
+        categories = PERCENTILE_CATEGORY_LABELS[
+            np.searchsorted(PERCENTILE_CATEGORY_EDGES, values, side="right")
+        ]
+        categories[np.isnan(values)] = PERCENTILE_CATEGORY_MISSING
+        return categories
 
     def get_strata_abbreviation(self, strata: str) -> str:
         """Get abbreviated strata name for UI display"""
@@ -80,129 +194,158 @@ class UIDataManager:
             return {
                 "subjects": {},
                 "strata_reference": {},
-                "metadata": {
-                    "total_subjects": 0,
-                    "total_sessions": 0,
-                    "total_strata": 0,
-                    "data_hash": "",
-                    "wilson_ci_enabled": True,
-                    "optimization_timestamp": datetime.now().isoformat(),
-                },
+                "metadata": self._build_storage_metadata(0, 0, 0, ""),
             }
 
         # Create subject-indexed storage for fast subject lookups
         subject_data = {}
         strata_reference = {}
 
-        # Group by subject for efficient subject-based operations
-        for subject_id, subject_sessions in session_data.groupby("subject_id"):
-            # Sort sessions by date
-            subject_sessions = subject_sessions.sort_values("session_date")
-
-            # Store only essential columns to save memory
-            essential_columns = [
-                "subject_id",
-                "session_date",
-                "session",
-                "strata",
-                "session_index",
-                "session_overall_percentile",
-                "overall_percentile_category",
-                "session_overall_rolling_avg",
-                "is_current_strata",
-                "is_last_session",
-                "outlier_weight",
-                "is_outlier",
-                "PI",
-                "trainer",
-                "rig",
-                "current_stage_actual",
-                "curriculum_name",
-                "water_day_total",
-                "base_weight",
-                "target_weight",
-                "weight_after",
-                "total_trials",
-                "finished_trials",
-                "ignore_rate",
-                "foraging_performance",
-                "abs(bias_naive)",
-                "finished_rate",
-                "total_trials_with_autowater",
-                "finished_trials_with_autowater",
-                "finished_rate_with_autowater",
-                "ignore_rate_with_autowater",
-                "autowater_collected",
-                "autowater_ignored",
-                "water_day_total_last_session",
-                "water_after_session_last_session",
-            ]
+        # Store only essential columns to save memory
+        essential_columns = [
+            "subject_id",
+            "session_date",
+            "session",
+            "strata",
+            "session_index",
+            "session_overall_percentile",
+            "overall_percentile_category",
+            "session_overall_rolling_avg",
+            "is_current_strata",
+            "is_last_session",
+            "outlier_weight",
+            "is_outlier",
+            "PI",
+            "trainer",
+            "rig",
+            "current_stage_actual",
+            "curriculum_name",
+            "water_day_total",
+            "base_weight",
+            "target_weight",
+            "weight_after",
+            "total_trials",
+            "finished_trials",
+            "ignore_rate",
+            "foraging_performance",
+            "abs(bias_naive)",
+            "finished_rate",
+            "total_trials_with_autowater",
+            "finished_trials_with_autowater",
+            "finished_rate_with_autowater",
+            "ignore_rate_with_autowater",
+            "autowater_collected",
+            "autowater_ignored",
+            "water_day_total_last_session",
+            "water_after_session_last_session",
+        ]
 
-            # Add feature-specific columns
-            feature_columns = [
-                col
-                for col in subject_sessions.columns
-                if col.endswith(
-                    ("_session_percentile", "_category", "_processed_rolling_avg")
-                )
-            ]
-            essential_columns.extend(feature_columns)
+        # Add feature-specific columns
+        feature_columns = [
+            col
+            for col in session_data.columns
+            if col.endswith(
+                ("_session_percentile", "_category", "_processed_rolling_avg")
+            )
+        ]
+        essential_columns.extend(feature_columns)
 
-            # Add Wilson confidence interval columns
-            ci_columns = [
-                col
-                for col in subject_sessions.columns
-                if col.endswith(("_ci_lower", "_ci_upper"))
-            ]
-            essential_columns.extend(ci_columns)
+        # Add Wilson confidence interval columns
+        ci_columns = [
+            col
+            for col in session_data.columns
+            if col.endswith(("_ci_lower", "_ci_upper"))
+        ]
+        essential_columns.extend(ci_columns)
 
-            # Filter to available columns and ensure uniqueness
-            available_columns = [
-                col for col in essential_columns if col in subject_sessions.columns
-            ]
-            # Remove duplicates while preserving order
-            unique_columns = []
-            seen = set()
-            for col in available_columns:
-                if col not in seen:
-                    unique_columns.append(col)
-                    seen.add(col)
+        # Filter to available columns, removing duplicates while preserving order
+        column_set = frozenset(session_data.columns)
+        unique_columns = list(
+            dict.fromkeys(col for col in essential_columns if col in column_set)
+        )
+
+        # Sort once by subject and date, then split into per-subject row ranges
+        sorted_sessions, subject_offsets = self._index_subject_rows(session_data)
+
+        # Materialize the columns once and slice them per subject (columnar)
+        # Low-cardinality string columns are kept as Categoricals, so each
+        # subject's slice holds small integer codes over shared categories
+        session_columns = {
+            col: (
+                pd.Categorical(sorted_sessions[col])
+                if col in LOW_CARDINALITY_COLUMNS or col.endswith("_category")
+                else sorted_sessions[col].to_numpy()
+            )
+            for col in unique_columns
+        }
+        strata_values = sorted_sessions["strata"].tolist()
+        session_dates = sorted_sessions["session_date"].tolist()
+        first_dates, last_dates = self._subject_date_bounds(
+            sorted_sessions, subject_offsets
+        )
+
+        for (subject_id, (start, stop)), first_date, last_date in zip(
+            subject_offsets.items(), first_dates, last_dates
+        ):
+            count = stop - start
+
+            # Keep the first session of each strata, treating missing as one
+            strata_history = []
+            seen_strata = set()
+            for idx in range(start, stop):
+                strata = strata_values[idx]
+                strata_key = strata if not pd.isna(strata) else None
+                if strata_key not in seen_strata:
+                    seen_strata.add(strata_key)
+                    strata_history.append(
+                        {"strata": strata, "session_date": session_dates[idx]}
+                    )
 
             # Store compressed subject data
             subject_data[subject_id] = {
-                "sessions": subject_sessions[unique_columns].to_dict("records"),
-                "current_strata": subject_sessions["strata"].iloc[-1],
-                "total_sessions": len(subject_sessions),
-                "first_session_date": subject_sessions["session_date"].min(),
-                "last_session_date": subject_sessions["session_date"].max(),
-                "strata_history": subject_sessions[["strata", "session_date"]]
-                .drop_duplicates("strata")
-                .to_dict("records"),
+                "sessions": {
+                    "columns": {
+                        col: values[start:stop]
+                        for col, values in session_columns.items()
+                    },
+                    "n": count,
+                },
+                "current_strata": strata_values[stop - 1],
+                "total_sessions": count,
+                "first_session_date": first_date,
+                "last_session_date": last_date,
+                "strata_history": strata_history,
             }
 
-        # Create strata-indexed reference distributions for percentile calculations
-        for strata, strata_sessions in session_data.groupby("strata"):
-            processed_features = [
-                col
-                for col in strata_sessions.columns
-                if col.endswith("_processed_rolling_avg")
-            ]
+        # Processed features are the same columns for every strata
+        processed_features = [
+            col for col in feature_columns if col.endswith("_processed_rolling_avg")
+        ]
+
+        # Locate each strata's rows once and pull the feature columns out as
+        # arrays; each feature keeps its own non-missing rows
+        strata_indices = session_data.groupby(
+            "strata", observed=True, sort=False
+        ).indices
+        subject_values = session_data["subject_id"].to_numpy()
+        has_subject = session_data["subject_id"].notna().to_numpy()
+        feature_values = {}
+        for feature in processed_features:
+            values = session_data[feature].to_numpy()
+            feature_values[feature] = (values, has_subject & pd.notna(values))
 
+        # Create strata-indexed reference distributions for percentile calculations
+        for strata, rows in strata_indices.items():
             # Create strata reference even if no processed features exist
             reference_distributions = {}
-            if processed_features:
-                reference_data = strata_sessions[
-                    processed_features + ["subject_id"]
-                ].dropna()
-                reference_distributions = {
-                    feature: reference_data[feature].values.tolist()
-                    for feature in processed_features
-                    if not reference_data[feature].isna().all()
-                }
+            for feature, (values, valid) in feature_values.items():
+                reference_rows = rows[valid[rows]]
+                if len(reference_rows):
+                    reference_distributions[feature] = values[reference_rows].tolist()
 
             strata_reference[strata] = {
-                "subject_count": len(strata_sessions["subject_id"].unique()),
-                "session_count": len(strata_sessions),
+                "subject_count": len(pd.unique(subject_values[rows])),
+                "session_count": len(rows),
                 "reference_distributions": reference_distributions,
             }
 
@@ -211,14 +354,9 @@ class UIDataManager:
         optimized_storage = {
             "subjects": subject_data,
             "strata_reference": strata_reference,
-            "metadata": {
-                "total_subjects": len(subject_data),
-                "total_sessions": len(session_data),
-                "total_strata": len(strata_reference),
-                "storage_timestamp": pd.Timestamp.now(),
-                "data_hash": data_hash,
-                "wilson_ci_enabled": True,
-            },
+            "metadata": self._build_storage_metadata(
+                len(subject_data), len(session_data), len(strata_reference), data_hash
+            ),
         }
 
         logger.info(
@@ -227,16 +365,122 @@ class UIDataManager:
 
         return optimized_storage
 
+    def _build_storage_metadata(
+        self,
+        total_subjects: int,
+        total_sessions: int,
+        total_strata: int,
+        data_hash: str,
+        now: pd.Timestamp = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata block of the optimized storage structure
+
+        Parameters:
+            total_subjects: int
+                Number of subjects stored
+            total_sessions: int
+                Number of sessions in the input data
+            total_strata: int
+                Number of strata references stored
+            data_hash: str
+                Hash of the input data for cache validation
+            now: pd.Timestamp
+                Storage timestamp; taken once here when not given
+
+        Returns:
+            Dict[str, Any]: Storage metadata
+        """
+        return {
+            "total_subjects": total_subjects,
+            "total_sessions": total_sessions,
+            "total_strata": total_strata,
+            "storage_timestamp": pd.Timestamp.now() if now is None else now,
+            "data_hash": data_hash,
+            "wilson_ci_enabled": True,
+        }
+
+    def _index_subject_rows(self, session_data: pd.DataFrame) -> tuple:
+        """
+        Sort sessions by subject and date once and locate each subject's rows
+
+        Parameters:
+            session_data: pd.DataFrame
+                Session-level data with subject_id and session_date columns
+
+        Returns:
+            tuple: (sorted sessions, {subject_id: (start, stop)} row offsets)
+        """
+        sorted_sessions = (
+            session_data[session_data["subject_id"].notna()]
+            .sort_values(["subject_id", "session_date"], kind="mergesort")
+            .reset_index(drop=True)
+        )
+        subject_ids, starts, counts = np.unique(
+            sorted_sessions["subject_id"].to_numpy(),
+            return_index=True,
+            return_counts=True,
+        )
+        subject_offsets = dict(
+            zip(subject_ids.tolist(), zip(starts.tolist(), (starts + counts).tolist()))
+        )
+        return sorted_sessions, subject_offsets
+
+    def _subject_date_bounds(
+        self, sorted_sessions: pd.DataFrame, subject_offsets: Dict[str, tuple]
+    ) -> tuple:
+        """
+        Get each subject's first and last session dates from its row range
+
+        Parameters:
+            sorted_sessions: pd.DataFrame
+                Sessions sorted by subject and date
+            subject_offsets: Dict[str, tuple]
+                {subject_id: (start, stop)} row offsets
+
+        Returns:
+            tuple: (first dates, last dates) lists in subject_offsets order,
+                NaT for subjects without a valid date
+        """
+        session_dates = sorted_sessions["session_date"].tolist()
+        # NaT sorts to the end of each subject, so valid dates lead each range
+        valid_date_totals = np.concatenate(
+            ([0], np.cumsum(sorted_sessions["session_date"].notna().to_numpy()))
+        ).tolist()
+
+        first_dates = []
+        last_dates = []
+        for start, stop in subject_offsets.values():
+            valid_count = valid_date_totals[stop] - valid_date_totals[start]
+            if valid_count:
+                first_dates.append(session_dates[start])
+                last_dates.append(session_dates[start + valid_count - 1])
+            else:
+                first_dates.append(pd.NaT)
+                last_dates.append(pd.NaT)
+        return first_dates, last_dates
+
     def _calculate_data_hash(self, df: pd.DataFrame, cache_manager=None) -> str:
         """Calculate a hash for data validation"""
         if cache_manager is not None and hasattr(cache_manager, "calculate_data_hash"):
             return cache_manager.calculate_data_hash(df)
 
-        # Fallback hash calculation
+        # Fallback hash over the row count and the content of the first and
+        # last rows, so no full pass over the data is needed
         import hashlib
 
-        data_str = f"{len(df)}_{df['subject_id'].nunique()}_{df['session_date'].max()}"
-        return hashlib.md5(data_str.encode()).hexdigest()[:8]
+        key_columns = df[["subject_id", "session_date"]]
+        sample = pd.concat(
+            [
+                key_columns.head(DATA_HASH_SAMPLE_ROWS),
+                key_columns.tail(DATA_HASH_SAMPLE_ROWS),
+            ]
+        )
+        data_hash = hashlib.md5(np.int64(len(df)).tobytes())
+        data_hash.update(
+            pd.util.hash_pandas_object(sample, index=False).to_numpy().tobytes()
+        )
+        return data_hash.hexdigest()[:8]
 
     def create_ui_optimized_structures(
         self, session_data: pd.DataFrame
@@ -260,7 +504,7 @@ class UIDataManager:
         # Initialize UI structure
         ui_structures = {
             "time_series_data": {},
-            "table_display_cache": [],
+            "table_display_frame": pd.DataFrame(),
             "subject_lookup": {},
             "strata_lookup": {},
         }
@@ -269,36 +513,79 @@ class UIDataManager:
         if session_data.empty:
             return ui_structures
 
-        for subject_id, subject_sessions in session_data.groupby("subject_id"):
-            # Sort by date to get proper order
-            subject_sessions = subject_sessions.sort_values("session_date")
-            latest_session = subject_sessions.iloc[-1]
+        # Sort once and share the subject row ranges with the helpers below
+        sorted_sessions, subject_offsets = self._index_subject_rows(session_data)
 
+        # Latest sessions and date bounds come straight from the range boundaries
+        latest_sessions = sorted_sessions.iloc[
+            [stop - 1 for _, stop in subject_offsets.values()]
+        ]
+        first_dates, last_dates = self._subject_date_bounds(
+            sorted_sessions, subject_offsets
+        )
+        unique_strata = (
+            sorted_sessions.groupby("subject_id", observed=True, sort=False)["strata"]
+            .nunique()
+            .tolist()
+        )
+
+        def latest_values(col, default=None):
+            if col in latest_sessions.columns:
+                return latest_sessions[col].tolist()
+            return [default] * len(latest_sessions)
+
+        for (
+            subject_id,
+            (start, stop),
+            session_date,
+            session,
+            strata,
+            overall_percentile,
+            overall_category,
+            pi,
+            trainer,
+            rig,
+            first_date,
+            last_date,
+            strata_count,
+        ) in zip(
+            subject_offsets,
+            subject_offsets.values(),
+            latest_sessions["session_date"].tolist(),
+            latest_sessions["session"].tolist(),
+            latest_sessions["strata"].tolist(),
+            latest_values("session_overall_percentile"),
+            latest_values("overall_percentile_category", "NS"),
+            latest_values("PI", "N/A"),
+            latest_values("trainer", "N/A"),
+            latest_values("rig", "N/A"),
+            first_dates,
+            last_dates,
+            unique_strata,
+        ):
             ui_structures["subject_lookup"][subject_id] = {
                 "latest_session": {
-                    "session_date": latest_session["session_date"],
-                    "session": latest_session["session"],
-                    "strata": latest_session["strata"],
-                    "overall_percentile": latest_session.get(
-                        "session_overall_percentile"
-                    ),
-                    "overall_category": latest_session.get(
-                        "overall_percentile_category", "NS"
-                    ),
-                    "PI": latest_session.get("PI", "N/A"),
-                    "trainer": latest_session.get("trainer", "N/A"),
-                    "rig": latest_session.get("rig", "N/A"),
+                    "session_date": session_date,
+                    "session": session,
+                    "strata": strata,
+                    "overall_percentile": overall_percentile,
+                    "overall_category": overall_category,
+                    "PI": pi,
+                    "trainer": trainer,
+                    "rig": rig,
                 },
                 "summary": {
-                    "total_sessions": len(subject_sessions),
-                    "first_session_date": subject_sessions["session_date"].min(),
-                    "last_session_date": subject_sessions["session_date"].max(),
-                    "unique_strata": subject_sessions["strata"].nunique(),
-                    "current_strata": latest_session["strata"],
+                    "total_sessions": stop - start,
+                    "first_session_date": first_date,
+                    "last_session_date": last_date,
+                    "unique_strata": strata_count,
+                    "current_strata": strata,
                 },
             }
 
-        for strata, strata_sessions in session_data.groupby("strata"):
+        for strata, strata_sessions in session_data.groupby(
+            "strata", observed=True, sort=False
+        ):
             unique_subjects = strata_sessions["subject_id"].nunique()
             total_sessions = len(strata_sessions)
 
@@ -317,10 +604,14 @@ class UIDataManager:
                 "subjects": strata_sessions["subject_id"].unique().tolist(),
             }
 
-        ui_structures["time_series_data"] = self._create_time_series_data(session_data)
+        ui_structures["time_series_data"] = self._create_time_series_data(
+            sorted_sessions, subject_offsets
+        )
 
-        ui_structures["table_display_cache"] = self._create_table_display_cache(
-            session_data
+        # Table rows are kept column-oriented; get_table_display_data converts
+        # them to records once, on first request
+        ui_structures["table_display_frame"] = self._create_table_display_frame(
+            sorted_sessions, subject_offsets
         )
 
         # Store data hash in UI structures for cache validation
@@ -333,146 +624,162 @@ class UIDataManager:
         return ui_structures
 
     def _process_subject_time_series(
-        self,
-        subject_id: str,
-        subject_sessions_data: pd.DataFrame,
-        feature_stats: dict,
-        overall_stats: dict,
-        high_outlier_subjects: list,
+        self, columns: Dict[str, list], rows: slice
     ) -> dict:
         """
         Extract helper method to process individual subject time series data
 
         This reduces complexity in _create_time_series_data by handling
-        the processing logic for a single subject.
+        the processing logic for a single subject. Columns are precomputed
+        over all date-sorted sessions and sliced by the subject's rows, so
+        no shared state is touched.
         """
-        subject_sessions = subject_sessions_data.sort_values("session_date")
-
         # Extract time series data in compressed format
         time_series = {
-            "sessions": subject_sessions["session"].tolist(),
-            "dates": subject_sessions["session_date"].dt.strftime("%Y-%m-%d").tolist(),
-            "overall_percentiles": subject_sessions["session_overall_percentile"]
-            .fillna(-1)
-            .tolist(),
-            "overall_rolling_avg": subject_sessions["session_overall_rolling_avg"]
-            .fillna(-1)
-            .tolist(),
-            "strata": subject_sessions["strata"].tolist(),
+            "sessions": columns["session"][rows],
+            "dates": columns["session_date"][rows],
+            "overall_percentiles": columns["session_overall_percentile"][rows],
+            "overall_rolling_avg": columns["session_overall_rolling_avg"][rows],
+            "strata": columns["strata"][rows],
         }
 
         # Add Wilson confidence intervals for overall percentiles
-        self._add_overall_wilson_ci(time_series, subject_sessions, overall_stats)
+        self._add_overall_wilson_ci(time_series, columns, rows)
 
         # Add outlier detection information
-        self._add_outlier_detection_info(
-            time_series, subject_sessions, subject_id, high_outlier_subjects
-        )
+        if "is_outlier" in columns:
+            time_series["is_outlier"] = columns["is_outlier"][rows]
 
         # Add feature-specific data
-        self._add_feature_data_to_time_series(
-            time_series, subject_sessions, feature_stats
-        )
+        self._add_feature_data_to_time_series(time_series, columns, rows)
 
         return time_series
 
     def _add_overall_wilson_ci(
-        self, time_series: dict, subject_sessions: pd.DataFrame, overall_stats: dict
+        self, time_series: dict, columns: Dict[str, list], rows: slice
     ):
         """Add Wilson confidence intervals for overall percentiles"""
-        if "session_overall_percentile_ci_lower" in subject_sessions.columns:
-            time_series["overall_percentiles_ci_lower"] = (
-                subject_sessions["session_overall_percentile_ci_lower"]
-                .fillna(-1)
-                .tolist()
-            )
-            time_series["overall_percentiles_ci_upper"] = (
-                subject_sessions["session_overall_percentile_ci_upper"]
-                .fillna(-1)
-                .tolist()
-            )
-            valid_ci_count = len(
-                subject_sessions["session_overall_percentile_ci_lower"].dropna()
-            )
-            if valid_ci_count > 0:
-                overall_stats["ci_sessions"] += valid_ci_count
-                overall_stats["subjects_with_data"] += 1
-
-    def _add_outlier_detection_info(
-        self,
-        time_series: dict,
-        subject_sessions: pd.DataFrame,
-        subject_id: str,
-        high_outlier_subjects: list,
-    ):
-        """Add outlier detection information for visualization"""
-        if "is_outlier" in subject_sessions.columns:
-            time_series["is_outlier"] = (
-                subject_sessions["is_outlier"].fillna(False).tolist()
-            )
-            outlier_count = subject_sessions["is_outlier"].sum()
-            if outlier_count > len(subject_sessions) * 0.2:
-                high_outlier_subjects.append(
-                    (subject_id, outlier_count, len(subject_sessions))
-                )
+        if "session_overall_percentile_ci_lower" in columns:
+            time_series["overall_percentiles_ci_lower"] = columns[
+                "session_overall_percentile_ci_lower"
+            ][rows]
+            time_series["overall_percentiles_ci_upper"] = columns[
+                "session_overall_percentile_ci_upper"
+            ][rows]
 
     def _add_feature_data_to_time_series(
-        self, time_series: dict, subject_sessions: pd.DataFrame, feature_stats: dict
+        self, time_series: dict, columns: Dict[str, list], rows: slice
     ):
         """Add RAW feature values for timeseries plotting"""
         for feature in self.features:
             # Store raw feature values for timeseries component to apply its own rolling average
-            if feature in subject_sessions.columns:
-                time_series[f"{feature}_raw"] = (
-                    subject_sessions[feature].fillna(-1).tolist()
-                )
-                valid_count = len(subject_sessions[feature].dropna())
-                if valid_count > 0:
-                    feature_stats[feature]["subjects_with_data"] += 1
-                    feature_stats[feature]["total_valid_points"] += valid_count
+            if feature in columns:
+                time_series[f"{feature}_raw"] = columns[feature][rows]
 
             # Keep percentiles for fallback compatibility
             percentile_col = f"{feature}_session_percentile"
-            if percentile_col in subject_sessions.columns:
-                time_series[f"{feature}_percentiles"] = (
-                    subject_sessions[percentile_col].fillna(-1).tolist()
-                )
+            if percentile_col in columns:
+                time_series[f"{feature}_percentiles"] = columns[percentile_col][rows]
 
             # Add Wilson confidence intervals for feature percentiles
-            self._add_feature_wilson_ci(
-                time_series, subject_sessions, feature, feature_stats
-            )
+            ci_lower_col = f"{feature}_session_percentile_ci_lower"
+            ci_upper_col = f"{feature}_session_percentile_ci_upper"
+            if ci_lower_col in columns and ci_upper_col in columns:
+                time_series[f"{feature}_percentile_ci_lower"] = columns[ci_lower_col][
+                    rows
+                ]
+                time_series[f"{feature}_percentile_ci_upper"] = columns[ci_upper_col][
+                    rows
+                ]
+
+    def _extract_time_series_columns(self, sorted_sessions: pd.DataFrame) -> tuple:
+        """
+        Convert the time series columns once for all subjects
 
-    def _add_feature_wilson_ci(
-        self,
-        time_series: dict,
-        subject_sessions: pd.DataFrame,
-        feature: str,
-        feature_stats: dict,
-    ):
-        """Add Wilson confidence intervals for feature percentiles"""
-        ci_lower_col = f"{feature}_session_percentile_ci_lower"
-        ci_upper_col = f"{feature}_session_percentile_ci_upper"
+        Numeric columns are kept as float arrays, so each subject's series is
+        a view into them rather than its own list.
 
-        if (
-            ci_lower_col in subject_sessions.columns
-            and ci_upper_col in subject_sessions.columns
-        ):
-            time_series[f"{feature}_percentile_ci_lower"] = (
-                subject_sessions[ci_lower_col].fillna(-1).tolist()
+        Parameters:
+            sorted_sessions: pd.DataFrame
+                Sessions sorted by subject and date
+
+        Returns:
+            tuple: ({column: list or float array}, {column: cumulative count
+                array}), with missing numeric values filled with -1; counts are
+                of non-missing values, or of outliers for is_outlier
+        """
+        columns = {
+            "session": sorted_sessions["session"].tolist(),
+            "session_date": sorted_sessions["session_date"]
+            .dt.strftime("%Y-%m-%d")
+            .tolist(),
+            "strata": sorted_sessions["strata"].tolist(),
+        }
+        running_totals = {}
+
+        column_set = frozenset(sorted_sessions.columns)
+        if "is_outlier" in column_set:
+            is_outlier = sorted_sessions["is_outlier"].fillna(False)
+            columns["is_outlier"] = is_outlier.tolist()
+            running_totals["is_outlier"] = np.concatenate(
+                ([0], np.cumsum(is_outlier.to_numpy(dtype=float)))
             )
-            time_series[f"{feature}_percentile_ci_upper"] = (
-                subject_sessions[ci_upper_col].fillna(-1).tolist()
+
+        filled_columns = [
+            "session_overall_percentile",
+            "session_overall_rolling_avg",
+            "session_overall_percentile_ci_lower",
+            "session_overall_percentile_ci_upper",
+        ]
+        for feature in self.features:
+            filled_columns.extend(
+                [
+                    feature,
+                    f"{feature}_session_percentile",
+                    f"{feature}_session_percentile_ci_lower",
+                    f"{feature}_session_percentile_ci_upper",
+                ]
             )
-            valid_ci_count = len(subject_sessions[ci_lower_col].dropna())
-            feature_stats[feature]["ci_sessions"] += valid_ci_count
 
-    def _create_time_series_data(self, session_data: pd.DataFrame) -> Dict[str, Any]:
-        """Create time series data for visualization components with Wilson CIs"""
-        time_series_data = {}
+        for col in filled_columns:
+            if col not in column_set:
+                continue
+            values = sorted_sessions[col]
+            columns[col] = values.fillna(-1).to_numpy(dtype=float)
+            running_totals[col] = np.concatenate(
+                ([0], np.cumsum(values.notna().to_numpy()))
+            )
+
+        return columns, running_totals
+
+    def _summarize_time_series(
+        self,
+        columns: Dict[str, list],
+        running_totals: Dict[str, np.ndarray],
+        subject_offsets: Dict[str, tuple],
+    ) -> tuple:
+        """
+        Compute the aggregate time series statistics for all subjects at once
+
+        Parameters:
+            columns: Dict[str, list]
+                Precomputed time series columns
+            running_totals: Dict[str, np.ndarray]
+                Cumulative counts per column from _extract_time_series_columns
+            subject_offsets: Dict[str, tuple]
+                {subject_id: (start, stop)} row offsets
+
+        Returns:
+            tuple: (feature_stats, overall_stats, high_outlier_subjects)
+        """
+        subject_ids = list(subject_offsets)
+        bounds = np.array(list(subject_offsets.values()), dtype=np.int64).reshape(-1, 2)
+        starts, stops = bounds[:, 0], bounds[:, 1]
+
+        def subject_counts(col):
+            totals = running_totals[col]
+            return totals[stops] - totals[starts]
 
-        # Counters for aggregate reporting instead of per-subject spam
-        total_subjects_processed = 0
         feature_stats = {
             feature: {
                 "subjects_with_data": 0,
@@ -486,21 +793,62 @@ class UIDataManager:
             "total_valid_points": 0,
             "ci_sessions": 0,
         }
+
+        if "session_overall_percentile_ci_lower" in columns:
+            ci_counts = subject_counts("session_overall_percentile_ci_lower")
+            overall_stats["ci_sessions"] = int(ci_counts.sum())
+            overall_stats["subjects_with_data"] = int(np.count_nonzero(ci_counts))
+
+        for feature in self.features:
+            if feature in columns:
+                valid_counts = subject_counts(feature)
+                feature_stats[feature]["subjects_with_data"] = int(
+                    np.count_nonzero(valid_counts)
+                )
+                feature_stats[feature]["total_valid_points"] = int(valid_counts.sum())
+
+            ci_lower_col = f"{feature}_session_percentile_ci_lower"
+            ci_upper_col = f"{feature}_session_percentile_ci_upper"
+            if ci_lower_col in columns and ci_upper_col in columns:
+                feature_stats[feature]["ci_sessions"] = int(
+                    subject_counts(ci_lower_col).sum()
+                )
+
         high_outlier_subjects = []
+        if "is_outlier" in columns:
+            outlier_counts = subject_counts("is_outlier")
+            session_counts = stops - starts
+            for idx in np.flatnonzero(outlier_counts > session_counts * 0.2):
+                high_outlier_subjects.append(
+                    (
+                        subject_ids[idx],
+                        int(outlier_counts[idx]),
+                        int(session_counts[idx]),
+                    )
+                )
 
-        for subject_id, subject_sessions_data in session_data.groupby("subject_id"):
-            total_subjects_processed += 1
-            time_series_data[subject_id] = self._process_subject_time_series(
-                subject_id,
-                subject_sessions_data,
-                feature_stats,
-                overall_stats,
-                high_outlier_subjects,
-            )
+        return feature_stats, overall_stats, high_outlier_subjects
+
+    def _create_time_series_data(
+        self, sorted_sessions: pd.DataFrame, subject_offsets: Dict[str, tuple]
+    ) -> Dict[str, Any]:
+        """Create time series data for visualization components with Wilson CIs"""
+        # Fill and convert each column once, then slice per subject
+        columns, running_totals = self._extract_time_series_columns(sorted_sessions)
+
+        time_series_data = {
+            subject_id: self._process_subject_time_series(columns, slice(start, stop))
+            for subject_id, (start, stop) in subject_offsets.items()
+        }
+
+        # Aggregate counters for reporting instead of per-subject spam
+        feature_stats, overall_stats, high_outlier_subjects = (
+            self._summarize_time_series(columns, running_totals, subject_offsets)
+        )
 
         # Log aggregate summaries
         self._log_time_series_summary(
-            total_subjects_processed,
+            len(time_series_data),
             high_outlier_subjects,
             feature_stats,
             overall_stats,
@@ -539,105 +887,151 @@ class UIDataManager:
                 f"Overall percentiles: {overall_stats['subjects_with_data']} subjects with Wilson CI data"
             )
 
+    @cached_property
+    def _threshold_analyzer(self):
+        """Threshold analyzer for the table display cache, built once per manager"""
+        from app_utils.app_analysis.threshold_analyzer import ThresholdAnalyzer
+
+        return ThresholdAnalyzer(COMBINED_THRESHOLD_CONFIG)
+
     def _calculate_threshold_alerts(
-        self, row: pd.Series, subject_sessions: pd.DataFrame
+        self,
+        most_recent: pd.DataFrame,
+        sorted_sessions: pd.DataFrame,
+        subject_offsets: Dict[str, tuple],
     ) -> tuple:
         """
-        Calculate threshold alerts for a subject
-
-        Returns tuple of (total_sessions_alert, stage_sessions_alert, water_day_total_alert, overall_threshold_alert)
-        """
-        from app_utils.app_analysis.threshold_analyzer import ThresholdAnalyzer
+        Calculate threshold alerts for all subjects at once
 
-        threshold_config = {
-            "session": {"condition": "gt", "value": 40},
-            "water_day_total": {"condition": "gt", "value": 3.5},
-        }
+        Session counts, stage session counts and water totals are compared
+        against the thresholds as arrays; alert strings are only formatted
+        for the subjects that cross a threshold.
 
-        # Stage-specific session thresholds
-        stage_thresholds = {
-            "STAGE_1": 5,
-            "STAGE_2": 5,
-            "STAGE_3": 6,
-            "STAGE_4": 10,
-            "STAGE_FINAL": 10,
-            "GRADUATED": 20,
-        }
-
-        # Combine general thresholds with stage-specific thresholds
-        combined_config = threshold_config.copy()
-        for stage, threshold in stage_thresholds.items():
-            combined_config[f"stage_{stage}_sessions"] = {
-                "condition": "gt",
-                "value": threshold,
-            }
+        Parameters:
+            most_recent: pd.DataFrame
+                Most recent session per subject, in subject_offsets order
+            sorted_sessions: pd.DataFrame
+                Sessions sorted by subject and date
+            subject_offsets: Dict[str, tuple]
+                {subject_id: (start, stop)} row offsets
 
-        threshold_analyzer = ThresholdAnalyzer(combined_config)
+        Returns:
+            tuple: Lists of (total_sessions_alert, stage_sessions_alert,
+                water_day_total_alert, overall_threshold_alert) per subject
+        """
+        threshold_analyzer = self._threshold_analyzer
+        bounds = np.array(list(subject_offsets.values()), dtype=np.int64).reshape(-1, 2)
+        starts = bounds[:, 0]
+        session_counts = bounds[:, 1] - starts
+        n_subjects = len(session_counts)
 
         # Initialize alert values
-        total_sessions_alert = "N"
-        stage_sessions_alert = "N"
-        water_day_total_alert = "N"
-        overall_threshold_alert = "N"
-
-        if not subject_sessions.empty:
-            # Check total sessions alert
-            total_sessions_result = threshold_analyzer.check_total_sessions(
-                subject_sessions
+        total_sessions_alerts = ["N"] * n_subjects
+        stage_sessions_alerts = ["N"] * n_subjects
+        water_day_total_alerts = ["N"] * n_subjects
+        any_alert = np.zeros(n_subjects, dtype=bool)
+
+        # Check total sessions alert
+        total_alert = session_counts > THRESHOLD_CONFIG["session"]["value"]
+        for idx in np.flatnonzero(total_alert):
+            total_sessions_alerts[idx] = threshold_analyzer.generate_alert(
+                True, "total_sessions", value=int(session_counts[idx])
+            )["display_format"]
+        any_alert |= total_alert
+
+        # Check stage-specific sessions alert: count each subject's sessions
+        # in its current stage, using codes over the thresholded stages
+        if "current_stage_actual" in most_recent.columns:
+            # Stages without a threshold get code -1 and are masked out below
+            stage_names = pd.Index(list(STAGE_SESSION_THRESHOLDS))
+            current_codes = stage_names.get_indexer(most_recent["current_stage_actual"])
+            session_codes = stage_names.get_indexer(
+                sorted_sessions["current_stage_actual"]
             )
-            total_sessions_alert = total_sessions_result["display_format"]
-            if total_sessions_result["alert"] == "T":
-                overall_threshold_alert = "T"
-
-            # Check stage-specific sessions alert
-            current_stage = row.get("current_stage_actual")
-            if current_stage and current_stage in stage_thresholds:
-                stage_sessions_result = threshold_analyzer.check_stage_sessions(
-                    subject_sessions, current_stage
-                )
-                stage_sessions_alert = stage_sessions_result["display_format"]
-                if stage_sessions_result["alert"] == "T":
-                    overall_threshold_alert = "T"
-
-            # Check water day total alert
-            water_day_total = row.get("water_day_total")
-            if not pd.isna(water_day_total):
-                water_alert_result = threshold_analyzer.check_water_day_total(
-                    water_day_total
-                )
-                water_day_total_alert = water_alert_result["display_format"]
-                if water_alert_result["alert"] == "T":
-                    overall_threshold_alert = "T"
+            in_current_stage = session_codes == np.repeat(current_codes, session_counts)
+            stage_counts = np.add.reduceat(in_current_stage, starts)
+
+            stage_alert = (current_codes >= 0) & (
+                stage_counts > STAGE_THRESHOLDS_ARR[current_codes]
+            )
+            for idx in np.flatnonzero(stage_alert):
+                stage_sessions_alerts[idx] = threshold_analyzer.generate_alert(
+                    True,
+                    "stage_sessions",
+                    value=int(stage_counts[idx]),
+                    stage=stage_names[current_codes[idx]],
+                )["display_format"]
+            any_alert |= stage_alert
+
+        # Check water day total alert
+        if "water_day_total" in most_recent.columns:
+            water_day_totals = most_recent["water_day_total"].to_numpy(dtype=float)
+            water_alert = (
+                water_day_totals > THRESHOLD_CONFIG["water_day_total"]["value"]
+            )
+            for idx in np.flatnonzero(water_alert):
+                water_day_total_alerts[idx] = threshold_analyzer.generate_alert(
+                    True, "water_day_total", value=float(water_day_totals[idx])
+                )["display_format"]
+            any_alert |= water_alert
+
+        overall_threshold_alerts = np.where(any_alert, "T", "N").tolist()
 
         return (
-            total_sessions_alert,
-            stage_sessions_alert,
-            water_day_total_alert,
-            overall_threshold_alert,
+            total_sessions_alerts,
+            stage_sessions_alerts,
+            water_day_total_alerts,
+            overall_threshold_alerts,
         )
 
-    def _create_display_row_base(self, row: pd.Series) -> dict:
-        """Create base display row with essential metadata"""
-        return {
-            "subject_id": row["subject_id"],
-            "session_date": row["session_date"],
-            "session": row["session"],
-            "strata": row["strata"],
-            "strata_abbr": self.get_strata_abbreviation(row["strata"]),
-            "overall_percentile": row.get("session_overall_percentile"),
-            "overall_category": row.get("overall_percentile_category", "NS"),
-            "percentile_category": row.get("overall_percentile_category", "NS"),
-            "combined_alert": row.get("overall_percentile_category", "NS"),
-            "session_overall_rolling_avg": row.get("session_overall_rolling_avg"),
-            "PI": row.get("PI", "N/A"),
-            "trainer": row.get("trainer", "N/A"),
-            "rig": row.get("rig", "N/A"),
-            "current_stage_actual": row.get("current_stage_actual", "N/A"),
-            "curriculum_name": row.get("curriculum_name", "N/A"),
-        }
+    def _display_column(self, frame: pd.DataFrame, col: str, default=None):
+        """Return a column of frame, or the default when the column is missing"""
+        return frame[col] if col in frame.columns else default
+
+    def _display_values(self, frame: pd.DataFrame, col: str) -> np.ndarray:
+        """Return a numeric column of frame as floats, NaN when it is missing"""
+        if col in frame.columns:
+            return frame[col].to_numpy(dtype=float, na_value=np.nan)
+        return np.full(len(frame), np.nan)
 
-    def _add_essential_metadata_to_display_row(self, display_row: dict, row: pd.Series):
-        """Add essential metadata columns to display row"""
+    def _add_display_base_columns(self, display: dict, most_recent: pd.DataFrame):
+        """Add base display columns with essential metadata"""
+        category = self._display_column(
+            most_recent, "overall_percentile_category", "NS"
+        )
+        display.update(
+            {
+                "subject_id": most_recent["subject_id"],
+                "session_date": most_recent["session_date"],
+                "session": most_recent["session"],
+                "strata": most_recent["strata"],
+                "strata_abbr": [
+                    self.get_strata_abbreviation(strata)
+                    for strata in most_recent["strata"].tolist()
+                ],
+                "overall_percentile": self._display_column(
+                    most_recent, "session_overall_percentile"
+                ),
+                "overall_category": category,
+                "percentile_category": category,
+                "combined_alert": category,
+                "session_overall_rolling_avg": self._display_column(
+                    most_recent, "session_overall_rolling_avg"
+                ),
+                "PI": self._display_column(most_recent, "PI", "N/A"),
+                "trainer": self._display_column(most_recent, "trainer", "N/A"),
+                "rig": self._display_column(most_recent, "rig", "N/A"),
+                "current_stage_actual": self._display_column(
+                    most_recent, "current_stage_actual", "N/A"
+                ),
+                "curriculum_name": self._display_column(
+                    most_recent, "curriculum_name", "N/A"
+                ),
+            }
+        )
+
+    def _add_essential_metadata_columns(self, display: dict, most_recent: pd.DataFrame):
+        """Add essential metadata columns to the display columns"""
         metadata_columns = [
             "water_day_total",
             "base_weight",
@@ -671,10 +1065,10 @@ class UIDataManager:
         ]
 
         for col in metadata_columns:
-            display_row[col] = row.get(col)
+            display[col] = self._display_column(most_recent, col)
 
-    def _add_autowater_columns_to_display_row(self, display_row: dict, row: pd.Series):
-        """Add autowater metrics to display row"""
+    def _add_autowater_columns(self, display: dict, most_recent: pd.DataFrame):
+        """Add autowater metrics to the display columns"""
         autowater_columns = [
             "total_trials_with_autowater",
             "finished_trials_with_autowater",
@@ -687,69 +1081,78 @@ class UIDataManager:
         ]
 
         for col in autowater_columns:
-            display_row[col] = row.get(col)
-
-    def _create_table_display_cache(
-        self, session_data: pd.DataFrame
-    ) -> List[Dict[str, Any]]:
-        """Create table display cache for fast rendering"""
-        # Get most recent session for each subject
-        most_recent = (
-            session_data.sort_values("session_date")
-            .groupby("subject_id")
-            .last()
-            .reset_index()
+            display[col] = self._display_column(most_recent, col)
+
+    def _create_table_display_frame(
+        self, sorted_sessions: pd.DataFrame, subject_offsets: Dict[str, tuple]
+    ) -> pd.DataFrame:
+        """Create table display data for fast rendering, one row per subject"""
+        # Get most recent session for each subject: rows are date-sorted, so
+        # this is the last row of each subject's range
+        last_rows = np.array([stop - 1 for _, stop in subject_offsets.values()])
+        most_recent = sorted_sessions.iloc[last_rows].reset_index(drop=True)
+
+        # groupby.last() takes the last non-missing value per column, so only
+        # columns with a missing latest value need the grouped pass
+        missing_columns = most_recent.columns[most_recent.isna().any()].tolist()
+        if missing_columns:
+            last_values = sorted_sessions.groupby(
+                "subject_id", observed=True, sort=False
+            )[missing_columns].last()
+            for col in missing_columns:
+                most_recent[col] = last_values[col].reset_index(drop=True)
+
+        # Build the display table column by column
+        display = {}
+
+        # Create base display columns
+        self._add_display_base_columns(display, most_recent)
+
+        # Add essential metadata
+        self._add_essential_metadata_columns(display, most_recent)
+
+        # Add autowater columns
+        self._add_autowater_columns(display, most_recent)
+
+        # Set computed threshold alert values for all subjects in one pass
+        (
+            total_sessions_alerts,
+            stage_sessions_alerts,
+            water_day_total_alerts,
+            overall_threshold_alerts,
+        ) = self._calculate_threshold_alerts(
+            most_recent, sorted_sessions, subject_offsets
+        )
+        display.update(
+            {
+                "threshold_alert": overall_threshold_alerts,
+                "total_sessions_alert": total_sessions_alerts,
+                "stage_sessions_alert": stage_sessions_alerts,
+                "water_day_total_alert": water_day_total_alerts,
+                "ns_reason": "",
+                "outlier_weight": self._display_column(
+                    most_recent, "outlier_weight", 1.0
+                ),
+                "is_outlier": self._display_column(most_recent, "is_outlier", False),
+            }
         )
 
-        table_data = []
-        for _, row in most_recent.iterrows():
-            subject_id = row["subject_id"]
-
-            # Get all sessions for this subject (needed for threshold calculations)
-            subject_sessions = session_data[session_data["subject_id"] == subject_id]
-
-            # Calculate threshold alerts for this subject
-            (
-                total_sessions_alert,
-                stage_sessions_alert,
-                water_day_total_alert,
-                overall_threshold_alert,
-            ) = self._calculate_threshold_alerts(row, subject_sessions)
-
-            # Create base display row
-            display_row = self._create_display_row_base(row)
-
-            # Add essential metadata
-            self._add_essential_metadata_to_display_row(display_row, row)
-
-            # Add autowater columns
-            self._add_autowater_columns_to_display_row(display_row, row)
-
-            # Set computed threshold alert values
-            display_row.update(
-                {
-                    "threshold_alert": overall_threshold_alert,
-                    "total_sessions_alert": total_sessions_alert,
-                    "stage_sessions_alert": stage_sessions_alert,
-                    "water_day_total_alert": water_day_total_alert,
-                    "ns_reason": "",
-                    "outlier_weight": row.get("outlier_weight", 1.0),
-                    "is_outlier": row.get("is_outlier", False),
-                }
-            )
-
-            # Add feature-specific data
-            self._add_feature_data_to_display_row(display_row, row)
+        # Classify CI certainty for every feature and the overall percentile
+        # in one pass
+        certainties = self._calculate_display_certainties(most_recent)
 
-            # Add overall percentile CI columns
-            self._add_overall_percentile_ci_to_display_row(display_row, row)
+        # Add feature-specific data
+        self._add_feature_display_columns(display, most_recent, certainties)
 
-            table_data.append(display_row)
+        # Add overall percentile CI columns
+        self._add_overall_percentile_ci_columns(display, most_recent, certainties)
 
-        return table_data
+        return pd.DataFrame(display, index=most_recent.index)
 
-    def _add_feature_data_to_display_row(self, display_row: dict, row: pd.Series):
-        """Add feature-specific data (both percentiles and rolling averages) to display row"""
+    def _add_feature_display_columns(
+        self, display: dict, most_recent: pd.DataFrame, certainties: dict
+    ):
+        """Add feature-specific data (both percentiles and rolling averages) to the display columns"""
         for feature in self.features:
             percentile_col = f"{feature}_session_percentile"
             category_col = f"{feature}_category"
@@ -757,73 +1160,96 @@ class UIDataManager:
             ci_lower_col = f"{feature}_session_percentile_ci_lower"
             ci_upper_col = f"{feature}_session_percentile_ci_upper"
 
-            display_row[f"{feature}_session_percentile"] = row.get(percentile_col)
-            display_row[f"{feature}_category"] = row.get(category_col, "NS")
-            display_row[f"{feature}_processed_rolling_avg"] = row.get(rolling_avg_col)
+            display[f"{feature}_session_percentile"] = self._display_column(
+                most_recent, percentile_col
+            )
+            display[f"{feature}_category"] = self._display_column(
+                most_recent, category_col, "NS"
+            )
+            display[f"{feature}_processed_rolling_avg"] = self._display_column(
+                most_recent, rolling_avg_col
+            )
 
             # Wilson CI columns (for percentile CIs)
-            ci_lower = row.get(ci_lower_col)
-            ci_upper = row.get(ci_upper_col)
-            display_row[f"{feature}_session_percentile_ci_lower"] = ci_lower
-            display_row[f"{feature}_session_percentile_ci_upper"] = ci_upper
-
-            # Calculate and add certainty classification for this feature
-            certainty = self._calculate_feature_certainty(
-                row, feature, ci_lower, ci_upper, percentile_col
+            display[f"{feature}_session_percentile_ci_lower"] = self._display_column(
+                most_recent, ci_lower_col
+            )
+            display[f"{feature}_session_percentile_ci_upper"] = self._display_column(
+                most_recent, ci_upper_col
             )
-            display_row[f"{feature}_certainty"] = certainty
+
+            # Add certainty classification for this feature
+            display[f"{feature}_certainty"] = certainties[f"{feature}_certainty"]
+
+    def _calculate_display_certainties(
+        self, most_recent: pd.DataFrame
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate certainty classifications for all features and the overall percentile
+
+        Parameters:
+            most_recent: pd.DataFrame
+                Most recent session per subject
+
+        Returns:
+            Dict[str, np.ndarray]: Certainty labels per subject, keyed by display column
+        """
+        sources = {
+            f"{feature}_certainty": f"{feature}_session_percentile"
+            for feature in self.features
+        }
+        sources["session_overall_percentile_certainty"] = "session_overall_percentile"
+
+        # Stack every (CI lower, CI upper, estimate) triple as subject x column
+        # matrices and classify them together
+        def stacked(suffix: str) -> np.ndarray:
+            return np.column_stack(
+                [
+                    self._display_values(most_recent, col + suffix)
+                    for col in sources.values()
+                ]
+            )
+
+        certainty = self._calculate_feature_certainty(
+            stacked("_ci_lower"), stacked("_ci_upper"), stacked(""), None
+        )
+        return {name: certainty[:, i] for i, name in enumerate(sources)}
 
     def _calculate_feature_certainty(
-        self, row: pd.Series, feature: str, ci_lower, ci_upper, percentile_col: str
-    ) -> str:
-        """Calculate certainty classification for a feature"""
-        if (
-            ci_lower is not None
-            and ci_upper is not None
-            and not pd.isna(ci_lower)
-            and not pd.isna(ci_upper)
-        ):
-            ci_width = ci_upper - ci_lower
-            percentile_value = row.get(percentile_col)
-            if percentile_value is not None and not pd.isna(percentile_value):
-                return self._calculate_ci_certainty_moderate(
-                    ci_width, percentile_value, feature
-                )
-            else:
-                return "unknown"
-        else:
-            return "unknown"
+        self,
+        ci_lower: np.ndarray,
+        ci_upper: np.ndarray,
+        percentile: np.ndarray,
+        feature: str,
+    ) -> np.ndarray:
+        """Calculate certainty classification per value, "unknown" without a CI and estimate"""
+        certainty = np.full(percentile.shape, "unknown", dtype=object)
+        has_estimate = ~(np.isnan(ci_lower) | np.isnan(ci_upper) | np.isnan(percentile))
+        certainty[has_estimate] = self._calculate_ci_certainty_moderate(
+            ci_upper[has_estimate] - ci_lower[has_estimate],
+            percentile[has_estimate],
+            feature,
+        )
+        return certainty
 
-    def _add_overall_percentile_ci_to_display_row(
-        self, display_row: dict, row: pd.Series
+    def _add_overall_percentile_ci_columns(
+        self, display: dict, most_recent: pd.DataFrame, certainties: dict
     ):
-        """Add overall percentile CI columns to display row"""
+        """Add overall percentile CI columns to the display columns"""
         overall_ci_lower_col = "session_overall_percentile_ci_lower"
         overall_ci_upper_col = "session_overall_percentile_ci_upper"
-        overall_ci_lower = row.get(overall_ci_lower_col)
-        overall_ci_upper = row.get(overall_ci_upper_col)
 
-        display_row[overall_ci_lower_col] = overall_ci_lower
-        display_row[overall_ci_upper_col] = overall_ci_upper
+        display[overall_ci_lower_col] = self._display_column(
+            most_recent, overall_ci_lower_col
+        )
+        display[overall_ci_upper_col] = self._display_column(
+            most_recent, overall_ci_upper_col
+        )
 
-        # Calculate overall percentile certainty
-        if (
-            overall_ci_lower is not None
-            and overall_ci_upper is not None
-            and not pd.isna(overall_ci_lower)
-            and not pd.isna(overall_ci_upper)
-        ):
-            overall_ci_width = overall_ci_upper - overall_ci_lower
-            overall_percentile = row.get("session_overall_percentile")
-            if overall_percentile is not None and not pd.isna(overall_percentile):
-                overall_certainty = self._calculate_ci_certainty_moderate(
-                    overall_ci_width, overall_percentile, "overall"
-                )
-                display_row["session_overall_percentile_certainty"] = overall_certainty
-            else:
-                display_row["session_overall_percentile_certainty"] = "unknown"
-        else:
-            display_row["session_overall_percentile_certainty"] = "unknown"
+        # Add overall percentile certainty
+        display["session_overall_percentile_certainty"] = certainties[
+            "session_overall_percentile_certainty"
+        ]
 
     def get_subject_display_data(
         self, subject_id: str, ui_structures: Dict[str, Any]
@@ -840,22 +1266,35 @@ class UIDataManager:
         Returns:
             Dict[str, Any]: Subject display data optimized for UI rendering
         """
-        return ui_structures.get("subject_lookup", {}).get(subject_id, {})
+        return ui_structures.get("subject_lookup", _EMPTY_LOOKUP).get(
+            subject_id, _EMPTY_LOOKUP
+        )
 
     def get_table_display_data(
-        self, ui_structures: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+        self, ui_structures: Dict[str, Any], as_frame: bool = False
+    ) -> Union[List[Dict[str, Any]], pd.DataFrame]:
         """
         Get optimized table display data for fast rendering
 
         Parameters:
             ui_structures: Dict[str, Any]
                 Pre-computed UI structures
+            as_frame: bool
+                Return the column-oriented table instead of row records
 
         Returns:
-            List[Dict[str, Any]]: Table data optimized for UI rendering
+            Union[List[Dict[str, Any]], pd.DataFrame]: Table data optimized for UI rendering
         """
-        return ui_structures.get("table_display_cache", [])
+        frame = ui_structures.get("table_display_frame")
+        if as_frame:
+            # Shallow copy so callers adding columns leave the cached table intact
+            return pd.DataFrame() if frame is None else frame.copy(deep=False)
+
+        if "table_display_cache" not in ui_structures:
+            ui_structures["table_display_cache"] = (
+                [] if frame is None else frame.to_dict("records")
+            )
+        return ui_structures["table_display_cache"]
 
     def get_time_series_data(
         self, subject_id: str, ui_structures: Dict[str, Any]
@@ -872,54 +1311,58 @@ class UIDataManager:
         Returns:
             Dict[str, Any]: Time series data optimized for UI rendering
         """
-        return ui_structures.get("time_series_data", {}).get(subject_id, {})
+        return ui_structures.get("time_series_data", _EMPTY_LOOKUP).get(
+            subject_id, _EMPTY_LOOKUP
+        )
 
     def _calculate_ci_certainty_moderate(
-        self, ci_width: float, target_value: float, feature_name: str = None
-    ) -> str:
+        self, ci_width, target_value, feature_name: str = None
+    ) -> np.ndarray:
         """
         Calculate CI certainty using 3-tier system based on CI width relative to point estimate
 
         Parameters:
-            ci_width: float
-                Width of the confidence interval
-            target_value: float
-                Point estimate (rolling average value) for relative threshold calculation
+            ci_width: array-like
+                Width of the confidence intervals
+            target_value: array-like
+                Point estimates (rolling average values) for relative threshold calculation
             feature_name: str
                 Optional feature name (currently unused, kept for compatibility)
 
         Returns:
-            str: 'certain', 'intermediate', or 'uncertain' based on CI width relative to point estimate
+            np.ndarray: 'certain', 'intermediate', or 'uncertain' per value based on CI width relative to point estimate
 
         Criteria:
             - certain: CI width ≤ 30% of point estimate
             - intermediate: 30% < CI width < 60% of point estimate
             - uncertain: CI width ≥ 60% of point estimate
         """
-        # Handle edge cases
-        if pd.isna(ci_width) or pd.isna(target_value):
-            return "intermediate"
-
-        # Avoid division by zero - if target_value is very small, use absolute threshold
-        if abs(target_value) < 1e-6:
-            # For very small target values, use absolute thresholds
-            if ci_width <= 0.01:  # Very narrow CI
-                return "certain"
-            elif ci_width >= 0.05:  # Very wide CI
-                return "uncertain"
-            else:
-                return "intermediate"
+        ci_width = np.asarray(ci_width, dtype=float)
+        target_value = np.asarray(target_value, dtype=float)
+        abs_target = np.abs(target_value)
 
         # Calculate relative CI width as percentage of point estimate
-        relative_ci_width = ci_width / abs(target_value)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_ci_width = ci_width / abs_target
+
+        # Avoid division by zero - if target_value is very small, use absolute
+        # thresholds (very narrow CI <= 0.01, very wide CI >= 0.05)
+        small_target = abs_target < CI_SMALL_TARGET
+        certain = np.where(
+            small_target,
+            ci_width <= CI_CERTAIN_ABSOLUTE_WIDTH,
+            relative_ci_width <= CI_CERTAIN_RELATIVE_WIDTH,
+        )
+        uncertain = np.where(
+            small_target,
+            ci_width >= CI_UNCERTAIN_ABSOLUTE_WIDTH,
+            relative_ci_width >= CI_UNCERTAIN_RELATIVE_WIDTH,
+        )
 
-        # Apply 3-tier thresholds
-        if relative_ci_width <= 0.30:  # CI width ≤ 30% of point estimate
-            return "certain"
-        elif relative_ci_width >= 0.60:  # CI width ≥ 60% of point estimate
-            return "uncertain"
-        else:  # 30% < CI width < 60% of point estimate
-            return "intermediate"
+        # Apply 3-tier thresholds as codes and map to labels once; missing
+        # values compare False and so stay intermediate
+        codes = 1 + uncertain.astype(np.int8) - certain.astype(np.int8)
+        return CI_CERTAINTY_LABELS[codes]
 
 
 def get_optimized_table_data(app_utils, use_cache: bool = True) -> pd.DataFrame:
@@ -941,10 +1384,10 @@ def get_optimized_table_data(app_utils, use_cache: bool = True) -> pd.DataFrame:
     logger.info("Getting optimized table data with intelligent cache fallback...")
 
     # First try to use UI-optimized table display data (fastest path)
-    table_data = app_utils.get_table_display_data(use_cache=use_cache)
-    if table_data:
+    table_data = app_utils.get_table_display_data(use_cache=use_cache, as_frame=True)
+    if isinstance(table_data, pd.DataFrame) and not table_data.empty:
         logger.info(f"Loaded {len(table_data)} subjects from UI cache")
-        return pd.DataFrame(table_data)
+        return table_data
 
     # Second option: Use cached session-level data
     elif (
@@ -989,28 +1432,57 @@ def process_unified_alerts_integration(
     """
     logger.info("Processing unified alerts integration...")
 
-    # Initialize output dataframe with basic alert columns
-    output_df = recent_sessions.copy()
+    # Initialize output dataframe with basic alert columns; a shallow copy is
+    # enough since Copy-on-Write copies only the columns written below
+    output_df = recent_sessions.copy(deep=False)
     output_df = _initialize_alert_columns(output_df)
 
     try:
         _ensure_pipeline_and_service_ready(app_utils)
 
         # Step 3: Get all subject IDs
-        subject_ids = recent_sessions["subject_id"].unique().tolist()
+        subject_ids = pd.unique(recent_sessions["subject_id"].to_numpy()).tolist()
 
         # Step 4: Get unified alerts for these subjects
         unified_alerts = app_utils.get_unified_alerts(subject_ids)
         logger.info(f"Got unified alerts for {len(unified_alerts)} subjects")
 
-        # Step 5: Apply alerts from unified_alerts
-        output_df = _apply_unified_alerts_to_output(output_df, unified_alerts)
+        # Step 5: Apply alerts from unified_alerts, reusing the last result
+        # when neither the alerts nor the table's alert inputs changed
+        alert_key = _alert_inputs_key(output_df, unified_alerts)
+        cache_manager = _app_cache_manager(app_utils)
+        cached = cache_manager.get(ALERT_RESULT_CACHE_KEY) if cache_manager else None
+        if (
+            cached is not None
+            and cached["alerts"] is unified_alerts
+            and cached["key"] == alert_key
+        ):
+            cached_columns = cached["columns"].set_axis(output_df.index)
+            output_df = output_df.assign(**dict(cached_columns.items()))
+            logger.info("Reused alerts for unchanged table data")
+        else:
+            output_df = _apply_unified_alerts_to_output(
+                output_df, unified_alerts, app_utils
+            )
+            output_df = _apply_alert_column_dtypes(output_df)
+            if cache_manager:
+                cache_manager.set(
+                    ALERT_RESULT_CACHE_KEY,
+                    {
+                        "alerts": unified_alerts,
+                        "key": alert_key,
+                        "columns": output_df[ALERT_RESULT_COLUMNS].reset_index(
+                            drop=True
+                        ),
+                    },
+                )
         logger.info(f"Applied alerts to {len(output_df)} subjects")
 
     except Exception as e:
         logger.warning(f"Alert processing failed: {str(e)}")
         logger.info("Continuing with default alert values...")
         output_df = _apply_default_alert_values(output_df)
+        output_df = _apply_alert_column_dtypes(output_df)
 
     logger.info(
         f"Pipeline complete: {len(output_df.columns)} columns processed for {len(output_df)} subjects"
@@ -1041,7 +1513,14 @@ def format_strata_abbreviations(
         return output_df
 
     if abbr_column not in output_df.columns or output_df[abbr_column].isna().all():
-        output_df[abbr_column] = output_df[strata_column].apply(get_strata_abbreviation)
+        # Strata have low cardinality, so abbreviate each distinct value once
+        strata = output_df[strata_column]
+        if isinstance(strata.dtype, pd.CategoricalDtype):
+            strata = strata.astype(object)
+        abbreviations = {
+            name: get_strata_abbreviation(name) for name in strata.dropna().unique()
+        }
+        output_df[abbr_column] = strata.map(abbreviations).fillna("")
         logger.info("Strata abbreviations applied")
     else:
         logger.info("Strata abbreviations already present, skipping")
@@ -1056,37 +1535,49 @@ def create_empty_dataframe_structure() -> pd.DataFrame:
     Returns:
         pd.DataFrame: Empty dataframe with essential columns
     """
-    return pd.DataFrame(
-        columns=[
-            "subject_id",
-            "combined_alert",
-            "percentile_category",
-            "overall_percentile",
-            "session_date",
-            "session",
-        ]
+    return _EMPTY_TABLE_PROTOTYPE.copy(deep=False)
+
+
+def _app_cache_manager(app_utils):
+    """CacheManager of app_utils, or None if app_utils has none"""
+    cache_manager = getattr(app_utils, "cache_manager", None)
+    return cache_manager if isinstance(cache_manager, CacheManager) else None
+
+
+def _alert_inputs_key(output_df: pd.DataFrame, unified_alerts: dict) -> tuple:
+    """Cache key for the alert columns: alerts dict identity plus a digest of the rows' subject and alert values"""
+    row_hashes = pd.util.hash_pandas_object(
+        output_df[["subject_id", *ALERT_RESULT_COLUMNS]], index=False
+    ).to_numpy()
+    return (
+        id(unified_alerts),
+        len(unified_alerts),
+        hashlib.md5(row_hashes.tobytes()).hexdigest(),
     )
 
 
 def _initialize_alert_columns(output_df: pd.DataFrame) -> pd.DataFrame:
     """Initialize alert columns with default values"""
-    for col in [
-        "percentile_category",
-        "threshold_alert",
-        "combined_alert",
-        "ns_reason",
-        "strata_abbr",
-        "total_sessions_alert",
-        "stage_sessions_alert",
-        "water_day_total_alert",
-    ]:
-        if col not in output_df.columns:
-            default_val = (
-                "NS"
-                if col in ["percentile_category", "combined_alert"]
-                else ("N" if col.endswith("_alert") else "")
-            )
-            output_df[col] = default_val
+    missing = {
+        col: default
+        for col, default in ALERT_COLUMN_DEFAULTS.items()
+        if col not in output_df.columns
+    }
+    if not missing:
+        return output_df
+    return output_df.assign(**missing)
+
+
+def _apply_alert_column_dtypes(output_df: pd.DataFrame) -> pd.DataFrame:
+    """Store alert columns as Categoricals when all their values are known categories"""
+    for col, dtype in ALERT_COLUMN_DTYPES.items():
+        values = output_df[col]
+        if values.dtype == dtype:
+            continue
+        if values.isin(dtype.categories).all():
+            output_df[col] = values.astype(dtype)
+        else:
+            logger.warning("Unexpected values in '%s', keeping it uncategorized", col)
     return output_df
 
 
@@ -1110,51 +1601,118 @@ def _ensure_pipeline_and_service_ready(app_utils) -> bool:
     return True
 
 
-def _apply_unified_alerts_to_output(
-    output_df: pd.DataFrame, unified_alerts: dict
-) -> pd.DataFrame:
-    """Apply unified alerts to output dataframe"""
-    for subject_id, alerts in unified_alerts.items():
-        mask = output_df["subject_id"] == subject_id
-        if not mask.any():
-            continue
+def _unified_alerts_frame(unified_alerts: dict, app_utils=None) -> pd.DataFrame:
+    """
+    Typed one-row-per-subject table of unified alerts, indexed by subject_id
 
-        # Add alert category
-        alert_category = alerts.get("alert_category", "NS")
-        output_df.loc[mask, "percentile_category"] = alert_category
+    The alert coordinator returns the same dict for a repeated subject
+    selection, so the table is cached by the coordinator alongside it.
 
-        # Add NS reason if applicable
-        if alert_category == "NS" and "ns_reason" in alerts:
-            output_df.loc[mask, "ns_reason"] = alerts["ns_reason"]
+    Parameters:
+        unified_alerts: dict - Unified alerts keyed by subject ID
+        app_utils: AppUtils instance whose alert coordinator caches the table
 
-        # Apply threshold alerts from unified alerts structure
-        threshold_data = alerts.get("threshold", {})
-        overall_threshold_alert = threshold_data.get("threshold_alert", "N")
+    Returns:
+        pd.DataFrame: Alert category, its code, NS reason and threshold flags
+    """
+    coordinator = getattr(app_utils, "alert_coordinator", None)
+    if isinstance(coordinator, AlertCoordinator):
+        return coordinator.get_unified_alerts_table(
+            unified_alerts, _build_unified_alerts_frame
+        )
+    return _build_unified_alerts_frame(unified_alerts)
 
-        if overall_threshold_alert == "T":
-            output_df.loc[mask, "threshold_alert"] = "T"
 
-        # Combine percentile and threshold alerts for display
-        current_threshold_alert = (
-            output_df.loc[mask, "threshold_alert"].iloc[0] if mask.any() else "N"
-        )
+def _build_unified_alerts_frame(unified_alerts: dict) -> pd.DataFrame:
+    """Build the typed unified alerts table for _unified_alerts_frame"""
+    categories = np.array(
+        [alerts.get("alert_category", "NS") for alerts in unified_alerts.values()],
+        dtype=object,
+    )
+    category_codes = pd.Categorical(categories, dtype=PERCENTILE_CATEGORY_DTYPE).codes
+    frame = pd.DataFrame(
+        {
+            "alert_category": pd.Series(categories, dtype=object),
+            "category_code": category_codes,
+            "ns_reason": pd.Series(
+                [alerts.get("ns_reason") for alerts in unified_alerts.values()],
+                dtype=object,
+            ),
+            # NS reasons are only written for NS subjects whose alerts carry one
+            "sets_ns_reason": np.array(
+                [
+                    code == PERCENTILE_CATEGORY_CODES["NS"] and "ns_reason" in alerts
+                    for code, alerts in zip(category_codes, unified_alerts.values())
+                ],
+                dtype=bool,
+            ),
+            "threshold_alert": np.array(
+                [
+                    alerts.get("threshold", {}).get("threshold_alert", "N") == "T"
+                    for alerts in unified_alerts.values()
+                ],
+                dtype=bool,
+            ),
+        }
+    )
+    frame.index = pd.Index(list(unified_alerts), name="subject_id")
+    return frame
 
-        if current_threshold_alert == "T":
-            if alert_category != "NS":
-                output_df.loc[mask, "combined_alert"] = f"{alert_category}, T"
-            else:
-                output_df.loc[mask, "combined_alert"] = "T"
-        else:
-            output_df.loc[mask, "combined_alert"] = alert_category
 
-    return output_df
+def _apply_unified_alerts_to_output(
+    output_df: pd.DataFrame, unified_alerts: dict, app_utils=None
+) -> pd.DataFrame:
+    """Apply unified alerts to output dataframe"""
+    if not unified_alerts or output_df.empty:
+        return output_df
+
+    # Hash-join the output rows onto the one-row-per-subject alerts table
+    alerts = _unified_alerts_frame(unified_alerts, app_utils)
+    positions = alerts.index.get_indexer(output_df["subject_id"])
+    matched = positions >= 0
+    if not matched.any():
+        return output_df
+    rows = positions[matched]
+
+    # Alert columns are edited as raw arrays and written back once each
+    columns = {
+        col: output_df[col].to_numpy(dtype=object, copy=True)
+        for col in ALERT_RESULT_COLUMNS
+    }
+
+    category = alerts["alert_category"].to_numpy()[rows]
+    columns["percentile_category"][matched] = category
+
+    # Add NS reason if applicable
+    ns_reason = matched.copy()
+    ns_reason[matched] = alerts["sets_ns_reason"].to_numpy()[rows]
+    columns["ns_reason"][ns_reason] = alerts["ns_reason"].to_numpy()[
+        positions[ns_reason]
+    ]
+
+    # Apply threshold alerts from unified alerts structure
+    threshold = matched.copy()
+    threshold[matched] = alerts["threshold_alert"].to_numpy()[rows]
+    columns["threshold_alert"][threshold] = "T"
+
+    # Combine percentile and threshold alerts for display by looking up each
+    # (category code, threshold) pair
+    current_threshold = columns["threshold_alert"][matched]
+    has_threshold = current_threshold == "T"
+    category_codes = alerts["category_code"].to_numpy()[rows]
+    combined = COMBINED_ALERT_LABELS[
+        COMBINED_ALERT_CODES[category_codes, has_threshold.astype(np.intp)]
+    ]
+    for i in np.flatnonzero(category_codes < 0):
+        combined[i] = f"{category[i]}, T" if has_threshold[i] else category[i]
+    columns["combined_alert"][matched] = combined
+
+    return output_df.assign(**columns)
 
 
 def _apply_default_alert_values(output_df: pd.DataFrame) -> pd.DataFrame:
     """Apply default alert values when alert processing fails"""
-    for subject_id in output_df["subject_id"].unique():
-        mask = output_df["subject_id"] == subject_id
-        output_df.loc[mask, "percentile_category"] = "NS"
-        output_df.loc[mask, "combined_alert"] = "NS"
-        output_df.loc[mask, "ns_reason"] = "Alert service unavailable"
+    output_df["percentile_category"] = "NS"
+    output_df["combined_alert"] = "NS"
+    output_df["ns_reason"] = "Alert service unavailable"
     return output_df
@@ -346,7 +346,9 @@ def update_table_data(
     print(f"Updating table with time window: {time_window_value} days")
 
     # Use UI-optimized table display data from the shared app_utils instance
-    formatted_df = pd.DataFrame(app_utils.get_table_display_data(use_cache=True))
+    formatted_df = pd.DataFrame(
+        app_utils.get_table_display_data(use_cache=True, as_frame=True)
+    )
 
     if formatted_df.empty:
         print(" No table display data found, falling back to formatted data cache")
@@ -8,7 +8,7 @@ for use across all callback modules in the modular Dash architecture.
 Usage:
     from callbacks.shared_callback_utils import (
         # Common imports
-        Input, Output, State, callback, ALL, ctx,
+        Input, Output, State, callback, ALL, ctx, no_update,
         html, dcc, dbc, pd, datetime, timedelta,
         go, json,
 
@@ -40,6 +40,7 @@ from dash import (
     ctx,
     dcc,
     html,
+    no_update,
 )
 
 from app_elements.app_content.app_dataframe.app_dataframe import AppDataFrame
@@ -403,6 +404,7 @@ __all__ = [
     "callback",
     "ALL",
     "ctx",
+    "no_update",
     "clientside_callback",
     "html",
     "dcc",
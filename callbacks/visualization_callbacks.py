@@ -4,7 +4,7 @@ Visualization Callbacks Module
 This module contains all plot and visualization-related callbacks:
 - Timeseries plot updates
 - Percentile timeseries plot updates
-- Heatmap visualization and colorscale controls
+- Heatmap visualization, highlight patching and colorscale controls
 
 Separated from main callbacks for better modularity and maintainability.
 """
@@ -17,6 +17,7 @@ from callbacks.shared_callback_utils import (
     app_utils,
     callback,
     extract_highlighted_session,
+    no_update,
     percentile_heatmap,
     subject_percentile_timeseries,
     subject_timeseries,
@@ -91,17 +92,22 @@ def update_percentile_timeseries_plot(
     Output("percentile-heatmap-container", "children"),
     [
         Input("selected-subject-store", "data"),
-        Input({"type": "session-card", "index": ALL}, "n_clicks"),
-        Input("session-scroll-state", "data"),
         Input("heatmap-colorscale-state", "data"),
     ],
-    [State({"type": "session-card", "index": ALL}, "id")],
+    [
+        State({"type": "session-card", "index": ALL}, "n_clicks"),
+        State("session-scroll-state", "data"),
+        State({"type": "session-card", "index": ALL}, "id"),
+    ],
 )
-def update_percentile_heatmap_with_highlighting(
-    selected_subject_data, n_clicks_list, scroll_state, colorscale_state, card_ids
+def update_percentile_heatmap(
+    selected_subject_data, colorscale_state, n_clicks_list, scroll_state, card_ids
 ):
     """
-    Update percentile heatmap with session highlighting and colorscale mode.
+    Rebuild percentile heatmap when the subject or colorscale mode changes.
+
+    Session highlight changes are handled by update_percentile_heatmap_highlighting,
+    which patches the existing figure instead of rebuilding it.
     """
     # Extract subject_id from the store data
     subject_id = (
@@ -129,6 +135,45 @@ def update_percentile_heatmap_with_highlighting(
     )
 
 
+@callback(
+    Output("percentile-heatmap", "figure"),
+    [
+        Input({"type": "session-card", "index": ALL}, "n_clicks"),
+        Input("session-scroll-state", "data"),
+    ],
+    [
+        State("selected-subject-store", "data"),
+        State("heatmap-colorscale-state", "data"),
+        State({"type": "session-card", "index": ALL}, "id"),
+    ],
+)
+def update_percentile_heatmap_highlighting(
+    n_clicks_list, scroll_state, selected_subject_data, colorscale_state, card_ids
+):
+    """
+    Move the heatmap session highlight with a partial figure update.
+    """
+    subject_id = (
+        selected_subject_data.get("subject_id") if selected_subject_data else None
+    )
+    colorscale_mode = (
+        colorscale_state.get("mode", "binned") if colorscale_state else "binned"
+    )
+
+    highlighted_session = extract_highlighted_session(
+        n_clicks_list, scroll_state, card_ids
+    )
+
+    patch = percentile_heatmap.build_highlight_patch(
+        subject_id=subject_id,
+        app_utils=app_utils,
+        highlighted_session=highlighted_session,
+        colorscale_mode=colorscale_mode,
+    )
+
+    return patch if patch is not None else no_update
+
+
 @callback(
     [
         Output("heatmap-colorscale-state", "data"),
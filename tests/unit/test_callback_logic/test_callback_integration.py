@@ -147,6 +147,24 @@ def test_callback_decorator_usage():
         except Exception as e:
             raise Exception(f"Failed to validate callback decorator in {module_name}: {e}")
 
+def test_heatmap_highlight_callback_skips_update_without_heatmap():
+    """Test the heatmap highlight callback sends no update when no heatmap is shown."""
+    from dash import no_update
+    from callbacks.visualization_callbacks import update_percentile_heatmap_highlighting
+
+    card_ids = [{'type': 'session-card', 'index': 'session-690494-9'}]
+
+    # No subject selected
+    assert update_percentile_heatmap_highlighting([1], None, None, None, card_ids) is no_update
+
+    # Subject selected but without time series data to draw
+    with patch('callbacks.visualization_callbacks.app_utils') as mock_app_utils:
+        mock_app_utils.get_time_series_data.return_value = {}
+        result = update_percentile_heatmap_highlighting(
+            [1], None, {'subject_id': '690494'}, None, card_ids
+        )
+    assert result is no_update
+
 if __name__ == "__main__":
     # Run tests individually for debugging
     test_callback_module_imports()
@@ -154,4 +172,5 @@ if __name__ == "__main__":
     test_callbacks_package_import()
     test_no_duplicate_callback_ids()
     test_callback_decorator_usage()
+    test_heatmap_highlight_callback_skips_update_without_heatmap()
     print("All integration tests passed") 
\ No newline at end of file
@@ -18,7 +18,13 @@ from datetime import datetime, timedelta
 # Core imports
 from app_utils.percentile_utils import PercentileCoordinator
 from app_utils.app_alerts.alert_coordinator import AlertCoordinator
+from app_utils.app_alerts.alert_service import (
+    NS_MISSING_FEATURE_REASONS,
+    NS_REQUIRED_FEATURES,
+    AlertService,
+)
 from app_utils.app_data_load import EnhancedDataLoader
+from app_utils.cache_utils import CacheManager
 from tests.fixtures.sample_data import get_realistic_session_data, get_simple_session_data
 
 
@@ -141,6 +147,59 @@ class TestAlertCoordinator:
         coordinator.cache_manager.has.assert_called_with('unified_alerts')
         assert result == cached_alerts
     
+    def test_clear_alert_cache_evicts_unified_alerts(self):
+        """Test clearing the alert cache evicts cached unified alerts"""
+        cache_manager = CacheManager()
+        coordinator = AlertCoordinator(cache_manager=cache_manager)
+        coordinator.alert_service = Mock()
+        coordinator.alert_service.get_unified_alerts.return_value = {
+            'sub1': {'alert_category': 'G'}
+        }
+        
+        coordinator.get_unified_alerts()
+        coordinator.get_unified_alerts(subject_ids=['sub1'])
+        assert cache_manager.has('unified_alerts')
+        
+        coordinator.clear_alert_cache()
+        
+        assert not cache_manager.has('unified_alerts')
+        coordinator.get_unified_alerts(subject_ids=['sub1'])
+        assert coordinator.alert_service.get_unified_alerts.call_count == 3
+
+    def test_quantile_alerts_cached_per_selection(self):
+        """Test repeated quantile alert selections reuse the cached result"""
+        coordinator = AlertCoordinator(cache_manager=CacheManager())
+        coordinator.alert_service = Mock()
+        coordinator.alert_service._quantile_alerts = {'sub1': {}, 'sub2': {}}
+        coordinator.alert_service.get_quantile_alerts.return_value = {'sub1': {}}
+
+        coordinator.get_quantile_alerts(subject_ids=['sub1', 'sub2'])
+        coordinator.get_quantile_alerts(subject_ids=['sub2', 'sub1'])
+        assert coordinator.alert_service.get_quantile_alerts.call_count == 1
+
+        # Recalculated alerts replace the service dict and bypass the cache
+        coordinator.alert_service._quantile_alerts = {'sub1': {}}
+        coordinator.get_quantile_alerts(subject_ids=['sub1', 'sub2'])
+        assert coordinator.alert_service.get_quantile_alerts.call_count == 2
+
+        coordinator.clear_alert_cache()
+        coordinator.get_quantile_alerts(subject_ids=['sub1', 'sub2'])
+        assert coordinator.alert_service.get_quantile_alerts.call_count == 3
+
+    def test_unified_alerts_table_cached_until_cleared(self):
+        """Test tables derived from unified alerts are rebuilt after clearing the cache"""
+        coordinator = AlertCoordinator(cache_manager=CacheManager())
+        alerts = {'sub1': {'alert_category': 'G'}}
+        build = Mock(side_effect=lambda unified_alerts: object())
+
+        table = coordinator.get_unified_alerts_table(alerts, build)
+        assert coordinator.get_unified_alerts_table(alerts, build) is table
+        assert build.call_count == 1
+
+        coordinator.clear_alert_cache()
+        assert coordinator.get_unified_alerts_table(alerts, build) is not table
+        assert build.call_count == 2
+
     def test_alert_summary_stats(self, coordinator):
         """Test alert summary statistics"""
         # Initialize service
@@ -174,6 +233,162 @@ class TestAlertCoordinator:
         assert len(result['errors']) == 0
 
 
+class TestAlertService:
+    """Tests for AlertService quantile alert caching"""
+
+    def test_targeted_quantile_alerts_only_score_new_subjects(self):
+        """Test a second targeted lookup only scores subjects not seen before"""
+        sessions = pd.DataFrame({
+            'subject_id': ['sub1', 'sub2', 'sub3'],
+            'session_overall_percentile': [10.0, 50.0, 90.0],
+            'strata': ['A', 'A', 'B'],
+        })
+        app_utils = Mock()
+        app_utils.get_session_overall_percentiles.side_effect = (
+            lambda subject_ids=None: sessions[sessions['subject_id'].isin(subject_ids)]
+        )
+        service = AlertService(app_utils=app_utils)
+
+        # 'sub4' has no sessions and must not be requested again
+        first = service.get_quantile_alerts(subject_ids=['sub1', 'sub4'])
+        assert list(first) == ['sub1']
+
+        second = service.get_quantile_alerts(subject_ids=['sub1', 'sub2', 'sub4'])
+        assert list(second) == ['sub1', 'sub2']
+        assert second['sub2']['alert_category'] == 'N'
+
+        requested = [
+            call.kwargs['subject_ids']
+            for call in app_utils.get_session_overall_percentiles.call_args_list
+        ]
+        assert requested == [['sub1', 'sub4'], ['sub2']]
+
+        service.get_quantile_alerts(subject_ids=['sub2', 'sub4'])
+        assert app_utils.get_session_overall_percentiles.call_count == 2
+
+
+    def test_quantile_alerts_keep_percentile_precision(self):
+        """Test packed quantile alerts keep the session percentiles unrounded"""
+        sessions = pd.DataFrame({
+            'subject_id': ['sub1'],
+            'session_overall_percentile': [73.456789],
+            'finished_trials_session_percentile': [12.345678],
+            'strata': ['A'],
+        })
+        app_utils = Mock()
+        app_utils.get_session_overall_percentiles.return_value = sessions
+        service = AlertService(app_utils=app_utils)
+
+        alerts = service.get_quantile_alerts()
+
+        assert alerts['sub1']['overall_percentile'] == 73.456789
+        assert alerts['sub1']['feature_percentiles']['finished_trials']['percentile'] == 12.345678
+        assert service.get_quantile_alerts_frame()['overall_percentile'].dtype == np.float64
+
+    def test_threshold_alerts_per_limit(self):
+        """Test total session, stage session and water limits and untracked stages"""
+        stages = {
+            'total': ['STAGE_4'] * 3,
+            'stage': ['STAGE_1'] * 6,
+            'water': ['STAGE_3'],
+            'untracked': ['STAGE_X'] * 15,
+            'clear': ['STAGE_2'] * 2,
+        }
+        sessions = pd.DataFrame({
+            'subject_id': [sid for sid, rows in stages.items() for _ in rows],
+            'current_stage_actual': [stage for rows in stages.values() for stage in rows],
+        })
+        most_recent = pd.DataFrame({
+            'subject_id': list(stages),
+            'current_stage_actual': ['STAGE_4', 'STAGE_1', 'STAGE_3', 'STAGE_X', 'STAGE_2'],
+            'session': [45, 12, 3, 10, 2],
+            'water_day_total': [1.0, 1.0, 4.0, 1.0, 1.0],
+        })
+        app_utils = Mock()
+        app_utils.get_session_data.return_value = sessions
+        service = AlertService(app_utils=app_utils)
+
+        counts = service._count_stage_sessions(
+            most_recent['subject_id'].tolist(), most_recent['current_stage_actual']
+        )
+        assert counts.tolist() == [3, 6, 1, 0, 2]
+
+        alerts = service._process_threshold_alerts(most_recent)
+
+        def flags(subject_id):
+            return {
+                name: alert['alert']
+                for name, alert in alerts[subject_id]['specific_alerts'].items()
+            }
+
+        assert alerts['total']['threshold_alert'] == 'T'
+        assert flags('total') == {'total_sessions': 'T', 'water_day_total': 'N', 'stage_sessions': 'N'}
+        assert alerts['total']['specific_alerts']['total_sessions']['description'] == 'Total sessions: 45 > 40'
+
+        assert alerts['stage']['threshold_alert'] == 'T'
+        assert alerts['stage']['specific_alerts']['stage_sessions'] == {
+            'value': 6,
+            'threshold': 5,
+            'alert': 'T',
+            'description': 'STAGE_1: 6 > 5',
+            'stage': 'STAGE_1',
+        }
+
+        assert alerts['water']['threshold_alert'] == 'T'
+        assert flags('water') == {'total_sessions': 'N', 'water_day_total': 'T', 'stage_sessions': 'N'}
+
+        # Stages outside STAGE_SESSION_THRESHOLDS get no stage alert at all
+        assert alerts['untracked']['threshold_alert'] == 'N'
+        assert 'stage_sessions' not in alerts['untracked']['specific_alerts']
+
+        assert alerts['clear']['threshold_alert'] == 'N'
+        assert set(flags('clear').values()) == {'N'}
+
+    def test_ns_reasons_for_each_branch(self):
+        """Test NS reasons for every missing feature combination and the other branches"""
+        complete = {'total_trials': 500.0, 'finished_trials': 400.0, 'ignore_rate': 0.1}
+        rows = []
+
+        def add_subject(subject_id, latest, sessions=2):
+            # Earlier sessions are complete; only the most recent one is classified
+            for day in range(sessions - 1):
+                rows.append({'subject_id': subject_id, 'session_date': datetime(2024, 1, day + 1), **complete})
+            rows.append({'subject_id': subject_id, 'session_date': datetime(2024, 2, 1), **latest})
+
+        for bits in range(1, 1 << len(NS_REQUIRED_FEATURES)):
+            missing = {
+                feature: np.nan
+                for bit, feature in enumerate(NS_REQUIRED_FEATURES)
+                if bits & (1 << bit)
+            }
+            add_subject(f'missing_{bits}', {**complete, **missing})
+        add_subject('zero_finished', {**complete, 'finished_trials': 0.0})
+        add_subject('too_few', complete, sessions=1)
+        add_subject('complete', complete)
+
+        app_utils = Mock()
+        app_utils.get_session_data.return_value = pd.DataFrame(rows)
+        service = AlertService(app_utils=app_utils)
+        service.config['min_sessions_for_scoring'] = 2
+
+        reasons = service._precompute_ns_reasons(
+            [f'missing_{bits}' for bits in range(1, 1 << len(NS_REQUIRED_FEATURES))]
+            + ['zero_finished', 'too_few', 'complete', 'no_sessions']
+        )
+
+        finished_bit = 1 << NS_REQUIRED_FEATURES.index('finished_trials')
+        for bits in range(1, 1 << len(NS_REQUIRED_FEATURES)):
+            # A missing finished_trials value reads as no finished trials first
+            expected = 'No finished trials' if bits & finished_bit else NS_MISSING_FEATURE_REASONS[bits]
+            assert reasons[f'missing_{bits}'] == expected
+        assert reasons['missing_1'] == 'Missing features: total_trials'
+        assert reasons['missing_5'] == 'Missing features: total_trials, ignore_rate'
+        assert reasons['zero_finished'] == 'No finished trials'
+        assert reasons['too_few'] == 'Insufficient sessions: 1 < 2'
+        assert reasons['complete'] == 'Scoring criteria not met'
+        assert reasons['no_sessions'] == 'Subject not found'
+        assert service._classify_ns_reasons(pd.DataFrame(rows).iloc[:0]) == {}
+
 class TestEnhancedDataLoader:
     """Simplified tests for EnhancedDataLoader focusing on core functionality"""
     
@@ -316,10 +316,12 @@ class TestHeatmapDataProcessing:
         assert feature_names == expected_names
         
         # Verify data integrity
-        assert heatmap_data[0] == [50.0, 60.0, 70.0]  # finished_trials
+        assert heatmap_data.dtype == np.float32
+        assert heatmap_data.flags['C_CONTIGUOUS']
+        assert heatmap_data[0].tolist() == [50.0, 60.0, 70.0]  # finished_trials
         assert heatmap_data[1][0] == 30.0 and np.isnan(heatmap_data[1][1]) and heatmap_data[1][2] == 40.0  # ignore_rate with NaN
-        assert heatmap_data[2] == [80.0, 85.0, 90.0]  # foraging_performance
-        assert heatmap_data[3] == [55.0, 62.5, 67.5]  # overall
+        assert heatmap_data[2].tolist() == [80.0, 85.0, 90.0]  # foraging_performance
+        assert heatmap_data[3].tolist() == [55.0, 62.5, 67.5]  # overall
     
     def test_process_heatmap_matrix_data_missing_features(self):
         """Test heatmap processing when some features are missing from data"""
@@ -383,6 +385,23 @@ class TestHeatmapDataProcessing:
         assert len(feature_names) == 1
         assert feature_names == ['Finished Trials']
     
+    def test_process_heatmap_matrix_data_tuple_config(self):
+        """Test heatmap processing with features config given as (feature, flag) pairs"""
+        features_config = (('finished_trials', False), ('ignore_rate', True))
+
+        time_series_data = {
+            'finished_trials_percentiles': [50.0, 60.0, 70.0],
+            'ignore_rate_percentiles': [30.0, -1, 40.0],
+        }
+
+        heatmap_data, feature_names = StatisticalUtils.process_heatmap_matrix_data(
+            time_series_data, features_config
+        )
+
+        assert feature_names == ['Finished Trials', 'Ignore Rate']
+        assert heatmap_data[0].tolist() == [50.0, 60.0, 70.0]
+        assert np.isnan(heatmap_data[1][1])
+
     def test_format_feature_display_name(self):
         """Test feature name formatting for display"""
         test_cases = [
@@ -429,4 +448,64 @@ class TestHeatmapDataProcessing:
         # Large session numbers
         sessions = [100, 200, 300]
         result = StatisticalUtils.calculate_session_highlighting_coordinates(sessions, 200)
-        assert result == 1
\ No newline at end of file
+        assert result == 1
+
+class TestTraceDownsampling:
+    """Test LTTB thinning of long percentile traces"""
+
+    def setup_method(self):
+        """Create a long noisy percentile series with a single spike"""
+        rng = np.random.default_rng(42)
+        self.max_points = 500
+        self.num_points = 4 * self.max_points
+        self.sessions = np.arange(1, self.num_points + 1, dtype=float)
+        self.percentiles = 50 + 20 * np.sin(self.sessions / 50) + rng.normal(0, 2, self.num_points)
+        self.spike = 1234
+        self.percentiles[self.spike] = 100.0
+
+    def test_lttb_indices(self):
+        """Test LTTB keeps the end points and a sorted subset of the requested size"""
+        indices = StatisticalUtils.lttb_indices(self.sessions, self.percentiles, self.max_points)
+
+        assert len(indices) == self.max_points
+        assert indices[0] == 0
+        assert indices[-1] == self.num_points - 1
+        assert np.all(np.diff(indices) > 0)
+        assert self.spike in indices
+
+        # Short series are returned whole
+        np.testing.assert_array_equal(
+            StatisticalUtils.lttb_indices(self.sessions[:10], self.percentiles[:10], 50), np.arange(10)
+        )
+
+    def test_downsample_trace_data_keeps_ci_aligned(self):
+        """Test thinned traces keep their CI bounds on the same sessions"""
+        trace_data = {
+            'sessions': self.sessions,
+            'percentiles': self.percentiles,
+            'ci_lower': self.percentiles - 5,
+            'ci_upper': self.percentiles + 5,
+            'has_ci': True,
+        }
+
+        thinned = StatisticalUtils.downsample_trace_data(trace_data, self.max_points)
+
+        assert len(thinned['sessions']) <= self.max_points
+        assert thinned['sessions'][0] == self.sessions[0]
+        assert thinned['sessions'][-1] == self.sessions[-1]
+        assert np.all(np.diff(thinned['sessions']) > 0)
+        for key in ('percentiles', 'ci_lower', 'ci_upper'):
+            assert len(thinned[key]) == len(thinned['sessions'])
+        np.testing.assert_array_equal(thinned['percentiles'], self.percentiles[thinned['sessions'].astype(int) - 1])
+        np.testing.assert_allclose(thinned['ci_lower'], thinned['percentiles'] - 5)
+        np.testing.assert_allclose(thinned['ci_upper'], thinned['percentiles'] + 5)
+
+        # Traces already within the limit are passed through untouched
+        short = {
+            'sessions': self.sessions[:10],
+            'percentiles': self.percentiles[:10],
+            'ci_lower': np.empty(0),
+            'ci_upper': np.empty(0),
+            'has_ci': False,
+        }
+        assert StatisticalUtils.downsample_trace_data(short, self.max_points) is short
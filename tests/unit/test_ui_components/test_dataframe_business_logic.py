@@ -23,11 +23,114 @@ from app_utils.ui_utils import (
     get_optimized_table_data,
     process_unified_alerts_integration
 )
+from app_utils.app_alerts.alert_coordinator import AlertCoordinator
+from app_utils.cache_utils import CacheManager
+from app_utils.app_analysis.threshold_analyzer import ThresholdAnalyzer
+from app_utils.ui_utils import (
+    COMBINED_THRESHOLD_CONFIG,
+    STAGE_SESSION_THRESHOLDS,
+    UIDataManager
+)
 
 # Import realistic fixtures
 from tests.fixtures.sample_data import get_realistic_session_data, get_simple_session_data
 
 
+FEATURES = ['finished_trials', 'ignore_rate', 'total_trials', 'foraging_performance', 'abs(bias_naive)']
+
+# Table record columns, in order, produced by the original row-by-row table cache
+BASELINE_TABLE_COLUMNS = [
+    'subject_id', 'session_date', 'session', 'strata', 'strata_abbr', 'overall_percentile',
+    'overall_category', 'percentile_category', 'combined_alert', 'session_overall_rolling_avg',
+    'PI', 'trainer', 'rig', 'current_stage_actual', 'curriculum_name', 'water_day_total',
+    'base_weight', 'target_weight', 'weight_after', 'total_trials', 'finished_trials',
+    'ignore_rate', 'foraging_performance', 'abs(bias_naive)', 'finished_rate',
+    'water_in_session_foraging', 'water_in_session_manual', 'water_in_session_total',
+    'water_after_session', 'target_weight_ratio', 'weight_after_ratio',
+    'reward_volume_left_mean', 'reward_volume_right_mean', 'reaction_time_median',
+    'reaction_time_mean', 'early_lick_rate', 'invalid_lick_ratio',
+    'double_dipping_rate_finished_trials', 'double_dipping_rate_finished_reward_trials',
+    'double_dipping_rate_finished_noreward_trials', 'lick_consistency_mean_finished_trials',
+    'lick_consistency_mean_finished_reward_trials', 'lick_consistency_mean_finished_noreward_trials',
+    'avg_trial_length_in_seconds', 'total_trials_with_autowater', 'finished_trials_with_autowater',
+    'finished_rate_with_autowater', 'ignore_rate_with_autowater', 'autowater_collected',
+    'autowater_ignored', 'water_day_total_last_session', 'water_after_session_last_session',
+    'threshold_alert', 'total_sessions_alert', 'stage_sessions_alert', 'water_day_total_alert',
+    'ns_reason', 'outlier_weight', 'is_outlier',
+    *[
+        f'{feature}_{suffix}'
+        for feature in FEATURES
+        for suffix in [
+            'session_percentile', 'category', 'processed_rolling_avg',
+            'session_percentile_ci_lower', 'session_percentile_ci_upper', 'certainty',
+        ]
+    ],
+    'session_overall_percentile_ci_lower', 'session_overall_percentile_ci_upper',
+    'session_overall_percentile_certainty',
+]
+
+# Original table cache values per subject for _table_session_data:
+# (strata_abbr, percentile_category, combined_alert, threshold_alert,
+#  total_sessions_alert, stage_sessions_alert, water_day_total_alert)
+BASELINE_ALERT_VALUES = {
+    '690486': ('UWBA1', 'NS', 'NS', 'N', 'N', 'N', 'N'),
+    '690494': ('UWBB1', 'NS', 'NS', 'T', 'N', 'T | STAGE_2 | 6', 'N'),
+    '697929': ('CBA1', 'NS', 'NS', 'T', 'T | 42', 'T | GRADUATED | 42', 'N'),
+    '700708': ('CBA2', 'B', 'B', 'N', 'N', 'N', 'N'),
+    '702200': ('CBA1', 'NS', 'NS', 'T', 'N', 'N', 'T | 4.2'),
+}
+
+# Original CI certainties per subject, in FEATURES order then the overall percentile
+BASELINE_CERTAINTY_VALUES = {
+    '690486': ('intermediate', 'certain', 'certain', 'uncertain', 'certain', 'unknown'),
+    '690494': ('uncertain', 'intermediate', 'certain', 'certain', 'uncertain', 'unknown'),
+    '697929': ('certain', 'intermediate', 'certain', 'uncertain', 'uncertain', 'unknown'),
+    '700708': ('uncertain', 'uncertain', 'uncertain', 'uncertain', 'certain', 'uncertain'),
+    '702200': ('certain', 'uncertain', 'uncertain', 'intermediate', 'certain', 'unknown'),
+}
+
+
+def _table_session_data():
+    """Fixture sessions with CI bounds and enough history to cross each threshold"""
+    data = get_realistic_session_data()
+
+    # CI widths spread over the certainty tiers
+    widths = np.array([5, 10, 20, 30, 40, 2, 25, 15, 12, 35], dtype=float)
+    for shift, feature in enumerate(FEATURES):
+        percentile = data[f'{feature}_session_percentile']
+        data[f'{feature}_session_percentile_ci_lower'] = percentile - np.roll(widths, shift) / 2
+        data[f'{feature}_session_percentile_ci_upper'] = percentile + np.roll(widths, shift) / 2
+    data['session_overall_percentile_ci_lower'] = data['session_overall_percentile'] - widths
+    data['session_overall_percentile_ci_upper'] = data['session_overall_percentile'] + widths
+
+    # Over the water limit on the latest session
+    data.loc[5, 'water_day_total'] = 4.2
+    # A latest stage without a session threshold
+    data.loc[2, 'current_stage_actual'] = 'STAGE_UNKNOWN'
+
+    def history(row, count, **values):
+        """Earlier copies of one session, 30 days apart"""
+        rows = pd.DataFrame([data.loc[row]] * count).reset_index(drop=True)
+        days_before = pd.to_timedelta(30 * np.arange(1, count + 1), unit='D')
+        rows['session_date'] = data.loc[row, 'session_date'] - days_before
+        for col, value in values.items():
+            rows[col] = value
+        return rows
+
+    return pd.concat(
+        [
+            data,
+            # Over the total session limit (and the GRADUATED stage limit)
+            history(7, 40),
+            # Over the STAGE_2 limit only
+            history(3, 5, current_stage_actual='STAGE_2'),
+            # Many sessions in a stage without a threshold
+            history(2, 25),
+        ],
+        ignore_index=True,
+    )
+
+
 class TestDataFrameBusinessLogic(unittest.TestCase):
     """Test the extracted dataframe business logic functions"""
 
@@ -103,15 +206,15 @@ class TestDataFrameBusinessLogic(unittest.TestCase):
         # Mock app_utils with UI cache data using realistic structure
         mock_app_utils = Mock()
         realistic_subjects = self.sample_session_data['subject_id'].unique()[:2].tolist()
-        mock_app_utils.get_table_display_data.return_value = [
+        mock_app_utils.get_table_display_data.return_value = pd.DataFrame([
             {'subject_id': realistic_subjects[0], 'session': 1},
             {'subject_id': realistic_subjects[1], 'session': 2}
-        ]
+        ])
         
         result = get_optimized_table_data(mock_app_utils, use_cache=True)
         
         # Verify UI cache was used
-        mock_app_utils.get_table_display_data.assert_called_once_with(use_cache=True)
+        mock_app_utils.get_table_display_data.assert_called_once_with(use_cache=True, as_frame=True)
         self.assertEqual(len(result), 2)
         self.assertEqual(result['subject_id'].tolist(), realistic_subjects)
 
@@ -264,6 +367,39 @@ class TestDataFrameBusinessLogic(unittest.TestCase):
         self.assertIn('T', subject_0_combined)  # Should include threshold alert
 
 
+    def test_process_unified_alerts_integration_cache_misses_on_changed_inputs(self):
+        """Test cached alert columns are not reused once the alert inputs change"""
+        cache_manager = CacheManager()
+        mock_app_utils = Mock()
+        mock_app_utils.cache_manager = cache_manager
+        test_df = self.sample_session_data.copy()[:1]
+        test_df['threshold_alert'] = 'N'
+        subject_id = test_df['subject_id'].iloc[0]
+        mock_app_utils.get_unified_alerts.return_value = {
+            subject_id: {'alert_category': 'G', 'threshold': {'threshold_alert': 'N'}}
+        }
+
+        result = process_unified_alerts_integration(test_df, mock_app_utils)
+        self.assertEqual(result['combined_alert'].iloc[0], 'G')
+        self.assertTrue(cache_manager.has('unified_alert_columns'))
+
+        # A table threshold alert changes the inputs, so the cache must miss
+        changed_df = test_df.copy()
+        changed_df['threshold_alert'] = 'T'
+        result = process_unified_alerts_integration(changed_df, mock_app_utils)
+        self.assertEqual(result['combined_alert'].iloc[0], 'G, T')
+
+        # New alerts for the same table miss the cache as well
+        mock_app_utils.get_unified_alerts.return_value = {
+            subject_id: {'alert_category': 'B', 'threshold': {'threshold_alert': 'N'}}
+        }
+        result = process_unified_alerts_integration(test_df, mock_app_utils)
+        self.assertEqual(result['combined_alert'].iloc[0], 'B')
+
+        AlertCoordinator(cache_manager=cache_manager).clear_alert_cache()
+        self.assertFalse(cache_manager.has('unified_alert_columns'))
+
+
 class TestDataFrameBusinessLogicIntegration(unittest.TestCase):
     """Integration tests for dataframe business logic using realistic fixtures"""
 
@@ -293,5 +429,70 @@ class TestDataFrameBusinessLogicIntegration(unittest.TestCase):
         self.assertEqual(set(result['subject_id']), set(test_df['subject_id']))
 
 
+class TestTableDisplayCache(unittest.TestCase):
+    """Tests for the table display cache built by UIDataManager"""
+
+    def setUp(self):
+        """Build the table records from the threshold-crossing fixture sessions"""
+        manager = UIDataManager()
+        ui_structures = manager.create_ui_optimized_structures(_table_session_data())
+        self.records = manager.get_table_display_data(ui_structures)
+
+    def test_table_records_match_baseline(self):
+        """Test table records keep the original columns and per-subject values"""
+        self.assertEqual(
+            [record['subject_id'] for record in self.records], sorted(BASELINE_ALERT_VALUES)
+        )
+        for record in self.records:
+            self.assertEqual(list(record), BASELINE_TABLE_COLUMNS)
+
+            subject_id = record['subject_id']
+            alerts = tuple(
+                record[col] for col in [
+                    'strata_abbr', 'percentile_category', 'combined_alert', 'threshold_alert',
+                    'total_sessions_alert', 'stage_sessions_alert', 'water_day_total_alert',
+                ]
+            )
+            self.assertEqual(alerts, BASELINE_ALERT_VALUES[subject_id], subject_id)
+
+            certainties = tuple(
+                record[f'{feature}_certainty'] for feature in FEATURES
+            ) + (record['session_overall_percentile_certainty'],)
+            self.assertEqual(certainties, BASELINE_CERTAINTY_VALUES[subject_id], subject_id)
+
+    def test_threshold_alerts_match_per_subject_loop(self):
+        """Test array threshold alerts match checking each subject's sessions in turn"""
+        manager = UIDataManager()
+        sorted_sessions, subject_offsets = manager._index_subject_rows(_table_session_data())
+        most_recent = sorted_sessions.iloc[
+            [stop - 1 for _, stop in subject_offsets.values()]
+        ].reset_index(drop=True)
+
+        result = manager._calculate_threshold_alerts(most_recent, sorted_sessions, subject_offsets)
+
+        # Original loop: one ThresholdAnalyzer check per subject and limit
+        analyzer = ThresholdAnalyzer(COMBINED_THRESHOLD_CONFIG)
+        expected = ([], [], [], [])
+        for position, (start, stop) in enumerate(subject_offsets.values()):
+            subject_sessions = sorted_sessions.iloc[start:stop]
+            row = most_recent.iloc[position]
+            checks = [analyzer.check_total_sessions(subject_sessions)]
+            if row['current_stage_actual'] in STAGE_SESSION_THRESHOLDS:
+                checks.append(
+                    analyzer.check_stage_sessions(subject_sessions, row['current_stage_actual'])
+                )
+            else:
+                checks.append({'alert': 'N', 'display_format': 'N'})
+            checks.append(analyzer.check_water_day_total(row['water_day_total']))
+            for alerts, check in zip(expected, checks):
+                alerts.append(check['display_format'])
+            expected[3].append('T' if any(check['alert'] == 'T' for check in checks) else 'N')
+
+        self.assertEqual(tuple(result), expected)
+        # The untracked stage has enough sessions to alert if it were not masked
+        untracked = list(subject_offsets).index('690486')
+        self.assertEqual(result[1][untracked], 'N')
+        self.assertEqual(result[3].count('T'), 3)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
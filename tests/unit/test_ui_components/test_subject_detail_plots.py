@@ -0,0 +1,105 @@
+"""
+Unit tests for subject detail plot components
+
+These tests verify the session highlight handling of the percentile heatmap
+using time series built from the realistic fixtures in sample_data.py.
+"""
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Ensure we can import from the project
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from app_utils.ui_utils import UIDataManager
+
+# Import realistic fixtures
+from tests.fixtures.sample_data import get_realistic_session_data
+
+
+class TestPercentileHeatmapHighlight(unittest.TestCase):
+    """Test the reserved highlight shape and its partial figure updates"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Importing app_elements builds the shared AppUtils, so serve the
+        # fixture sessions in place of the S3 session table while it loads
+        with patch(
+            'app_utils.app_data_load.data_loader.get_session_table',
+            return_value=get_realistic_session_data()
+        ):
+            from app_elements.app_subject_detail import app_subject_percentile_heatmap
+        cls.heatmap_module = app_subject_percentile_heatmap
+
+    def setUp(self):
+        """Serve the time series of one fixture subject through a mock app_utils"""
+        ui_structures = UIDataManager().create_ui_optimized_structures(get_realistic_session_data())
+        self.subject_id = '700708'
+        self.time_series = ui_structures['time_series_data'][self.subject_id]
+        self.app_utils = Mock()
+        self.app_utils.get_time_series_data.return_value = self.time_series
+        self.heatmap = self.heatmap_module.AppSubjectPercentileHeatmap()
+
+    def test_base_figure_reserves_highlight_shape(self):
+        """Test the first layout shape of the base figure is the hidden highlight rect"""
+        self.assertEqual(self.heatmap_module.HIGHLIGHT_SHAPE_SLOT, 0)
+        base_figure = self.heatmap._get_base_figure(self.subject_id, self.time_series, 'binned')
+
+        highlight = base_figure['layout']['shapes'][0]
+        self.assertEqual(highlight['type'], 'rect')
+        self.assertFalse(highlight['visible'])
+
+        # Highlighting a session moves that shape without touching the cached figure
+        figure = self.heatmap.build(
+            subject_id=self.subject_id, app_utils=self.app_utils, highlighted_session=62
+        ).figure
+        self.assertEqual(figure['layout']['shapes'][0]['x0'], 0.6)
+        self.assertTrue(figure['layout']['shapes'][0]['visible'])
+        self.assertFalse(base_figure['layout']['shapes'][0]['visible'])
+
+    def test_ui_revision_is_per_subject(self):
+        """Test zoom/pan state survives re-renders of a subject but not a subject change"""
+        binned = self.heatmap._get_base_figure(self.subject_id, self.time_series, 'binned')
+        continuous = self.heatmap._get_base_figure(self.subject_id, self.time_series, 'continuous')
+        self.assertEqual(binned['layout']['uirevision'], continuous['layout']['uirevision'])
+
+        other = self.heatmap._get_base_figure('690494', self.time_series, 'binned')
+        self.assertNotEqual(other['layout']['uirevision'], binned['layout']['uirevision'])
+
+    def test_highlight_patch_targets_highlight_slot(self):
+        """Test highlight patches only assign properties of the reserved shape"""
+        highlight_patch = self.heatmap.build_highlight_patch(
+            subject_id=self.subject_id, app_utils=self.app_utils, highlighted_session=62
+        )
+        operations = highlight_patch.to_plotly_json()['operations']
+        self.assertEqual(
+            {tuple(op['location']): op['params']['value'] for op in operations},
+            {
+                ('layout', 'shapes', self.heatmap_module.HIGHLIGHT_SHAPE_SLOT, 'x0'): 0.6,
+                ('layout', 'shapes', self.heatmap_module.HIGHLIGHT_SHAPE_SLOT, 'x1'): 1.4,
+                ('layout', 'shapes', self.heatmap_module.HIGHLIGHT_SHAPE_SLOT, 'visible'): True,
+            },
+        )
+
+        # Clearing the highlight hides the shape again
+        highlight_patch = self.heatmap.build_highlight_patch(
+            subject_id=self.subject_id, app_utils=self.app_utils, highlighted_session=None
+        )
+        operations = highlight_patch.to_plotly_json()['operations']
+        self.assertEqual(len(operations), 1)
+        self.assertEqual(operations[0]['location'], ['layout', 'shapes', self.heatmap_module.HIGHLIGHT_SHAPE_SLOT, 'visible'])
+        self.assertFalse(operations[0]['params']['value'])
+
+    def test_highlight_patch_without_heatmap(self):
+        """Test no patch is built when no subject heatmap is displayed"""
+        self.assertIsNone(self.heatmap.build_highlight_patch(subject_id=None, app_utils=self.app_utils))
+
+        self.app_utils.get_time_series_data.return_value = {}
+        self.assertIsNone(
+            self.heatmap.build_highlight_patch(subject_id=self.subject_id, app_utils=self.app_utils)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()